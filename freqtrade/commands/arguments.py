@@ -45,6 +45,7 @@ ARGS_BACKTEST = ARGS_COMMON_OPTIMIZE + [
     "exportfilename",
     "backtest_breakdown",
     "backtest_cache",
+    "backtest_engine",
     "freqai_backtest_live_models",
 ]
 
@@ -55,6 +56,7 @@ ARGS_HYPEROPT = ARGS_COMMON_OPTIMIZE + [
     "enable_protections",
     "dry_run_wallet",
     "timeframe_detail",
+    "backtest_engine",
     "epochs",
     "spaces",
     "print_all",
@@ -67,6 +69,7 @@ ARGS_HYPEROPT = ARGS_COMMON_OPTIMIZE + [
     "disableparamexport",
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
+    "hyperopt_async",
 ]
 
 ARGS_EDGE = ARGS_COMMON_OPTIMIZE + ["stoploss_range"]
@@ -228,6 +228,13 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        "--backtest-engine",
+        help="Select the backtest engine (default: `default`). "
+        "`columnar` keeps candles as NumPy arrays and only processes pairs with "
+        "an open trade or an entry signal.",
+        choices=constants.BACKTEST_ENGINES,
+    ),
     # Edge
     "stoploss_range": Arg(
         "--stoplosses",
@@ -278,6 +285,13 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "hyperopt_async": Arg(
+        "--async-epochs",
+        help="Start a new epoch as soon as a worker is free, instead of waiting for "
+        "all epochs of a batch to complete.",
+        action="store_true",
+        default=False,
+    ),
     "print_all": Arg(
         "--print-all",
         help="Print all results, not only the best ones.",
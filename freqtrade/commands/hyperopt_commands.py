@@ -31,7 +31,7 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
     )
 
     # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config, summary=True)
 
     if not export_csv:
         try:
@@ -49,11 +49,13 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
 
     if epochs and not no_details:
         sorted_epochs = sorted(epochs, key=itemgetter("loss"))
-        results = sorted_epochs[0]
+        results = HyperoptTools.load_epochs(results_file, sorted_epochs[:1])[0]
         HyperoptTools.show_epoch_details(results, total_epochs, print_json, no_header)
 
     if epochs and export_csv:
-        HyperoptTools.export_csv_file(config, epochs, export_csv)
+        HyperoptTools.export_csv_file(
+            config, HyperoptTools.load_epochs(results_file, epochs), export_csv
+        )
 
 
 def start_hyperopt_show(args: dict[str, Any]) -> None:
@@ -76,7 +78,7 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
     n = config.get("hyperopt_show_index", -1)
 
     # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config, summary=True)
 
     filtered_epochs = len(epochs)
 
@@ -94,7 +96,7 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
         n -= 1
 
     if epochs:
-        val = epochs[n]
+        val = HyperoptTools.load_epochs(results_file, [epochs[n]])[0]
 
         metrics = val["results_metrics"]
         if "strategy_name" in metrics:
@@ -4,6 +4,7 @@ from freqtrade.constants import (
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
     MARGIN_MODES,
@@ -99,6 +100,12 @@ CONF_SCHEMA = {
             "description": "Process only new candles.",
             "type": "boolean",
         },
+        "analyze_workers": {
+            "description": "Number of pairs to analyze concurrently in dry/live mode.",
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "minimal_roi": {
             "description": f"Minimum return on investment. {__IN_STRATEGY}",
             "type": "object",
@@ -212,6 +219,12 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_engine": {
+            "description": "Engine used for backtesting and hyperopt.",
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+            "default": "default",
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -690,6 +703,14 @@ CONF_SCHEMA = {
                     "description": "Minimum loop duration for one bot iteration in seconds.",
                     "type": "integer",
                 },
+                "process_on_candle_close": {
+                    "description": (
+                        "Start the next bot iteration as soon as candles close "
+                        "(requires exchange websockets)."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
                 "interval": {
                     "description": "Interval time in seconds.",
                     "type": "integer",
@@ -706,12 +727,46 @@ CONF_SCHEMA = {
             "enum": AVAILABLE_DATAHANDLERS,
             "default": "feather",
         },
+        "dataformat_ohlcv_partitioned": {
+            "description": (
+                "Store downloaded OHLCV data as monthly partitions, "
+                "so updates only rewrite the latest month (feather and parquet only)."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "dataformat_trades": {
             "description": "Data format for trade data.",
             "type": "string",
             "enum": AVAILABLE_DATAHANDLERS,
             "default": "feather",
         },
+        "dataformat_trades_partitioned": {
+            "description": (
+                "Store downloaded trades as daily partitions, "
+                "so updates only rewrite the latest day (feather and parquet only)."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "download_workers": {
+            "description": (
+                "Number of pair / timeframe combinations to download concurrently "
+                "with download-data."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
+        "dataload_workers": {
+            "description": (
+                "Number of pairs to load concurrently for backtesting and hyperopt "
+                "(feather and parquet data only)."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "position_adjustment_enable": {
             "description": f"Enable position adjustment. {__IN_STRATEGY}",
             "type": "boolean",
@@ -946,6 +1001,12 @@ CONF_SCHEMA = {
                     "maximum": 20,
                     "default": 8,
                 },
+                "message_encoding": {
+                    "description": "Encoding of dataframes sent by the producer.",
+                    "type": "string",
+                    "enum": ["arrow", "json"],
+                    "default": "arrow",
+                },
             },
             "required": ["producers"],
         },
@@ -992,6 +1053,15 @@ CONF_SCHEMA = {
                     "type": "number",
                     "default": 7,
                 },
+                "backtest_training_workers": {
+                    "description": (
+                        "Number of processes used to train the backtest windows of a pair "
+                        "in parallel."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1,
+                },
                 "identifier": {
                     "description": (
                         "A unique ID for the current model. "
@@ -299,6 +299,7 @@ class Configuration:
             ("export", "Parameter --export detected: {} ..."),
             ("backtest_breakdown", "Parameter --breakdown detected ..."),
             ("backtest_cache", "Parameter --cache={} detected ..."),
+            ("backtest_engine", "Parameter --backtest-engine={} detected ..."),
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("freqai_backtest_live_models", "Parameter --freqai-backtest-live-models detected ..."),
         ]
@@ -322,6 +323,7 @@ class Configuration:
             ("epochs", "Parameter --epochs detected ... Will run Hyperopt with for {} epochs ..."),
             ("spaces", "Parameter -s/--spaces detected: {}"),
             ("analyze_per_epoch", "Parameter --analyze-per-epoch detected."),
+            ("hyperopt_async", "Parameter --async-epochs detected."),
             ("print_all", "Parameter --print-all detected ..."),
         ]
         self._args_to_config_loop(config, configurations)
@@ -4,7 +4,6 @@ Functions to convert orderflow data from public_trades
 
 import logging
 import time
-from datetime import datetime
 
 import numpy as np
 import pandas as pd
@@ -29,6 +28,16 @@ ORDERFLOW_ADDED_COLUMNS = [
     "total_trades",
 ]
 
+ORDERFLOW_COLUMNS = [
+    "bid",
+    "ask",
+    "delta",
+    "bid_amount",
+    "ask_amount",
+    "total_volume",
+    "total_trades",
+]
+
 
 def _init_dataframe_with_trades_columns(dataframe: pd.DataFrame):
     """
@@ -90,6 +99,127 @@ def _calculate_ohlcv_candle_start_and_end(df: pd.DataFrame, timeframe: str):
         df.drop(columns=["datetime"], inplace=True)
 
 
+def _trades_to_levels(trades: pd.DataFrame, candles: np.ndarray, scale: float) -> pd.DataFrame:
+    """
+    Prepares trades of all candles for binning
+    :param trades: trades dataframe
+    :param candles: candle (row position in the ohlcv dataframe) of each trade
+    :param scale: scale aka bin size e.g. 0.5
+    :return: dataframe with one row per trade, bid / ask amounts and the price level
+    """
+    # only match the few distinct sides instead of every trade
+    side_codes, sides = pd.factorize(trades["side"], use_na_sentinel=False)
+    sides = pd.Series(sides)
+    is_sell = sides.str.contains("sell").astype(bool).to_numpy()[side_codes]
+    is_buy = sides.str.contains("buy").astype(bool).to_numpy()[side_codes]
+    amount = trades["amount"].to_numpy()
+    levels = pd.DataFrame(
+        {
+            "candle": candles,
+            # round the prices to the nearest multiple of the scale
+            "price": ((trades["price"] / scale).round() * scale).astype("float64").to_numpy(),
+            "bid": is_sell.astype("int64"),
+            "ask": is_buy.astype("int64"),
+            "bid_amount": np.where(is_sell, amount, 0),
+            "ask_amount": np.where(is_buy, amount, 0),
+        }
+    )
+    levels["delta"] = levels["ask_amount"] - levels["bid_amount"]
+    levels["total_volume"] = levels["ask_amount"] + levels["bid_amount"]
+    levels["total_trades"] = levels["ask"] + levels["bid"]
+    return levels
+
+
+def _levels_to_imbalances(
+    footprint: pd.DataFrame, imbalance_ratio: int, imbalance_volume: int
+) -> pd.DataFrame:
+    """
+    Vectorized version of `trades_orderflow_to_imbalances()` for the footprint of all candles
+    :param footprint: footprint indexed by candle and price
+    :param imbalance_ratio: imbalance_ratio e.g. 3
+    :param imbalance_volume: imbalance volume e.g. 10
+    :return: dataframe with bid and ask imbalance, indexed by candle and price
+    """
+    bid = footprint["bid"]
+    # compares bid and ask diagonally - within the same candle
+    ask = footprint["ask"].groupby(level="candle").shift(-1)
+    low_volume = footprint["total_volume"] < imbalance_volume
+    return pd.DataFrame(
+        {
+            "bid_imbalance": np.where(low_volume, False, (bid / ask) > imbalance_ratio),
+            "ask_imbalance": np.where(low_volume, False, (ask / bid) > imbalance_ratio),
+        },
+        index=footprint.index,
+    )
+
+
+def _stacked_imbalances(
+    imbalance: pd.Series, stacked_imbalance_range: int, should_reverse: bool
+) -> pd.Series:
+    """
+    Vectorized version of `stacked_imbalance()` for the imbalances of all candles
+    :param imbalance: bid or ask imbalance, indexed by candle and price
+    :return: price of the first (last if should_reverse) stacked imbalance per candle
+    """
+    values = imbalance.to_numpy(dtype=bool)
+    candles = imbalance.index.get_level_values("candle").to_numpy()
+    prices = imbalance.index.get_level_values("price").to_numpy()
+    # a new run starts whenever the value or the candle changes
+    run_start = np.ones(len(values), dtype=bool)
+    run_start[1:] = (values[1:] != values[:-1]) | (candles[1:] != candles[:-1])
+    run_start_idx = np.flatnonzero(run_start)
+    run_position = np.arange(len(values)) - run_start_idx[np.cumsum(run_start) - 1]
+    stacked = np.where(values, run_position + 1, 0)
+
+    is_stacked = stacked >= stacked_imbalance_range
+    stacked_prices = pd.Series(prices[is_stacked]).groupby(candles[is_stacked])
+    return stacked_prices.last() if should_reverse else stacked_prices.first()
+
+
+def _split_by_candle(candles: np.ndarray, values: list) -> list[list]:
+    """
+    Splits values sorted by candle into one list per candle
+    """
+    bounds = [0, *(np.flatnonzero(np.diff(candles)) + 1).tolist(), len(values)]
+    return [values[start:stop] for start, stop in zip(bounds[:-1], bounds[1:], strict=True)]
+
+
+def _to_records(df: pd.DataFrame) -> list[dict]:
+    """
+    Faster equivalent of `df.to_dict(orient="records")`
+    """
+    columns = df.columns.tolist()
+    return [
+        dict(zip(columns, row, strict=True))
+        for row in zip(*(df[col].tolist() for col in columns), strict=True)
+    ]
+
+
+def _to_price_dicts(candles: np.ndarray, prices: list[list], df: pd.DataFrame) -> list[dict]:
+    """
+    Converts a dataframe indexed by candle and price to one {price: row} dict per candle
+    """
+    rows = _split_by_candle(candles, _to_records(df))
+    return [
+        dict(zip(candle_prices, candle_rows, strict=True))
+        for candle_prices, candle_rows in zip(prices, rows, strict=True)
+    ]
+
+
+def _set_candle_values(dataframe: pd.DataFrame, column: str, positions: np.ndarray, values) -> None:
+    """
+    Sets values of a column at the given row positions
+    """
+    column_values = dataframe[column].to_numpy(copy=True)
+    if column_values.dtype == object:
+        # Assign one by one to store lists and dicts as objects
+        for position, value in zip(positions, values, strict=True):
+            column_values[position] = value
+    else:
+        column_values[positions] = values
+    dataframe[column] = column_values
+
+
 def populate_dataframe_with_trades(
     cached_grouped_trades: pd.DataFrame | None,
     config: Config,
@@ -98,6 +228,7 @@ def populate_dataframe_with_trades(
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Populates a dataframe with trades
+    Orderflow of all candles is calculated at once, grouping trades by candle and price level.
     :param dataframe: Dataframe to populate
     :param trades: Trades to populate with
     :return: Dataframe with trades populated
@@ -123,72 +254,88 @@ def populate_dataframe_with_trades(
         trades = trades.loc[trades["candle_start"] >= start_date]
         trades.reset_index(inplace=True, drop=True)
 
-        # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
-                )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance_bid(
-                    imbalances, stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance_ask(
-                    imbalances, stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
+        # align trades to their candle - there can only be one row with the same date
+        trade_candles = pd.Index(dataframe["date"]).get_indexer(trades["candle_start"])
+        candles = np.unique(trade_candles[trade_candles >= 0])
+
+        if cached_grouped_trades is not None and not cached_grouped_trades.empty:
+            # Reuse candles which are already in the cache
+            cache_idx = pd.Index(cached_grouped_trades["date"]).get_indexer(
+                dataframe["date"].iloc[candles]
+            )
+            is_cached = cache_idx >= 0
+            for col in ORDERFLOW_ADDED_COLUMNS:
+                _set_candle_values(
+                    dataframe,
+                    col,
+                    candles[is_cached],
+                    cached_grouped_trades[col].to_numpy()[cache_idx[is_cached]],
                 )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+            candles = candles[~is_cached]
+
+        is_new = np.isin(trade_candles, candles)
+        if is_new.any():
+            # sort trades by candle, keeping the order of trades within a candle
+            order = np.argsort(trade_candles[is_new], kind="stable")
+            trades = trades.loc[is_new].iloc[order]
+            trade_candles = trade_candles[is_new][order]
+
+            records = _to_records(trades.drop(columns=["candle_start", "candle_end"]))
+            _set_candle_values(
+                dataframe, "trades", candles, _split_by_candle(trade_candles, records)
+            )
+
+            # Calculate orderflow (footprint) for all candles
+            levels = _trades_to_levels(trades, trade_candles, scale=config_orderflow["scale"])
+            footprint = levels.groupby(["candle", "price"]).sum()[ORDERFLOW_COLUMNS]
+            footprint_candles = footprint.index.get_level_values("candle").to_numpy()
+            prices = _split_by_candle(
+                footprint_candles, footprint.index.get_level_values("price").tolist()
+            )
+            _set_candle_values(
+                dataframe,
+                "orderflow",
+                candles,
+                _to_price_dicts(footprint_candles, prices, footprint),
+            )
+
+            # Calculate imbalances for each candle's orderflow
+            imbalances = _levels_to_imbalances(
+                footprint,
+                imbalance_ratio=config_orderflow["imbalance_ratio"],
+                imbalance_volume=config_orderflow["imbalance_volume"],
+            )
+            _set_candle_values(
+                dataframe,
+                "imbalances",
+                candles,
+                _to_price_dicts(footprint_candles, prices, imbalances),
+            )
+
+            stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
+            stacked_bid = _stacked_imbalances(
+                imbalances["bid_imbalance"], stacked_imbalance_range, should_reverse=False
+            )
+            _set_candle_values(
+                dataframe, "stacked_imbalances_bid", stacked_bid.index.to_numpy(), stacked_bid
+            )
+            stacked_ask = _stacked_imbalances(
+                imbalances["ask_imbalance"], stacked_imbalance_range, should_reverse=True
+            )
+            _set_candle_values(
+                dataframe, "stacked_imbalances_ask", stacked_ask.index.to_numpy(), stacked_ask
+            )
+
+            grouped_levels = levels.groupby("candle")
+            cumulative_delta = grouped_levels["delta"].cumsum().groupby(levels["candle"])
+            bid = grouped_levels["bid_amount"].sum().to_numpy()
+            ask = grouped_levels["ask_amount"].sum().to_numpy()
+            _set_candle_values(dataframe, "max_delta", candles, cumulative_delta.max().to_numpy())
+            _set_candle_values(dataframe, "min_delta", candles, cumulative_delta.min().to_numpy())
+            _set_candle_values(dataframe, "bid", candles, bid)
+            _set_candle_values(dataframe, "ask", candles, ask)
+            _set_candle_values(dataframe, "delta", candles, ask - bid)
+            _set_candle_values(dataframe, "total_trades", candles, grouped_levels.size().to_numpy())
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
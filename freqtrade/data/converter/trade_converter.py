@@ -113,19 +113,47 @@ def convert_trades_to_ohlcv(
     )
     trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
     for pair in pairs:
-        trades = data_handler_trades.trades_load(pair, trading_mode)
+        # Partitioned trades are converted one partition at a time, to limit memory usage.
+        ohlcv_chunks: dict[str, list[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+        for trades in data_handler_trades.trades_iter(pair, trading_mode):
+            if trades.empty:
+                continue
+            for timeframe in timeframes:
+                ohlcv_chunks[timeframe].append(trades_to_ohlcv(trades, timeframe))
+
         for timeframe in timeframes:
             if erase:
                 if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
                     logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
             try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
+                ohlcv = _merge_ohlcv_chunks(ohlcv_chunks[timeframe])
                 # Store ohlcv
                 data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
             except ValueError:
                 logger.warning(f"Could not convert {pair} to OHLCV.")
 
 
+def _merge_ohlcv_chunks(chunks: list[DataFrame]) -> DataFrame:
+    """
+    Merge OHLCV data converted from consecutive chunks of trades.
+    Candles spanning two chunks are combined.
+    :raises: ValueError if no chunks are provided
+    """
+    if not chunks:
+        raise ValueError("Trade-list empty.")
+    if len(chunks) == 1:
+        return chunks[0]
+    df = pd.concat(chunks, ignore_index=True)
+    df = df.groupby("date", sort=True, as_index=False).agg(
+        open=("open", "first"),
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+        volume=("volume", "sum"),
+    )
+    return df.loc[:, DEFAULT_DATAFRAME_COLUMNS]
+
+
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
     """
     Convert trades from one format to another format.
@@ -19,7 +19,7 @@ from freqtrade.constants import (
     ListPairsWithTimeframes,
     PairWithTimeframe,
 )
-from freqtrade.data.history import get_datahandler, load_pair_history
+from freqtrade.data.history import get_datahandler, load_pair_history, map_pair_loads
 from freqtrade.enums import CandleType, RPCMessageType, RunMode, TradingMode
 from freqtrade.exceptions import ExchangeError, OperationalException
 from freqtrade.exchange import Exchange, timeframe_to_prev_date, timeframe_to_seconds
@@ -27,7 +27,7 @@ from freqtrade.exchange.exchange_types import OrderBook
 from freqtrade.misc import append_candles_to_dataframe
 from freqtrade.rpc import RPCManager
 from freqtrade.rpc.rpc_types import RPCAnalyzedDFMsg
-from freqtrade.util import PeriodicCache
+from freqtrade.util import PeriodicCache, dt_ts
 
 
 logger = logging.getLogger(__name__)
@@ -217,6 +217,14 @@ class DataProvider:
 
         existing_df, _ = self.__producer_pairs_df[producer_name][pair_key]
 
+        if set(dataframe.columns) != set(existing_df.columns):
+            # The producer's columns changed - existing candles lack the new columns.
+            # return False and 1000 for the full df
+            logger.info(
+                f"Columns of {pair}, {timeframe}, {candle_type} from {producer_name} changed."
+            )
+            return (False, 1000)
+
         # CHECK FOR MISSING CANDLES
         # Convert the timeframe to a timedelta for pandas
         timeframe_delta: Timedelta = to_timedelta(timeframe)
@@ -252,6 +260,19 @@ class DataProvider:
         )
         return (True, 0)
 
+    def _get_producer_last_candles(self, producer_name: str = "default") -> dict[str, int]:
+        """
+        Date of the last candle received from a producer, per pair.
+        Used to resume from after reconnecting to the producer.
+        :param producer_name: Name of the producer
+        :returns: Dict of pair: last candle date (timestamp in ms)
+        """
+        return {
+            pair_key[0]: dt_ts(df.iloc[-1]["date"])
+            for pair_key, (df, _) in self.__producer_pairs_df.get(producer_name, {}).items()
+            if not df.empty
+        }
+
     def get_producer_df(
         self,
         pair: str,
@@ -299,37 +320,62 @@ class DataProvider:
         :param timeframe: timeframe to get data for
         :param candle_type: '', mark, index, premiumIndex, or funding_rate
         """
+        saved_pair = self._historic_pair_key(pair, timeframe, candle_type)
+        if saved_pair not in self.__cached_pairs_backtesting:
+            self.__cached_pairs_backtesting[saved_pair] = self._load_historic_ohlcv(saved_pair)
+        return self.__cached_pairs_backtesting[saved_pair].copy()
+
+    def preload_historic_ohlcv(self, pairs: ListPairsWithTimeframes, workers: int = 1) -> None:
+        """
+        Load stored historical candle (OHLCV) data for multiple pairs at once,
+        so following `historic_ohlcv()` calls are served from cache.
+        :param pairs: List of (pair, timeframe, candle_type) tuples
+        :param workers: Number of pairs to load concurrently
+        """
+        to_load = list(
+            dict.fromkeys(
+                key
+                for key in (self._historic_pair_key(*pair) for pair in pairs)
+                if key not in self.__cached_pairs_backtesting
+            )
+        )
+        data_handler = get_datahandler(self._config["datadir"], self._config["dataformat_ohlcv"])
+        loaded = map_pair_loads(self._load_historic_ohlcv, to_load, data_handler, workers)
+        self.__cached_pairs_backtesting.update(zip(to_load, loaded, strict=True))
+
+    def _historic_pair_key(
+        self, pair: str, timeframe: str, candle_type: str = ""
+    ) -> PairWithTimeframe:
         _candle_type = (
             CandleType.from_string(candle_type)
             if candle_type != ""
             else self._config["candle_type_def"]
         )
-        saved_pair: PairWithTimeframe = (pair, str(timeframe), _candle_type)
-        if saved_pair not in self.__cached_pairs_backtesting:
-            timerange = TimeRange.parse_timerange(
-                None
-                if self._config.get("timerange") is None
-                else str(self._config.get("timerange"))
-            )
+        return (pair, str(timeframe), _candle_type)
 
-            startup_candles = self.get_required_startup(str(timeframe))
-            tf_seconds = timeframe_to_seconds(str(timeframe))
-            timerange.subtract_start(tf_seconds * startup_candles)
+    def _load_historic_ohlcv(self, pair_key: PairWithTimeframe) -> DataFrame:
+        pair, timeframe, candle_type = pair_key
+        timerange = TimeRange.parse_timerange(
+            None if self._config.get("timerange") is None else str(self._config.get("timerange"))
+        )
 
-            logger.info(
-                f"Loading data for {pair} {timeframe} "
-                f"from {timerange.start_fmt} to {timerange.stop_fmt}"
-            )
+        startup_candles = self.get_required_startup(timeframe)
+        tf_seconds = timeframe_to_seconds(timeframe)
+        timerange.subtract_start(tf_seconds * startup_candles)
 
-            self.__cached_pairs_backtesting[saved_pair] = load_pair_history(
-                pair=pair,
-                timeframe=timeframe,
-                datadir=self._config["datadir"],
-                timerange=timerange,
-                data_format=self._config["dataformat_ohlcv"],
-                candle_type=_candle_type,
-            )
-        return self.__cached_pairs_backtesting[saved_pair].copy()
+        logger.info(
+            f"Loading data for {pair} {timeframe} "
+            f"from {timerange.start_fmt} to {timerange.stop_fmt}"
+        )
+
+        return load_pair_history(
+            pair=pair,
+            timeframe=timeframe,
+            datadir=self._config["datadir"],
+            timerange=timerange,
+            data_format=self._config["dataformat_ohlcv"],
+            candle_type=candle_type,
+        )
 
     def get_required_startup(self, timeframe: str) -> int:
         freqai_config = self._config.get("freqai", {})
@@ -497,7 +543,12 @@ class DataProvider:
             return DataFrame()
 
     def trades(
-        self, pair: str, timeframe: str | None = None, copy: bool = True, candle_type: str = ""
+        self,
+        pair: str,
+        timeframe: str | None = None,
+        copy: bool = True,
+        candle_type: str = "",
+        timerange: TimeRange | None = None,
     ) -> DataFrame:
         """
         Get candle (TRADES) data for the given pair as DataFrame
@@ -508,6 +559,8 @@ class DataProvider:
         :param candle_type: '', mark, index, premiumIndex, or funding_rate
         :param copy: copy dataframe before returning if True.
                      Use False only for read-only operations (where the dataframe is not modified)
+        :param timerange: Limit trades to this timerange. Only applies to stored trades
+                     (backtesting) - partitioned trades only read the days within it.
         """
         if self.runmode in (RunMode.DRY_RUN, RunMode.LIVE):
             if self._exchange is None:
@@ -525,7 +578,7 @@ class DataProvider:
                 self._config["datadir"], data_format=self._config["dataformat_trades"]
             )
             trades_df = data_handler.trades_load(
-                pair, self._config.get("trading_mode", TradingMode.SPOT)
+                pair, self._config.get("trading_mode", TradingMode.SPOT), timerange=timerange
             )
             return trades_df
 
@@ -1,5 +1,8 @@
 import logging
+from bisect import bisect_left, bisect_right
+from pathlib import Path
 
+import pyarrow as pa
 from pandas import DataFrame, read_feather, to_datetime
 
 from freqtrade.configuration import TimeRange
@@ -7,13 +10,18 @@ from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMN
 from freqtrade.enums import CandleType, TradingMode
 
 from .idatahandler import IDataHandler
+from .partitioneddatahandler import PartitionedDataMixin
 
 
 logger = logging.getLogger(__name__)
 
+# Nanoseconds per arrow timestamp unit
+_UNIT_NS = {"s": 10**9, "ms": 10**6, "us": 10**3, "ns": 1}
 
-class FeatherDataHandler(IDataHandler):
+
+class FeatherDataHandler(PartitionedDataMixin, IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    _threaded_load = True
 
     def ohlcv_store(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
@@ -30,7 +38,13 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
+        if filename.is_dir():
+            # Keep the partitioned layout of existing data
+            self._ohlcv_store_partitioned(filename, data)
+        else:
+            self._write_ohlcv_file(filename, data)
 
+    def _write_ohlcv_file(self, filename: Path, data: DataFrame) -> None:
         data.reset_index(drop=True).loc[:, self._columns].to_feather(
             filename, compression_level=9, compression="lz4"
         )
@@ -59,7 +73,7 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
+            pairdata = self._read_ohlcv_data(filename, timeframe, timerange)
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -78,17 +92,64 @@ class FeatherDataHandler(IDataHandler):
             )
             return DataFrame(columns=self._columns)
 
+    def _read_ohlcv_file(
+        self, filename: Path, timeframe: str, timerange: TimeRange | None
+    ) -> DataFrame:
+        """
+        Read an ohlcv file - only reading record batches overlapping the timerange.
+        Feather files carry no statistics, but are sorted by date - so the batches to read
+        are found by a binary search on the date column.
+        """
+        start, stop = self._ohlcv_load_bounds(timerange, timeframe)
+        if start is None and stop is None:
+            return read_feather(filename)
+
+        with pa.OSFile(str(filename)) as source:
+            # Only the date column (the first column) is read for the search.
+            dates = pa.ipc.open_file(source, options=pa.ipc.IpcReadOptions(included_fields=[0]))
+            num_batches = dates.num_record_batches
+            if num_batches <= 1:
+                return read_feather(filename)
+
+            date_type = dates.schema.field(0).type
+            # Convert bounds to the unit of the stored dates. Integer dates are in ms.
+            unit_ns = _UNIT_NS[date_type.unit] if pa.types.is_timestamp(date_type) else 10**6
+
+            def batch_date(idx: int, row: int) -> int:
+                return dates.get_batch(idx).column(0).cast(pa.int64())[row].as_py()
+
+            first, last = 0, num_batches
+            if start is not None:
+                first = bisect_left(
+                    range(num_batches), start.value // unit_ns, key=lambda i: batch_date(i, -1)
+                )
+            if stop is not None:
+                last = bisect_right(
+                    range(num_batches),
+                    stop.value // unit_ns,
+                    lo=first,
+                    key=lambda i: batch_date(i, 0),
+                )
+
+            reader = pa.ipc.open_file(source)
+            table = pa.Table.from_batches(
+                [reader.get_batch(idx) for idx in range(first, last)], schema=reader.schema
+            )
+        return table.to_pandas()
+
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Stores data as monthly partitions - only the months contained in `data` are rewritten.
+        Data stored as a single file is migrated to partitions first.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        self._ohlcv_append_partitioned(pair, timeframe, data, candle_type)
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -100,33 +161,45 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
+        if filename.is_dir():
+            # Keep the partitioned layout of existing data
+            self._trades_store_partitioned(filename, data)
+        else:
+            self._write_trades_file(filename, data)
+
+    def _write_trades_file(self, filename: Path, data: DataFrame) -> None:
         data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def _read_trades_file(self, filename: Path) -> DataFrame:
+        return read_feather(filename)
+
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
-        Append data to existing files
+        Append data to existing files.
+        Stores trades as daily partitions - only the days contained in `data` are rewritten.
+        Trades stored as a single file are migrated to partitions first.
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
-        raise NotImplementedError()
+        self._trades_append_partitioned(pair, data, trading_mode)
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
         Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for - only used for partitioned trades
         :return: Dataframe containing trades
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
-        tradesdata = read_feather(filename)
+        tradesdata = self._read_trades_data(filename, timerange)
 
         return tradesdata
 
@@ -131,12 +131,13 @@ class HDF5DataHandler(IDataHandler):
             data_columns=["timestamp"],
         )
 
-    def trades_append(self, pair: str, data: pd.DataFrame):
+    def trades_append(self, pair: str, data: pd.DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
         raise NotImplementedError()
 
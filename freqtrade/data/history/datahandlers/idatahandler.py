@@ -6,16 +6,21 @@ It's subclasses handle and storing data from disk.
 
 import logging
 import re
+import shutil
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
 
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, Timedelta, Timestamp, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
+from freqtrade.constants import (
+    DEFAULT_TRADES_COLUMNS,
+    ListPairsWithTimeframes,
+)
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     trades_convert_types,
@@ -32,6 +37,8 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # Reading files releases the GIL - so multiple pairs can be loaded in threads.
+    _threaded_load = False
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
@@ -43,6 +50,14 @@ class IDataHandler(ABC):
         """
         raise NotImplementedError()
 
+    @classmethod
+    def supports_partitions(cls) -> bool:
+        """
+        Check if this datahandler can store data as partitions
+        (see `ohlcv_append()` and `trades_append()`).
+        """
+        return False
+
     @classmethod
     def ohlcv_get_available_data(
         cls, datadir: Path, trading_mode: TradingMode
@@ -140,6 +155,27 @@ class IDataHandler(ABC):
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
 
+    @staticmethod
+    def _ohlcv_load_bounds(
+        timerange: TimeRange | None, timeframe: str
+    ) -> tuple[Timestamp | None, Timestamp | None]:
+        """
+        Date bounds for subclasses filtering data while reading it from disk.
+        Bounds are widened by one candle, so validation and detection of incomplete candles
+        in `ohlcv_load()` behave the same as if the whole file was loaded.
+        :param timerange: Timerange passed to `_ohlcv_load()`
+        :param timeframe: Timeframe (e.g. "5m")
+        :return: Tuple of (start, stop) - None if the timerange is open on that side.
+        """
+        start = stop = None
+        if timerange:
+            candle = Timedelta(seconds=timeframe_to_seconds(timeframe))
+            if timerange.starttype == "date":
+                start = Timestamp(timerange.startdt) - candle
+            if timerange.stoptype == "date":
+                stop = Timestamp(timerange.stopdt) + candle
+        return start, stop
+
     def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         """
         Remove data for this pair
@@ -154,6 +190,15 @@ class IDataHandler(ABC):
             return True
         return False
 
+    def ohlcv_is_partitioned(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Check if data for this pair is stored as monthly partitions.
+        :param pair: Pair
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        return False
+
     @abstractmethod
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
@@ -236,12 +281,13 @@ class IDataHandler(ABC):
         """
 
     @abstractmethod
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
 
     @abstractmethod
@@ -252,10 +298,44 @@ class IDataHandler(ABC):
         Load a pair from file, either .json.gz or .json
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for.
+                        Optionally implemented by subclasses to avoid loading
+                        all data where possible.
         :return: Dataframe containing trades
         """
 
+    def trades_is_partitioned(self, pair: str, trading_mode: TradingMode) -> bool:
+        """
+        Check if trades for this pair are stored as daily partitions.
+        :param pair: Pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        return False
+
+    @staticmethod
+    def _trades_load_bounds(timerange: TimeRange | None) -> tuple[int | None, int | None]:
+        """
+        Timestamp bounds (in ms) of a timerange for trades data.
+        :return: Tuple of (start, stop) - None if the timerange is open on that side.
+        """
+        start = stop = None
+        if timerange:
+            if timerange.starttype == "date":
+                start = timerange.startts * 1000
+            if timerange.stoptype == "date":
+                stop = timerange.stopts * 1000
+        return start, stop
+
+    def trades_iter(self, pair: str, trading_mode: TradingMode) -> Iterator[DataFrame]:
+        """
+        Iterate over stored trades in chunks, to limit memory usage.
+        Trades are returned in one chunk - partitioned trades one partition at a time.
+        Trades are cleaned the same way as in `trades_load()`.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        yield self.trades_load(pair, trading_mode)
+
     def trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
         Store trades data (list of Dicts) to file
@@ -288,7 +368,7 @@ class IDataHandler(ABC):
         Removes duplicates in the process.
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Limit trades to this timerange
         :return: List of trades
         """
         try:
@@ -300,6 +380,11 @@ class IDataHandler(ABC):
         trades = trades_df_remove_duplicates(trades)
 
         trades = trades_convert_types(trades)
+        start, stop = self._trades_load_bounds(timerange)
+        if start is not None:
+            trades = trades.loc[trades["timestamp"] >= start]
+        if stop is not None:
+            trades = trades.loc[trades["timestamp"] <= stop]
         return trades
 
     @classmethod
@@ -526,7 +611,10 @@ class IDataHandler(ABC):
 
             if Path(new_name).exists():
                 logger.warning(f"{new_name} already exists, Removing.")
-                Path(new_name).unlink()
+                if Path(new_name).is_dir():
+                    shutil.rmtree(new_name)
+                else:
+                    Path(new_name).unlink()
 
             Path(old_name).rename(new_name)
 
@@ -1,5 +1,8 @@
 import logging
+from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pandas import DataFrame, read_parquet, to_datetime
 
 from freqtrade.configuration import TimeRange
@@ -7,13 +10,19 @@ from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMN
 from freqtrade.enums import CandleType, TradingMode
 
 from .idatahandler import IDataHandler
+from .partitioneddatahandler import PartitionedDataMixin
 
 
 logger = logging.getLogger(__name__)
 
+# Rows per row group when storing ohlcv data.
+# Smaller row groups allow skipping more data when loading a timerange.
+OHLCV_ROW_GROUP_SIZE = 65536
 
-class ParquetDataHandler(IDataHandler):
+
+class ParquetDataHandler(PartitionedDataMixin, IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    _threaded_load = True
 
     def ohlcv_store(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
@@ -30,8 +39,16 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
+        if filename.is_dir():
+            # Keep the partitioned layout of existing data
+            self._ohlcv_store_partitioned(filename, data)
+        else:
+            self._write_ohlcv_file(filename, data)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+    def _write_ohlcv_file(self, filename: Path, data: DataFrame) -> None:
+        data.reset_index(drop=True).loc[:, self._columns].to_parquet(
+            filename, row_group_size=OHLCV_ROW_GROUP_SIZE
+        )
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -57,7 +74,7 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_parquet(filename)
+            pairdata = self._read_ohlcv_data(filename, timeframe, timerange)
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -76,17 +93,51 @@ class ParquetDataHandler(IDataHandler):
             )
             return DataFrame(columns=self._columns)
 
+    def _read_ohlcv_file(
+        self, filename: Path, timeframe: str, timerange: TimeRange | None
+    ) -> DataFrame:
+        """
+        Read an ohlcv file - only reading row groups overlapping the timerange.
+        """
+        return read_parquet(filename, filters=self._ohlcv_filters(filename, timeframe, timerange))
+
+    def _ohlcv_filters(
+        self, filename: Path, timeframe: str, timerange: TimeRange | None
+    ) -> list[tuple] | None:
+        """
+        Build filters for the timerange - so only matching row groups are read.
+        """
+        start, stop = self._ohlcv_load_bounds(timerange, timeframe)
+        if start is None and stop is None:
+            return None
+        date_field = pq.read_schema(filename).field(0)
+        filters = []
+        for operator, bound in ((">=", start), ("<=", stop)):
+            if bound is None:
+                continue
+            if pa.types.is_timestamp(date_field.type):
+                # Bounds must match the timezone of the column - naive dates are assumed UTC
+                tz = date_field.type.tz
+                value = bound.tz_convert(tz) if tz else bound.tz_localize(None)
+            else:
+                # Integer dates are in ms
+                value = bound.value // 10**6
+            filters.append((date_field.name, operator, value))
+        return filters
+
     def ohlcv_append(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Stores data as monthly partitions - only the months contained in `data` are rewritten.
+        Data stored as a single file is migrated to partitions first.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        self._ohlcv_append_partitioned(pair, timeframe, data, candle_type)
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -98,33 +149,45 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
+        if filename.is_dir():
+            # Keep the partitioned layout of existing data
+            self._trades_store_partitioned(filename, data)
+        else:
+            self._write_trades_file(filename, data)
+
+    def _write_trades_file(self, filename: Path, data: DataFrame) -> None:
         data.reset_index(drop=True).to_parquet(filename)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def _read_trades_file(self, filename: Path) -> DataFrame:
+        return read_parquet(filename)
+
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
-        Append data to existing files
+        Append data to existing files.
+        Stores trades as daily partitions - only the days contained in `data` are rewritten.
+        Trades stored as a single file are migrated to partitions first.
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
-        raise NotImplementedError()
+        self._trades_append_partitioned(pair, data, trading_mode)
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
         Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for - only used for partitioned trades
         :return: List of trades
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
-        tradesdata = read_parquet(filename)
+        tradesdata = self._read_trades_data(filename, timerange)
 
         return tradesdata
 
@@ -0,0 +1,448 @@
+"""
+Partitioned storage for datahandlers.
+Data is stored as one file per period in a directory, next to a manifest listing the files.
+"""
+
+import logging
+import shutil
+from abc import abstractmethod
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+from pandas import DataFrame, concat, to_datetime
+
+from freqtrade import misc
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
+from freqtrade.data.converter import trades_convert_types, trades_df_remove_duplicates
+from freqtrade.enums import CandleType, TradingMode
+
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionedDataMixin(IDataHandler):
+    """
+    Stores data as partitions (see `ohlcv_append()` and `trades_append()`).
+    Used by datahandlers which can read and write single files of their format.
+    """
+
+    _PARTITION_MANIFEST = "manifest.json"
+
+    @classmethod
+    def supports_partitions(cls) -> bool:
+        return True
+
+    @abstractmethod
+    def _read_ohlcv_file(
+        self, filename: Path, timeframe: str, timerange: TimeRange | None
+    ) -> DataFrame:
+        """
+        Read one ohlcv file - a single file or one partition.
+        :param timerange: Limit data to be read to this timerange - where possible.
+        """
+
+    @abstractmethod
+    def _write_ohlcv_file(self, filename: Path, data: DataFrame) -> None:
+        """
+        Write one ohlcv file - a single file or one partition.
+        """
+
+    @abstractmethod
+    def _read_trades_file(self, filename: Path) -> DataFrame:
+        """
+        Read one trades file - a single file or one partition.
+        """
+
+    @abstractmethod
+    def _write_trades_file(self, filename: Path, data: DataFrame) -> None:
+        """
+        Write one trades file - a single file or one partition.
+        """
+
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Partitioned data is answered from the manifest.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if filename.is_dir():
+            partitions = self._read_partition_manifest(filename)
+            if partitions:
+                return self._partitions_min_max(partitions)
+        return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if filename.is_dir():
+            shutil.rmtree(filename)
+            return True
+        return super().ohlcv_purge(pair, timeframe, candle_type)
+
+    def ohlcv_is_partitioned(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Check if data for this pair is stored as monthly partitions.
+        :param pair: Pair
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        return self._pair_data_filename(self._datadir, pair, timeframe, candle_type).is_dir()
+
+    @staticmethod
+    def _partitions_min_max(partitions: list[dict]) -> tuple[datetime, datetime, int]:
+        """
+        Min and max timestamp and number of rows of a partitioned dataset.
+        """
+        return (
+            datetime.fromtimestamp(partitions[0]["start"] / 1000, tz=timezone.utc),
+            datetime.fromtimestamp(partitions[-1]["stop"] / 1000, tz=timezone.utc),
+            sum(p["rows"] for p in partitions),
+        )
+
+    def _read_ohlcv_data(
+        self, filename: Path, timeframe: str, timerange: TimeRange | None
+    ) -> DataFrame:
+        """
+        Read ohlcv data from a single file - or from the partitions in the directory `filename`.
+        Only partitions overlapping the timerange are read.
+        """
+        if not filename.is_dir():
+            return self._read_ohlcv_file(filename, timeframe, timerange)
+
+        start, stop = self._ohlcv_load_bounds(timerange, timeframe)
+        frames = [
+            self._read_ohlcv_file(filename / p["file"], timeframe, timerange)
+            for p in self._partitions_in_range(
+                filename,
+                start.value // 10**6 if start is not None else None,
+                stop.value // 10**6 if stop is not None else None,
+            )
+        ]
+        if not frames:
+            return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+        return concat(frames, ignore_index=True)
+
+    def _read_partition_manifest(self, dirname: Path) -> list[dict]:
+        """
+        Read the partitions of a partitioned dataset, sorted by date.
+        :return: List of dicts with the keys file, start, stop (in ms) and rows.
+        """
+        manifest = dirname / self._PARTITION_MANIFEST
+        if not manifest.is_file():
+            return []
+        return misc.file_load_json(manifest)["partitions"]
+
+    def _partitions_in_range(
+        self, dirname: Path, start_ms: int | None, stop_ms: int | None
+    ) -> list[dict]:
+        """
+        Partitions overlapping the range from start_ms to stop_ms (both inclusive).
+        :param start_ms: Start of the range in ms - None to start with the first partition
+        :param stop_ms: End of the range in ms - None to end with the last partition
+        """
+        return [
+            p
+            for p in self._read_partition_manifest(dirname)
+            if (start_ms is None or p["stop"] >= start_ms)
+            and (stop_ms is None or p["start"] <= stop_ms)
+        ]
+
+    def _partitions_for_timestamps(
+        self, dirname: Path, timestamps: np.ndarray, period: str
+    ) -> list[dict]:
+        """
+        Partitions of the periods containing timestamps - the partitions rewritten
+        by `_write_partitions()` for these timestamps.
+        :param timestamps: Timestamps (in ms)
+        :param period: Numpy datetime unit of one partition - "M" (month) or "D" (day)
+        """
+        ext = self._get_file_extension()
+        keys = np.unique(timestamps.astype("datetime64[ms]").astype(f"datetime64[{period}]"))
+        files = {f"{key}.{ext}" for key in keys}
+        return [p for p in self._read_partition_manifest(dirname) if p["file"] in files]
+
+    def _write_partitions(
+        self,
+        dirname: Path,
+        data: DataFrame,
+        timestamps: np.ndarray,
+        period: str,
+        partitions: list[dict],
+        write_file: Callable[[Path, DataFrame], None],
+    ) -> None:
+        """
+        Write data to partitions spanning one period each, replacing the partitions in data.
+        Files are written to a temporary file first, and replaced once complete.
+        The manifest is written last, so an interrupted write keeps the previous state readable.
+        :param dirname: Directory of the partitioned dataset
+        :param data: Data to write, sorted by date
+        :param timestamps: Timestamps (in ms) of the rows in data
+        :param period: Numpy datetime unit of one partition - "M" (month) or "D" (day)
+        :param partitions: Current partitions of the dataset
+        :param write_file: Function writing one partition file
+        """
+        ext = self._get_file_extension()
+        keys = timestamps.astype("datetime64[ms]").astype(f"datetime64[{period}]")
+        periods, starts = np.unique(keys, return_index=True)
+        ends = [*starts[1:], len(data)]
+        new_partitions = {p["file"]: p for p in partitions}
+        for key, first, end in zip(periods, starts, ends, strict=True):
+            file = f"{key}.{ext}"
+            tmp_file = dirname / f"{file}.tmp"
+            write_file(tmp_file, data.iloc[first:end].reset_index(drop=True))
+            tmp_file.replace(dirname / file)
+            new_partitions[file] = {
+                "file": file,
+                "start": int(timestamps[first]),
+                "stop": int(timestamps[end - 1]),
+                "rows": int(end - first),
+            }
+        tmp_manifest = dirname / f"{self._PARTITION_MANIFEST}.tmp"
+        misc.file_dump_json(
+            tmp_manifest,
+            {"partitions": sorted(new_partitions.values(), key=lambda p: p["file"])},
+            log=False,
+        )
+        tmp_manifest.replace(dirname / self._PARTITION_MANIFEST)
+
+    def _clear_partitions(self, dirname: Path) -> None:
+        """
+        Remove all partitions of a partitioned dataset.
+        """
+        for file in dirname.glob(f"*.{self._get_file_extension()}"):
+            file.unlink()
+        (dirname / self._PARTITION_MANIFEST).unlink(missing_ok=True)
+
+    def _migrate_to_partitions(
+        self, filename: Path, write_partitions: Callable[[Path], None]
+    ) -> None:
+        """
+        Convert data stored in one file to partitioned data - if it's not partitioned yet.
+        The original file is kept as backup until the partitioned data is in place.
+        A migration interrupted before that is restored from the backup - and repeated.
+        :param write_partitions: Function writing the data of filename to the given directory
+        """
+        backup = filename.with_name(f"{filename.name}.bak")
+        if backup.is_file():
+            if filename.is_dir():
+                backup.unlink()
+            elif not filename.exists():
+                logger.warning(f"Restoring {filename} from an interrupted migration.")
+                backup.rename(filename)
+        if not filename.is_file():
+            return
+        logger.info(f"Migrating {filename} to partitioned storage.")
+        tmp_dir = filename.with_name(f"{filename.name}.tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir()
+        write_partitions(tmp_dir)
+        filename.replace(backup)
+        tmp_dir.rename(filename)
+        backup.unlink()
+
+    def _ohlcv_write_partitions(
+        self, dirname: Path, data: DataFrame, partitions: list[dict]
+    ) -> None:
+        """
+        Write ohlcv data to monthly partitions.
+        """
+        data = self._ohlcv_partition_data(data)
+        if not data.empty:
+            timestamps = data["date"].values.astype("datetime64[ms]").astype(np.int64)
+            self._write_partitions(
+                dirname, data, timestamps, "M", partitions, self._write_ohlcv_file
+            )
+
+    def _ohlcv_store_partitioned(self, dirname: Path, data: DataFrame) -> None:
+        """
+        Replace all data of a partitioned dataset.
+        """
+        self._clear_partitions(dirname)
+        self._ohlcv_write_partitions(dirname, data, [])
+
+    def _ohlcv_append_partitioned(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Append data to partitioned data, only rewriting the months contained in `data`.
+        Candles already stored are replaced by candles with the same date in `data`.
+        Data stored in a single file is migrated to partitions first.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+        self._migrate_to_partitions(
+            filename,
+            lambda dirname: self._ohlcv_write_partitions(
+                dirname, self._read_ohlcv_file(filename, timeframe, None), []
+            ),
+        )
+        filename.mkdir(exist_ok=True)
+        if data.empty:
+            return
+
+        data = self._ohlcv_partition_data(data)
+        partitions = self._read_partition_manifest(filename)
+        existing = [
+            self._read_ohlcv_file(filename / p["file"], timeframe, None)
+            for p in self._partitions_for_timestamps(
+                filename, data["date"].values.astype("datetime64[ms]").astype(np.int64), "M"
+            )
+        ]
+        # Merge with the affected months - new candles take precedence.
+        self._ohlcv_write_partitions(filename, concat([*existing, data]), partitions)
+
+    def _ohlcv_partition_data(self, data: DataFrame) -> DataFrame:
+        """
+        Prepare data for partitions - utc dates, sorted, without duplicate dates.
+        Later rows win for duplicate dates.
+        """
+        data = data.loc[:, DEFAULT_DATAFRAME_COLUMNS]
+        data = data.assign(date=to_datetime(data["date"], unit="ms", utc=True))
+        return (
+            data.drop_duplicates(subset="date", keep="last")
+            .sort_values("date", kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def trades_data_min_max(
+        self,
+        pair: str,
+        trading_mode: TradingMode,
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair's trades data.
+        Partitioned trades are answered from the manifest.
+        :param pair: Pair to get min/max for
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: (min, max, len)
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if filename.is_dir():
+            partitions = self._read_partition_manifest(filename)
+            if partitions:
+                return self._partitions_min_max(partitions)
+        return super().trades_data_min_max(pair, trading_mode)
+
+    def trades_purge(self, pair: str, trading_mode: TradingMode) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if filename.is_dir():
+            shutil.rmtree(filename)
+            return True
+        return super().trades_purge(pair, trading_mode)
+
+    def trades_is_partitioned(self, pair: str, trading_mode: TradingMode) -> bool:
+        """
+        Check if trades for this pair are stored as daily partitions.
+        :param pair: Pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        return self._pair_trades_filename(self._datadir, pair, trading_mode).is_dir()
+
+    def trades_iter(self, pair: str, trading_mode: TradingMode) -> Iterator[DataFrame]:
+        """
+        Iterate over stored trades in chunks, to limit memory usage.
+        Partitioned trades are returned one partition (day) at a time,
+        other trades in one chunk.
+        Trades are cleaned the same way as in `trades_load()`.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.is_dir():
+            yield from super().trades_iter(pair, trading_mode)
+            return
+        for partition in self._read_partition_manifest(filename):
+            trades = self._read_trades_file(filename / partition["file"])
+            yield trades_convert_types(trades_df_remove_duplicates(trades))
+
+    def _read_trades_data(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Read trades from a single file - or from the partitions in the directory `filename`.
+        Only partitions overlapping the timerange are read.
+        """
+        if not filename.is_dir():
+            return self._read_trades_file(filename)
+        frames = [
+            self._read_trades_file(filename / p["file"])
+            for p in self._partitions_in_range(filename, *self._trades_load_bounds(timerange))
+        ]
+        if not frames:
+            return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        return concat(frames, ignore_index=True)
+
+    def _trades_write_partitions(
+        self, dirname: Path, data: DataFrame, partitions: list[dict]
+    ) -> None:
+        """
+        Write trades to daily partitions.
+        """
+        data = trades_df_remove_duplicates(
+            data.loc[:, DEFAULT_TRADES_COLUMNS].sort_values("timestamp", kind="stable")
+        ).reset_index(drop=True)
+        if not data.empty:
+            timestamps = data["timestamp"].to_numpy(dtype=np.int64)
+            self._write_partitions(
+                dirname, data, timestamps, "D", partitions, self._write_trades_file
+            )
+
+    def _trades_store_partitioned(self, dirname: Path, data: DataFrame) -> None:
+        """
+        Replace all trades of a partitioned dataset.
+        """
+        self._clear_partitions(dirname)
+        self._trades_write_partitions(dirname, data, [])
+
+    def _trades_append_partitioned(
+        self, pair: str, data: DataFrame, trading_mode: TradingMode
+    ) -> None:
+        """
+        Append trades to partitioned trades, only rewriting the days contained in `data`.
+        Duplicates are only removed against the stored days contained in `data`.
+        Trades stored in a single file are migrated to partitions first.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        self.create_dir_if_needed(filename)
+        self._migrate_to_partitions(
+            filename,
+            lambda dirname: self._trades_write_partitions(
+                dirname, self._read_trades_file(filename), []
+            ),
+        )
+        filename.mkdir(exist_ok=True)
+        if data.empty:
+            return
+
+        partitions = self._read_partition_manifest(filename)
+        existing = [
+            self._read_trades_file(filename / p["file"])
+            for p in self._partitions_for_timestamps(
+                filename, data["timestamp"].to_numpy(dtype=np.int64), "D"
+            )
+        ]
+        self._trades_write_partitions(
+            filename, concat([*existing, data[DEFAULT_TRADES_COLUMNS]]), partitions
+        )
@@ -1,7 +1,13 @@
+import asyncio
 import logging
 import operator
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
+from typing import TypeVar
 
 from pandas import DataFrame, concat
 
@@ -16,7 +22,7 @@ from freqtrade.data.converter import (
 from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.exchange import Exchange
+from freqtrade.exchange import Exchange, timeframe_to_seconds
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from freqtrade.util import dt_now, dt_ts, format_ms_time
 from freqtrade.util.migrations import migrate_data
@@ -25,6 +31,8 @@ from freqtrade.util.progress_tracker import CustomProgress, retrieve_progress_tr
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def load_pair_history(
     pair: str,
@@ -68,6 +76,26 @@ def load_pair_history(
     )
 
 
+def map_pair_loads(
+    load: Callable[[T], DataFrame], items: list[T], data_handler: IDataHandler, workers: int = 1
+) -> list[DataFrame]:
+    """
+    Call `load` for every item - using up to `workers` threads if the data handler
+    releases the GIL while reading.
+    Results are always returned in the order of `items`.
+    :param load: Function loading the data of one item
+    :param items: Items (e.g. pairs) to load
+    :param data_handler: Data handler used by `load`
+    :param workers: Maximum number of threads to use
+    :return: List of dataframes, in the order of `items`
+    """
+    workers = min(workers, len(items))
+    if workers <= 1 or not data_handler._threaded_load:
+        return [load(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ft_dataload") as executor:
+        return list(executor.map(load, items))
+
+
 def load_data(
     datadir: Path,
     timeframe: str,
@@ -80,6 +108,7 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    workers: int = 1,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -93,6 +122,8 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param user_futures_funding_rate: Funding rate to use if no funding rate data is found
+    :param workers: Number of pairs to load concurrently (only for feather and parquet)
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -101,8 +132,8 @@ def load_data(
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(
+    def load(pair: str) -> DataFrame:
+        return load_pair_history(
             pair=pair,
             timeframe=timeframe,
             datadir=datadir,
@@ -112,6 +143,8 @@ def load_data(
             data_handler=data_handler,
             candle_type=candle_type,
         )
+
+    for pair, hist in zip(pairs, map_pair_loads(load, pairs, data_handler, workers), strict=True):
         if not hist.empty:
             result[pair] = hist
         else:
@@ -173,6 +206,7 @@ def _load_cached_data_for_updating(
     downloaded.
     If that's the case then what's available should be completely overwritten.
     Otherwise downloads always start at the end of the available data to avoid data gaps.
+    For partitioned data, only the last candles are loaded (see IDataHandler.ohlcv_append()).
     Note: Only used by download_pair_history().
     """
     start = None
@@ -183,28 +217,38 @@ def _load_cached_data_for_updating(
         if timerange.stoptype == "date":
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
+    load_timerange = None
+    data_start = None
+    if not prepend and data_handler.ohlcv_is_partitioned(pair, timeframe, candle_type):
+        # Partitioned data is appended to - so only the last candles are needed.
+        data_start, data_end, _ = data_handler.ohlcv_data_min_max(pair, timeframe, candle_type)
+        load_timerange = TimeRange(
+            "date", None, int(data_end.timestamp()) - timeframe_to_seconds(timeframe), 0
+        )
+
+    # Intentionally don't pass the download timerange in - since we need the stored dataset.
     data = data_handler.ohlcv_load(
         pair,
         timeframe=timeframe,
-        timerange=None,
+        timerange=load_timerange,
         fill_missing=False,
         drop_incomplete=True,
         warn_no_data=False,
         candle_type=candle_type,
     )
     if not data.empty:
+        data_start = data_start or data.iloc[0]["date"]
         if prepend:
-            end = data.iloc[0]["date"]
+            end = data_start
         else:
-            if start and start < data.iloc[0]["date"]:
+            if start and start < data_start:
                 # Earlier data than existing data requested, Update start date
                 logger.info(
                     f"{pair}, {timeframe}, {candle_type}: "
                     f"Requested start date {start:{DATETIME_PRINT_FORMAT}} earlier than local "
-                    f"data start date {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}. "
+                    f"data start date {data_start:{DATETIME_PRINT_FORMAT}}. "
                     f"Use `--prepend` to download data prior "
-                    f"to {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}, or "
+                    f"to {data_start:{DATETIME_PRINT_FORMAT}}, or "
                     "`--erase` to redownload all data."
                 )
             start = data.iloc[-1]["date"]
@@ -214,6 +258,101 @@ def _load_cached_data_for_updating(
     return data, start_ms, end_ms
 
 
+def _prepare_pair_download(
+    pair: str,
+    *,
+    datadir: Path,
+    timeframe: str,
+    new_pairs_days: int,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+) -> tuple[DataFrame, int, int | None]:
+    """
+    Erase or load existing data before downloading a pair.
+    :return: Tuple of (existing data, since_ms, until_ms) for the download
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair,
+        timeframe,
+        timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend,
+    )
+
+    logger.info(
+        f'Download history data for "{pair}", {timeframe}, '
+        f"{candle_type} and store in {datadir}. "
+        f'From {format_ms_time(since_ms) if since_ms else "start"} to '
+        f'{format_ms_time(until_ms) if until_ms else "now"}'
+    )
+
+    logger.debug(
+        "Current Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "Current End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    # Default since_ms to 30 days if nothing is given
+    if not since_ms:
+        since_ms = int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+    return data, since_ms, until_ms
+
+
+def _store_pair_download(
+    pair: str,
+    *,
+    timeframe: str,
+    data: DataFrame,
+    new_dataframe: DataFrame,
+    data_handler: IDataHandler,
+    candle_type: CandleType,
+    partitioned: bool = False,
+) -> None:
+    """
+    Merge downloaded candles with the existing data and store the result.
+    Partitioned data is appended to instead - only rewriting the months that changed.
+    """
+    logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+    if data_handler.supports_partitions() and (
+        partitioned or data_handler.ohlcv_is_partitioned(pair, timeframe, candle_type)
+    ):
+        data_handler.ohlcv_append(pair, timeframe, new_dataframe, candle_type=candle_type)
+        return
+    if data.empty:
+        data = new_dataframe
+    else:
+        # Run cleaning again to ensure there were no duplicate candles
+        # Especially between existing and new data.
+        data = clean_ohlcv_dataframe(
+            concat([data, new_dataframe], axis=0),
+            timeframe,
+            pair,
+            fill_missing=False,
+            drop_incomplete=False,
+        )
+
+    logger.debug(
+        "New Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "New End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
 def _download_pair_history(
     pair: str,
     *,
@@ -226,6 +365,7 @@ def _download_pair_history(
     candle_type: CandleType,
     erase: bool = False,
     prepend: bool = False,
+    partitioned: bool = False,
 ) -> bool:
     """
     Download latest candles from the exchange for the pair and timeframe passed in parameters
@@ -238,84 +378,213 @@ def _download_pair_history(
     :param timerange: range of time to download
     :param candle_type: Any of the enum CandleType (must match trading mode!)
     :param erase: Erase existing data
+    :param partitioned: Store data as monthly partitions, appending new candles
     :return: bool with success state
     """
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
+        data, since_ms, until_ms = _prepare_pair_download(
             pair,
-            timeframe,
-            timerange,
+            datadir=datadir,
+            timeframe=timeframe,
+            new_pairs_days=new_pairs_days,
             data_handler=data_handler,
+            timerange=timerange,
             candle_type=candle_type,
+            erase=erase,
             prepend=prepend,
         )
 
-        logger.info(
-            f'Download history data for "{pair}", {timeframe}, '
-            f"{candle_type} and store in {datadir}. "
-            f'From {format_ms_time(since_ms) if since_ms else "start"} to '
-            f'{format_ms_time(until_ms) if until_ms else "now"}'
+        new_dataframe = exchange.get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            is_new_pair=data.empty,
+            candle_type=candle_type,
+            until_ms=until_ms if until_ms else None,
         )
-
-        logger.debug(
-            "Current Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+        _store_pair_download(
+            pair,
+            timeframe=timeframe,
+            data=data,
+            new_dataframe=new_dataframe,
+            data_handler=data_handler,
+            candle_type=candle_type,
+            partitioned=partitioned,
         )
-        logger.debug(
-            "Current End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+        return True
+
+    except Exception:
+        logger.exception(
+            f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
         )
+        return False
 
-        # Default since_ms to 30 days if nothing is given
-        new_dataframe = exchange.get_historic_ohlcv(
+
+async def _async_download_pair_history(
+    pair: str,
+    *,
+    datadir: Path,
+    exchange: Exchange,
+    timeframe: str,
+    new_pairs_days: int,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+    partitioned: bool,
+    executor: ThreadPoolExecutor,
+) -> int | None:
+    """
+    Async version of _download_pair_history.
+    Loading and storing data runs in `executor`, so it overlaps with other downloads.
+    :return: Number of downloaded candles - or None if the download failed
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        data, since_ms, until_ms = await loop.run_in_executor(
+            executor,
+            partial(
+                _prepare_pair_download,
+                pair,
+                datadir=datadir,
+                timeframe=timeframe,
+                new_pairs_days=new_pairs_days,
+                data_handler=data_handler,
+                timerange=timerange,
+                candle_type=candle_type,
+                erase=erase,
+                prepend=prepend,
+            ),
+        )
+        new_dataframe = await exchange._async_get_historic_ohlcv_df(
             pair=pair,
             timeframe=timeframe,
-            since_ms=(
-                since_ms
-                if since_ms
-                else int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
-            ),
+            since_ms=since_ms,
             is_new_pair=data.empty,
             candle_type=candle_type,
             until_ms=until_ms if until_ms else None,
         )
-        logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(
-                concat([data, new_dataframe], axis=0),
-                timeframe,
+        await loop.run_in_executor(
+            executor,
+            partial(
+                _store_pair_download,
                 pair,
-                fill_missing=False,
-                drop_incomplete=False,
-            )
-
-        logger.debug(
-            "New Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-        logger.debug(
-            "New End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+                timeframe=timeframe,
+                data=data,
+                new_dataframe=new_dataframe,
+                data_handler=data_handler,
+                candle_type=candle_type,
+                partitioned=partitioned,
+            ),
         )
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
-        return True
+        return len(new_dataframe)
 
     except Exception:
         logger.exception(
             f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
         )
-        return False
+        return None
+
+
+def _download_jobs(
+    exchange: Exchange, pairs: list[str], timeframes: list[str], trading_mode: str
+) -> tuple[list[tuple[str, str, CandleType]], list[str]]:
+    """
+    Pair / timeframe / candle type combinations to download.
+    :return: Tuple of (download jobs, pairs not available)
+    """
+    jobs: list[tuple[str, str, CandleType]] = []
+    pairs_not_available = []
+    candle_type = CandleType.get_default(trading_mode)
+    for pair in pairs:
+        if pair not in exchange.markets:
+            pairs_not_available.append(f"{pair}: Pair not available on exchange.")
+            logger.info(f"Skipping pair {pair}...")
+            continue
+        jobs.extend((pair, str(timeframe), candle_type) for timeframe in timeframes)
+        if trading_mode == "futures":
+            # Predefined candletype (and timeframe) depending on exchange
+            # Downloads what is necessary to backtest based on futures data.
+            tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+            tf_funding_rate = exchange.get_option("funding_fee_timeframe")
+
+            fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+            # All exchanges need FundingRate for futures trading.
+            # The timeframe is aligned to the mark-price timeframe.
+            jobs.append((pair, str(tf_funding_rate), CandleType.FUNDING_RATE))
+            jobs.append((pair, str(tf_mark), fr_candle_type))
+    return jobs, pairs_not_available
+
+
+def _refresh_backtest_ohlcv_data_concurrent(
+    exchange: Exchange,
+    pairs: list[str],
+    timeframes: list[str],
+    datadir: Path,
+    trading_mode: str,
+    timerange: TimeRange | None,
+    new_pairs_days: int,
+    erase: bool,
+    data_handler: IDataHandler,
+    prepend: bool,
+    partitioned: bool,
+    progress_tracker: CustomProgress,
+    workers: int,
+) -> list[str]:
+    """
+    Download all pair / timeframe / candle type combinations on the exchange's event loop,
+    running up to `workers` downloads at the same time.
+    Requests of all downloads share the exchange's rate limit.
+    """
+    jobs, pairs_not_available = _download_jobs(exchange, pairs, timeframes, trading_mode)
+    candles = 0
+
+    async def download_all(progress) -> None:
+        nonlocal candles
+        semaphore = asyncio.Semaphore(workers)
+        task = progress.add_task("Downloading data...", total=len(jobs))
+
+        async def download(pair: str, timeframe: str, candle_type: CandleType) -> None:
+            nonlocal candles
+            async with semaphore:
+                logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
+                res = await _async_download_pair_history(
+                    pair,
+                    datadir=datadir,
+                    exchange=exchange,
+                    timeframe=timeframe,
+                    new_pairs_days=new_pairs_days,
+                    data_handler=data_handler,
+                    timerange=timerange,
+                    candle_type=candle_type,
+                    erase=erase,
+                    prepend=prepend,
+                    partitioned=partitioned,
+                    executor=executor,
+                )
+            candles += res or 0
+            progress.update(
+                task, advance=1, description=f"Downloaded {pair}, {timeframe}, {candle_type}"
+            )
+
+        await asyncio.gather(*(download(*job) for job in jobs))
+
+    start = time.monotonic()
+    with (
+        progress_tracker as progress,
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ft_download") as executor,
+    ):
+        exchange.loop.run_until_complete(download_all(progress))
+    duration = time.monotonic() - start
+    logger.info(
+        f"Downloaded {candles} candles for {len(jobs)} pair / timeframe combinations "
+        f"from {exchange.name} in {duration:.1f}s "
+        f"({candles / duration if duration else 0:.0f} candles/s)."
+    )
+    return pairs_not_available
 
 
 def refresh_backtest_ohlcv_data(
@@ -330,16 +599,38 @@ def refresh_backtest_ohlcv_data(
     data_format: str | None = None,
     prepend: bool = False,
     progress_tracker: CustomProgress | None = None,
+    workers: int = 1,
+    partitioned: bool = False,
 ) -> list[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param workers: Number of pair / timeframe combinations to download concurrently.
+    :param partitioned: Store data as monthly partitions (feather and parquet only).
+        Existing single-file data is migrated on its next update.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
 
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
+    if workers > 1:
+        return _refresh_backtest_ohlcv_data_concurrent(
+            exchange,
+            pairs,
+            timeframes,
+            datadir,
+            trading_mode,
+            timerange,
+            new_pairs_days,
+            erase,
+            data_handler,
+            prepend,
+            partitioned,
+            progress_tracker,
+            workers,
+        )
+
     candle_type = CandleType.get_default(trading_mode)
     with progress_tracker as progress:
         tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
@@ -368,6 +659,7 @@ def refresh_backtest_ohlcv_data(
                     candle_type=candle_type,
                     erase=erase,
                     prepend=prepend,
+                    partitioned=partitioned,
                 )
                 progress.update(timeframe_task, advance=1)
             if trading_mode == "futures":
@@ -393,6 +685,7 @@ def refresh_backtest_ohlcv_data(
                         candle_type=candle_type_f,
                         erase=erase,
                         prepend=prepend,
+                        partitioned=partitioned,
                     )
                     progress.update(
                         timeframe_task, advance=1, description=f"Timeframe {candle_type_f}, {tf}"
@@ -412,10 +705,12 @@ def _download_trades_history(
     timerange: TimeRange | None = None,
     data_handler: IDataHandler,
     trading_mode: TradingMode,
+    partitioned: bool = False,
 ) -> bool:
     """
     Download trade history from the exchange.
     Appends to previously downloaded trades data.
+    Partitioned trades only load and rewrite the last day of stored trades.
     """
     until = None
     since = 0
@@ -425,17 +720,30 @@ def _download_trades_history(
         if timerange.stoptype == "date":
             until = timerange.stopts * 1000
 
-    trades = data_handler.trades_load(pair, trading_mode)
+    append = data_handler.supports_partitions() and (
+        partitioned or data_handler.trades_is_partitioned(pair, trading_mode)
+    )
+    first_date: datetime | None = None
+    if data_handler.trades_is_partitioned(pair, trading_mode):
+        # Only the last trades are needed to continue the download.
+        first_date, last_date, trades_count = data_handler.trades_data_min_max(pair, trading_mode)
+        trades = data_handler.trades_load(
+            pair, trading_mode, timerange=TimeRange("date", None, int(last_date.timestamp()), 0)
+        )
+    else:
+        trades = data_handler.trades_load(pair, trading_mode)
+        trades_count = len(trades)
+        first_date = trades.iloc[0]["date"] if not trades.empty else None
 
     # TradesList columns are defined in constants.DEFAULT_TRADES_COLUMNS
     # DEFAULT_TRADES_COLUMNS: 0 -> timestamp
     # DEFAULT_TRADES_COLUMNS: 1 -> id
 
-    if not trades.empty and since > 0 and since < trades.iloc[0]["timestamp"]:
+    if first_date and not trades.empty and since > 0 and since < dt_ts(first_date):
         # since is before the first trade
         raise ValueError(
             f"Start {format_ms_time(since)} earlier than "
-            f"available data ({trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}). "
+            f"available data ({first_date:{DATETIME_PRINT_FORMAT}}). "
             f"Please use `--erase` if you'd like to redownload {pair}."
         )
 
@@ -454,13 +762,13 @@ def _download_trades_history(
 
     logger.debug(
         "Current Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if not first_date else f"{first_date:{DATETIME_PRINT_FORMAT}}",
     )
     logger.debug(
         "Current End: %s",
         "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
     )
-    logger.info(f"Current Amount of trades: {len(trades)}")
+    logger.info(f"Current Amount of trades: {trades_count}")
 
     # Default since_ms to 30 days if nothing is given
     new_trades = exchange.get_historic_trades(
@@ -470,20 +778,28 @@ def _download_trades_history(
         from_id=from_id,
     )
     new_trades_df = trades_list_to_df(new_trades[1])
-    trades = concat([trades, new_trades_df], axis=0)
-    # Remove duplicates to make sure we're not storing data we don't need
-    trades = trades_df_remove_duplicates(trades)
-    data_handler.trades_store(pair, trades, trading_mode)
+    if append:
+        # Duplicates are removed against the overlapping partitions only.
+        data_handler.trades_append(pair, new_trades_df, trading_mode)
+        new_first, new_last, trades_count = data_handler.trades_data_min_max(pair, trading_mode)
+    else:
+        trades = concat([trades, new_trades_df], axis=0)
+        # Remove duplicates to make sure we're not storing data we don't need
+        trades = trades_df_remove_duplicates(trades)
+        data_handler.trades_store(pair, trades, trading_mode)
+        trades_count = len(trades)
+        if not trades.empty:
+            new_first, new_last = trades.iloc[0]["date"], trades.iloc[-1]["date"]
 
     logger.debug(
         "New Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if not trades_count else f"{new_first:{DATETIME_PRINT_FORMAT}}",
     )
     logger.debug(
         "New End: %s",
-        "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if not trades_count else f"{new_last:{DATETIME_PRINT_FORMAT}}",
     )
-    logger.info(f"New Amount of trades: {len(trades)}")
+    logger.info(f"New Amount of trades: {trades_count}")
     return True
 
 
@@ -497,10 +813,13 @@ def refresh_backtest_trades_data(
     erase: bool = False,
     data_format: str = "feather",
     progress_tracker: CustomProgress | None = None,
+    partitioned: bool = False,
 ) -> list[str]:
     """
     Refresh stored trades data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param partitioned: Store trades as daily partitions (feather and parquet only).
+        Existing single-file trades are migrated on their next update.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
@@ -528,6 +847,7 @@ def refresh_backtest_trades_data(
                     timerange=timerange,
                     data_handler=data_handler,
                     trading_mode=trading_mode,
+                    partitioned=partitioned,
                 )
             except ValueError as e:
                 pairs_not_available.append(f"{pair}: {str(e)}")
@@ -661,6 +981,7 @@ def download_data(
                 data_format=config["dataformat_trades"],
                 trading_mode=config.get("trading_mode", TradingMode.SPOT),
                 progress_tracker=progress_tracker,
+                partitioned=config.get("dataformat_trades_partitioned", False),
             )
 
             if config.get("convert_trades") or not exchange.get_option("ohlcv_has_history", True):
@@ -697,6 +1018,8 @@ def download_data(
                 trading_mode=config.get("trading_mode", "spot"),
                 prepend=config.get("prepend_data", False),
                 progress_tracker=progress_tracker,
+                workers=config.get("download_workers", 1),
+                partitioned=config.get("dataformat_ohlcv_partitioned", False),
             )
     finally:
         if pairs_not_available:
@@ -111,7 +111,7 @@ class Binance(Exchange):
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
-    def get_historic_ohlcv(
+    async def _async_get_historic_ohlcv_df(
         self,
         pair: str,
         timeframe: str,
@@ -126,9 +126,7 @@ class Binance(Exchange):
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
         if is_new_pair:
-            x = self.loop.run_until_complete(
-                self._async_get_candle_history(pair, timeframe, candle_type, 0)
-            )
+            x = await self._async_get_candle_history(pair, timeframe, candle_type, 0)
             if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
                 # Set starting date to first available candle.
                 since_ms = x[3][0][0]
@@ -156,7 +154,7 @@ class Binance(Exchange):
                 )
             )
         ):
-            return super().get_historic_ohlcv(
+            return await super()._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -166,7 +164,7 @@ class Binance(Exchange):
             )
         else:
             # Download from data.binance.vision
-            return self.get_historic_ohlcv_fast(
+            return await self._async_get_historic_ohlcv_fast(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -175,7 +173,7 @@ class Binance(Exchange):
                 until_ms=until_ms,
             )
 
-    def get_historic_ohlcv_fast(
+    async def _async_get_historic_ohlcv_fast(
         self,
         pair: str,
         timeframe: str,
@@ -187,15 +185,13 @@ class Binance(Exchange):
         """
         Fastly fetch OHLCV data by leveraging https://data.binance.vision.
         """
-        df = self.loop.run_until_complete(
-            download_archive_ohlcv(
-                candle_type=candle_type,
-                pair=pair,
-                timeframe=timeframe,
-                since_ms=since_ms,
-                until_ms=until_ms,
-                markets=self.markets,
-            )
+        df = await download_archive_ohlcv(
+            candle_type=candle_type,
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            markets=self.markets,
         )
 
         # download the remaining data from rest API
@@ -208,7 +204,7 @@ class Binance(Exchange):
         if until_ms and rest_since_ms > until_ms:
             rest_df = DataFrame()
         else:
-            rest_df = super().get_historic_ohlcv(
+            rest_df = await super()._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=rest_since_ms,
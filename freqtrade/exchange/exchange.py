@@ -7,6 +7,7 @@ import asyncio
 import inspect
 import logging
 import signal
+import time
 from collections.abc import Coroutine, Generator
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -99,6 +100,7 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.ohlcv_buffer import OHLCVBuffer
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -211,6 +213,8 @@ class Exchange:
 
         # Holds candles
         self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        # Storage behind _klines - updated in place on refresh
+        self._klines_buffers: dict[PairWithTimeframe, OHLCVBuffer] = {}
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
@@ -556,6 +560,26 @@ class Exchange:
             )
         )
 
+    @property
+    def has_candle_close_events(self) -> bool:
+        """
+        Candle close can be awaited via wait_for_candle_close() (requires websockets).
+        """
+        return self._exchange_ws is not None
+
+    def wait_for_candle_close(self, timeout: float) -> bool:
+        """
+        Wait for candles of watched pairs to close - at most `timeout` seconds.
+        Candle closes are detected via websocket - without websocket support,
+        this sleeps for `timeout` seconds.
+        :param timeout: Maximum time to wait, in seconds
+        :return: True if candles closed, False on timeout
+        """
+        if self._exchange_ws:
+            return self._exchange_ws.wait_for_candle_close(timeout)
+        time.sleep(timeout)
+        return False
+
     def klines(self, pair_interval: PairWithTimeframe, copy: bool = True) -> DataFrame:
         if pair_interval in self._klines:
             return self._klines[pair_interval].copy() if copy else self._klines[pair_interval]
@@ -2305,15 +2329,38 @@ class Exchange:
         :param until_ms: Timestamp in milliseconds to get history up to
         :return: Dataframe with candle (OHLCV) data
         """
-        pair, _, _, data, _ = self.loop.run_until_complete(
-            self._async_get_historic_ohlcv(
+        return self.loop.run_until_complete(
+            self._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
-                until_ms=until_ms,
                 candle_type=candle_type,
+                is_new_pair=is_new_pair,
+                until_ms=until_ms,
             )
         )
+
+    async def _async_get_historic_ohlcv_df(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        """
+        Async version of get_historic_ohlcv - allowing multiple downloads to run concurrently
+        on the exchange's event loop.
+        Parameters and return value are the same as for get_historic_ohlcv.
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            candle_type=candle_type,
+        )
         logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
         return ohlcv_to_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
 
@@ -2416,6 +2463,7 @@ class Exchange:
                     f"Time jump detected. Evicting cache for {pair}, {timeframe}, {candle_type}"
                 )
                 del self._klines[(pair, timeframe, candle_type)]
+                self._klines_buffers.pop((pair, timeframe, candle_type), None)
 
         if not since_ms and (self._ft_has["ohlcv_require_since"] or not_all_data):
             # Multiple calls for one pair - to get more history
@@ -2491,8 +2539,14 @@ class Exchange:
             ticks, timeframe, pair=pair, fill_missing=True, drop_incomplete=drop_incomplete
         )
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
+            key = (pair, timeframe, c_type)
+            buffer = self._klines_buffers.get(key)
+            if key in self._klines and buffer is not None and buffer.update(ohlcv_df):
+                # Fast path - new candles continue (or overlap) the cached candles
+                ohlcv_df = buffer.dataframe()
+                self._klines[key] = ohlcv_df
+            elif key in self._klines:
+                old = self._klines[key]
                 # Reassign so we return the updated, combined df
                 ohlcv_df = clean_ohlcv_dataframe(
                     concat([old, ohlcv_df], axis=0),
@@ -2503,11 +2557,13 @@ class Exchange:
                 )
                 candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
                 # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                buffer = OHLCVBuffer(timeframe, candle_limit + self._startup_candle_count)
+                buffer.update(ohlcv_df)
+                ohlcv_df = buffer.dataframe()
+                self._klines_buffers[key] = buffer
+                self._klines[key] = ohlcv_df
             else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                self._klines[key] = ohlcv_df
         return ohlcv_df
 
     def refresh_latest_ohlcv(
@@ -3,13 +3,13 @@ import logging
 import time
 from copy import deepcopy
 from functools import partial
-from threading import Thread
+from threading import Condition, Thread
 
 import ccxt
 
 from freqtrade.constants import Config, PairWithTimeframe
 from freqtrade.enums.candletype import CandleType
-from freqtrade.exchange.exchange import timeframe_to_seconds
+from freqtrade.exchange.exchange import timeframe_to_prev_date, timeframe_to_seconds
 from freqtrade.exchange.exchange_types import OHLCVResponse
 from freqtrade.util import dt_ts, format_ms_time
 
@@ -18,6 +18,10 @@ logger = logging.getLogger(__name__)
 
 
 class ExchangeWS:
+    # Seconds to wait for the remaining watched pairs once the first candle closed.
+    # Pairs receiving their new candle later are refreshed via REST.
+    _candle_close_grace = 2.0
+
     def __init__(self, config: Config, ccxt_object: ccxt.Exchange) -> None:
         self.config = config
         self.ccxt_object = ccxt_object
@@ -27,6 +31,13 @@ class ExchangeWS:
         self._klines_scheduled: set[PairWithTimeframe] = set()
         self.klines_last_refresh: dict[PairWithTimeframe, float] = {}
         self.klines_last_request: dict[PairWithTimeframe, float] = {}
+        # Open date of the latest candle per pair/timeframe - to detect candle close
+        self._klines_last_candle: dict[PairWithTimeframe, int] = {}
+        # Open date of the latest candle which closed per timeframe
+        self._klines_closed_date: dict[str, int] = {}
+        self._klines_closed = Condition()
+        self._klines_closed_count = 0
+        self._klines_closed_seen = 0
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -145,6 +156,7 @@ class ExchangeWS:
                 start = dt_ts()
                 data = await self.ccxt_object.watch_ohlcv(pair, timeframe)
                 self.klines_last_refresh[(pair, timeframe, candle_type)] = dt_ts()
+                self._update_last_candle(pair, timeframe, candle_type)
                 logger.debug(
                     f"watch done {pair}, {timeframe}, data {len(data)} "
                     f"in {dt_ts() - start:.2f}s"
@@ -156,6 +168,57 @@ class ExchangeWS:
         finally:
             self._klines_watching.discard((pair, timeframe, candle_type))
 
+    def _update_last_candle(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
+        """
+        Track the latest candle of a pair/timeframe combination.
+        A new candle means the previous candle closed - the first close of a candle
+        per timeframe wakes up wait_for_candle_close().
+        """
+        candles = self.ccxt_object.ohlcvs.get(pair, {}).get(timeframe)
+        if not candles:
+            return
+        paircomb = (pair, timeframe, candle_type)
+        candle_date = candles[-1][0]
+        with self._klines_closed:
+            last_candle = self._klines_last_candle.get(paircomb)
+            self._klines_last_candle[paircomb] = candle_date
+            if last_candle is not None and candle_date > last_candle:
+                logger.debug(f"Candle closed for {pair}, {timeframe}, {candle_type}.")
+                if candle_date > self._klines_closed_date.get(timeframe, 0):
+                    self._klines_closed_date[timeframe] = candle_date
+                    self._klines_closed_count += 1
+                self._klines_closed.notify_all()
+
+    def _klines_up_to_date(self) -> bool:
+        """
+        All watched pair/timeframe combinations received their current candle.
+        """
+        return all(
+            self._klines_last_candle.get(p, 0) >= timeframe_to_prev_date(p[1]).timestamp() * 1000
+            for p in list(self._klines_watching)
+        )
+
+    def wait_for_candle_close(self, timeout: float) -> bool:
+        """
+        Block until candles closed - or until timeout.
+        Once the first candle closed, the remaining watched pair/timeframe combinations
+        get a short grace period to receive their new candle. Pairs without update
+        (e.g. illiquid pairs) don't delay the wake up - their candles are refreshed via REST.
+        Candles closing while the caller was busy (between calls) are considered, too.
+        :param timeout: Maximum time to wait, in seconds
+        :return: True if woken up by closed candles, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._klines_closed:
+            if not self._klines_closed.wait_for(
+                lambda: self._klines_closed_count > self._klines_closed_seen, timeout
+            ):
+                return False
+            grace = min(self._candle_close_grace, max(deadline - time.monotonic(), 0))
+            self._klines_closed.wait_for(self._klines_up_to_date, grace)
+            self._klines_closed_seen = self._klines_closed_count
+            return True
+
     def schedule_ohlcv(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
         """
         Schedule a pair/timeframe combination to be watched
@@ -0,0 +1,88 @@
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_msecs
+
+
+class OHLCVBuffer:
+    """
+    Fixed capacity, columnar candle store for one pair / timeframe / candle type.
+    Refreshed candles overwrite the overlapping candles in place and new candles are appended,
+    keeping only the last `capacity` candles.
+    Storage is allocated for twice the capacity - so it's only reallocated (and the retained
+    candles moved) once every `capacity` new candles.
+
+    Dataframes returned by `dataframe()` share the price columns with the buffer.
+    Storage is never reused after reallocation - only the overlapping (usually the latest)
+    candles of a previously returned dataframe can change in place.
+    """
+
+    __slots__ = ("capacity", "_step", "_dates", "_values", "_start", "_end")
+
+    def __init__(self, timeframe: str, capacity: int) -> None:
+        self.capacity = capacity
+        self._step = timeframe_to_msecs(timeframe) * 1_000_000
+        self._allocate()
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _allocate(self) -> None:
+        self._dates = np.empty(self.capacity * 2, dtype=np.int64)
+        self._values = np.empty((len(DEFAULT_DATAFRAME_COLUMNS) - 1, self.capacity * 2))
+
+    def update(self, ohlcv: DataFrame) -> bool:
+        """
+        Merge candles into the buffer.
+        :param ohlcv: Cleaned OHLCV dataframe (sorted, without gaps - as returned by
+                      ohlcv_to_dataframe)
+        :return: False if the candles can't be merged without gap filling or regrouping
+                 (they start before, or leave a gap after the buffered candles - or end before
+                 the last buffered candle). The buffer is unchanged in this case.
+        """
+        if ohlcv.empty:
+            return True
+        dates = ohlcv["date"].values.astype("datetime64[ns]").view(np.int64)
+        buffered = self._dates[self._start : self._end]
+        pos = len(buffered)
+        if pos:
+            if dates[-1] < buffered[-1]:
+                return False
+            pos = int(np.searchsorted(buffered, dates[0]))
+            if pos < len(buffered):
+                if buffered[pos] != dates[0]:
+                    return False
+            elif dates[0] - buffered[-1] != self._step:
+                return False
+
+        count = min(len(dates), self.capacity)
+        keep = min(pos, self.capacity - count)
+        write_at = self._start + pos
+        if write_at + count > len(self._dates):
+            # Out of space - move retained candles to the start of new storage
+            dates_old, values_old = self._dates, self._values
+            self._allocate()
+            self._dates[:keep] = dates_old[write_at - keep : write_at]
+            self._values[:, :keep] = values_old[:, write_at - keep : write_at]
+            write_at = keep
+        self._start = write_at - keep
+        self._end = write_at + count
+        self._dates[write_at : self._end] = dates[-count:]
+        self._values[:, write_at : self._end] = (
+            ohlcv[DEFAULT_DATAFRAME_COLUMNS[1:]].to_numpy(dtype=np.float64)[-count:].T
+        )
+        return True
+
+    def dataframe(self) -> DataFrame:
+        """
+        Buffered candles as OHLCV dataframe
+        """
+        data = {
+            "date": to_datetime(self._dates[self._start : self._end], unit="ns", utc=True),
+        }
+        for idx, col in enumerate(DEFAULT_DATAFRAME_COLUMNS[1:]):
+            data[col] = self._values[idx, self._start : self._end]
+        return DataFrame(data, copy=False)
@@ -65,7 +65,7 @@ class FreqaiDataDrawer:
     Juha Nykänen @suikula, Wagner Costa @wagnercosta, Johan Vlugt @Jooopieeert
     """
 
-    def __init__(self, full_path: Path, config: Config):
+    def __init__(self, full_path: Path, config: Config, load_from_disk: bool = True):
         self.config = config
         self.freqai_info = config.get("freqai", {})
         # dictionary holding all pair metadata necessary to load in from disk
@@ -85,10 +85,11 @@ class FreqaiDataDrawer:
         self.pair_dictionary_path = Path(self.full_path / "pair_dictionary.json")
         self.global_metadata_path = Path(self.full_path / "global_metadata.json")
         self.metric_tracker_path = Path(self.full_path / "metric_tracker.json")
-        self.load_drawer_from_disk()
-        self.load_historic_predictions_from_disk()
         self.metric_tracker: dict[str, dict[str, dict[str, list]]] = {}
-        self.load_metric_tracker_from_disk()
+        if load_from_disk:
+            self.load_drawer_from_disk()
+            self.load_historic_predictions_from_disk()
+            self.load_metric_tracker_from_disk()
         self.training_queue: dict[str, int] = {}
         self.history_lock = threading.Lock()
         self.save_lock = threading.Lock()
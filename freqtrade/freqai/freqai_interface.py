@@ -1,8 +1,12 @@
+import copy
 import logging
+import multiprocessing
 import threading
 import time
 from abc import ABC, abstractmethod
 from collections import deque
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
@@ -32,6 +36,10 @@ from freqtrade.strategy.interface import IStrategy
 pd.options.mode.chained_assignment = None
 logger = logging.getLogger(__name__)
 
+# Training of a backtest window in a worker process:
+# future, datakitchen, training timerange, training and backtesting dataframes
+BacktestTraining = tuple[Future, FreqaiDataKitchen, TimeRange, DataFrame, DataFrame]
+
 
 class IFreqaiModel(ABC):
     """
@@ -56,6 +64,10 @@ class IFreqaiModel(ABC):
     Juha Nykänen @suikula, Wagner Costa @wagnercosta, Johan Vlugt @Jooopieeert
     """
 
+    # Set in backtest training worker processes. These only train and predict single
+    # backtest windows - the state on disk is loaded and written by the main process.
+    _backtest_training_worker: bool = False
+
     def __init__(self, config: Config) -> None:
         self.config = config
         self.assert_config(self.config)
@@ -74,7 +86,9 @@ class IFreqaiModel(ABC):
         if self.save_backtest_models:
             logger.info("Backtesting module configured to save all models.")
 
-        self.dd = FreqaiDataDrawer(Path(self.full_path), self.config)
+        self.dd = FreqaiDataDrawer(
+            Path(self.full_path), self.config, load_from_disk=not self._backtest_training_worker
+        )
         # set current candle to arbitrary historical date
         self.current_candle: datetime = datetime.fromtimestamp(637887600, tz=timezone.utc)
         self.dd.current_candle = self.current_candle
@@ -105,7 +119,9 @@ class IFreqaiModel(ABC):
         self.get_corr_dataframes: bool = True
         self._threads: list[threading.Thread] = []
         self._stop_event = threading.Event()
-        self.metadata: dict[str, Any] = self.dd.load_global_metadata_from_disk()
+        self.metadata: dict[str, Any] = (
+            {} if self._backtest_training_worker else self.dd.load_global_metadata_from_disk()
+        )
         self.data_provider: DataProvider | None = None
         self.max_system_threads = max(int(psutil.cpu_count() * 2 - 2), 1)
         self.can_short = True  # overridden in start() with strategy.can_short
@@ -115,7 +131,8 @@ class IFreqaiModel(ABC):
             logger.warning("User tried to use PCA with continual learning. Deactivating PCA.")
         self.activate_tensorboard: bool = self.freqai_info.get("activate_tensorboard", True)
 
-        record_params(config, self.full_path)
+        if not self._backtest_training_worker:
+            record_params(config, self.full_path)
 
     def __getstate__(self):
         """
@@ -289,116 +306,250 @@ class IFreqaiModel(ABC):
         pair = metadata["pair"]
         populate_indicators = True
         check_features = True
-        # Loop enforcing the sliding window training/backtesting paradigm
-        # tr_train is the training time range e.g. 1 historical month
-        # tr_backtest is the backtesting time range e.g. the week directly
-        # following tr_train. Both of these windows slide through the
-        # entire backtest
-        for tr_train, tr_backtest in zip(
-            dk.training_timeranges, dk.backtesting_timeranges, strict=False
-        ):
-            (_, _) = self.dd.get_pair_dict_info(pair)
-            train_it += 1
-            total_trains = len(dk.backtesting_timeranges)
-            self.training_timerange = tr_train
-            len_backtest_df = len(
-                dataframe.loc[
-                    (dataframe["date"] >= tr_backtest.startdt)
-                    & (dataframe["date"] < tr_backtest.stopdt),
-                    :,
-                ]
-            )
+        # Predictions of each window, in order - or the pending training of the window
+        windows: deque[DataFrame | BacktestTraining] = deque()
+        executor = self._backtest_training_executor()
+        # Trainings which may run in worker processes while the next window is prepared
+        max_training = self.freqai_info["backtest_training_workers"] if executor else 0
+        with executor or nullcontext():
+            # Loop enforcing the sliding window training/backtesting paradigm
+            # tr_train is the training time range e.g. 1 historical month
+            # tr_backtest is the backtesting time range e.g. the week directly
+            # following tr_train. Both of these windows slide through the
+            # entire backtest
+            for tr_train, tr_backtest in zip(
+                dk.training_timeranges, dk.backtesting_timeranges, strict=False
+            ):
+                self._append_backtest_predictions(dk, pair, windows, max_training)
+                (_, _) = self.dd.get_pair_dict_info(pair)
+                train_it += 1
+                total_trains = len(dk.backtesting_timeranges)
+                self.training_timerange = tr_train
+                len_backtest_df = len(
+                    dataframe.loc[
+                        (dataframe["date"] >= tr_backtest.startdt)
+                        & (dataframe["date"] < tr_backtest.stopdt),
+                        :,
+                    ]
+                )
 
-            if not self.ensure_data_exists(len_backtest_df, tr_backtest, pair):
-                continue
+                if not self.ensure_data_exists(len_backtest_df, tr_backtest, pair):
+                    continue
 
-            self.log_backtesting_progress(tr_train, pair, train_it, total_trains)
+                self.log_backtesting_progress(tr_train, pair, train_it, total_trains)
 
-            timestamp_model_id = int(tr_train.stopts)
-            if dk.backtest_live_models:
-                timestamp_model_id = int(tr_backtest.startts)
+                timestamp_model_id = int(tr_train.stopts)
+                if dk.backtest_live_models:
+                    timestamp_model_id = int(tr_backtest.startts)
 
-            dk.set_paths(pair, timestamp_model_id)
+                dk.set_paths(pair, timestamp_model_id)
 
-            dk.set_new_model_names(pair, timestamp_model_id)
+                dk.set_new_model_names(pair, timestamp_model_id)
 
-            if dk.check_if_backtest_prediction_is_valid(len_backtest_df):
-                if check_features:
-                    self.dd.load_metadata(dk)
-                    df_fts = self.dk.use_strategy_to_populate_indicators(
-                        strategy, prediction_dataframe=dataframe.tail(1), pair=pair
+                if dk.check_if_backtest_prediction_is_valid(len_backtest_df):
+                    if check_features:
+                        self.dd.load_metadata(dk)
+                        df_fts = self.dk.use_strategy_to_populate_indicators(
+                            strategy, prediction_dataframe=dataframe.tail(1), pair=pair
+                        )
+                        df_fts = dk.remove_special_chars_from_feature_names(df_fts)
+                        dk.find_features(df_fts)
+                        self.check_if_feature_list_matches_strategy(dk)
+                        check_features = False
+                    append_df = dk.get_backtesting_prediction()
+                else:
+                    if populate_indicators:
+                        dataframe = self.dk.use_strategy_to_populate_indicators(
+                            strategy, prediction_dataframe=dataframe, pair=pair
+                        )
+                        populate_indicators = False
+
+                    dataframe_base_train = dataframe.loc[dataframe["date"] < tr_train.stopdt, :]
+                    dataframe_base_train = strategy.set_freqai_targets(
+                        dataframe_base_train, metadata=metadata
                     )
-                    df_fts = dk.remove_special_chars_from_feature_names(df_fts)
-                    dk.find_features(df_fts)
-                    self.check_if_feature_list_matches_strategy(dk)
-                    check_features = False
-                append_df = dk.get_backtesting_prediction()
-                dk.append_predictions(append_df)
-            else:
-                if populate_indicators:
-                    dataframe = self.dk.use_strategy_to_populate_indicators(
-                        strategy, prediction_dataframe=dataframe, pair=pair
+                    dataframe_base_backtest = dataframe.loc[
+                        dataframe["date"] < tr_backtest.stopdt, :
+                    ]
+                    dataframe_base_backtest = strategy.set_freqai_targets(
+                        dataframe_base_backtest, metadata=metadata
                     )
-                    populate_indicators = False
-
-                dataframe_base_train = dataframe.loc[dataframe["date"] < tr_train.stopdt, :]
-                dataframe_base_train = strategy.set_freqai_targets(
-                    dataframe_base_train, metadata=metadata
-                )
-                dataframe_base_backtest = dataframe.loc[dataframe["date"] < tr_backtest.stopdt, :]
-                dataframe_base_backtest = strategy.set_freqai_targets(
-                    dataframe_base_backtest, metadata=metadata
-                )
 
-                tr_train = dk.buffer_timerange(tr_train)
+                    tr_train = dk.buffer_timerange(tr_train)
 
-                dataframe_train = dk.slice_dataframe(tr_train, dataframe_base_train)
-                dataframe_backtest = dk.slice_dataframe(tr_backtest, dataframe_base_backtest)
+                    dataframe_train = dk.slice_dataframe(tr_train, dataframe_base_train)
+                    dataframe_backtest = dk.slice_dataframe(tr_backtest, dataframe_base_backtest)
 
-                dataframe_train = dk.remove_special_chars_from_feature_names(dataframe_train)
-                dataframe_backtest = dk.remove_special_chars_from_feature_names(dataframe_backtest)
-                dk.get_unique_classes_from_labels(dataframe_train)
+                    dataframe_train = dk.remove_special_chars_from_feature_names(dataframe_train)
+                    dataframe_backtest = dk.remove_special_chars_from_feature_names(
+                        dataframe_backtest
+                    )
+                    dk.get_unique_classes_from_labels(dataframe_train)
+
+                    if not self.model_exists(dk):
+                        dk.find_features(dataframe_train)
+                        dk.find_labels(dataframe_train)
+
+                        if executor is not None:
+                            window_dk = self._copy_backtest_window_dk(dk)
+                            try:
+                                future = executor.submit(
+                                    _train_backtest_window,
+                                    window_dk,
+                                    pair,
+                                    dataframe_train,
+                                    dataframe_backtest,
+                                )
+                            except BrokenExecutor:
+                                logger.warning(
+                                    "Backtest training workers stopped unexpectedly. "
+                                    "Training the remaining windows sequentially."
+                                )
+                                executor, max_training = None, 0
+                            else:
+                                windows.append(
+                                    (
+                                        future,
+                                        window_dk,
+                                        tr_train,
+                                        dataframe_train,
+                                        dataframe_backtest,
+                                    )
+                                )
+                                continue
+
+                        model = self._train_backtest_model(dataframe_train, pair, dk)
+                        self._save_backtest_model(model, pair, dk, tr_train)
+                    else:
+                        self.model = self.dd.load_data(pair, dk)
 
-                if not self.model_exists(dk):
-                    dk.find_features(dataframe_train)
-                    dk.find_labels(dataframe_train)
+                    pred_df, do_preds = self.predict(dataframe_backtest, dk)
+                    append_df = dk.get_predictions_to_append(pred_df, do_preds, dataframe_backtest)
+                    dk.save_backtesting_prediction(append_df)
 
-                    try:
-                        self.tb_logger = get_tb_logger(
-                            self.dd.model_type, dk.data_path, self.activate_tensorboard
-                        )
-                        self.model = self.train(dataframe_train, pair, dk)
-                        self.tb_logger.close()
-                    except Exception as msg:
-                        logger.warning(
-                            f"Training {pair} raised exception {msg.__class__.__name__}. "
-                            f"Message: {msg}, skipping.",
-                            exc_info=True,
-                        )
-                        self.model = None
-
-                    self.dd.pair_dict[pair]["trained_timestamp"] = int(tr_train.stopts)
-                    if self.plot_features and self.model is not None:
-                        plot_feature_importance(self.model, pair, dk, self.plot_features)
-                    if self.save_backtest_models and self.model is not None:
-                        logger.info("Saving backtest model to disk.")
-                        self.dd.save_data(self.model, pair, dk)
-                    else:
-                        logger.info("Saving metadata to disk.")
-                        self.dd.save_metadata(dk)
-                else:
-                    self.model = self.dd.load_data(pair, dk)
+                windows.append(append_df)
 
-                pred_df, do_preds = self.predict(dataframe_backtest, dk)
-                append_df = dk.get_predictions_to_append(pred_df, do_preds, dataframe_backtest)
-                dk.append_predictions(append_df)
-                dk.save_backtesting_prediction(append_df)
+            self._append_backtest_predictions(dk, pair, windows, 0)
 
         self.backtesting_fit_live_predictions(dk)
         dk.fill_predictions(dataframe)
 
         return dk
 
+    def _backtest_training_executor(self) -> ProcessPoolExecutor | None:
+        """
+        Process pool to train backtest windows in parallel, if enabled via
+        `backtest_training_workers`. Returns None if windows are trained sequentially.
+        """
+        workers = self.freqai_info.get("backtest_training_workers", 1)
+        if workers <= 1:
+            return None
+        if self.continual_learning or self.dd.model_type != "joblib":
+            logger.warning(
+                "Parallel backtest training requires independent joblib models "
+                "(no continual learning). Deactivating `backtest_training_workers`."
+            )
+            self.freqai_info["backtest_training_workers"] = 1
+            return None
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            # spawn - the backtesting process may run other threads
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_backtest_training_worker,
+            initargs=(self.config,),
+        )
+
+    def _copy_backtest_window_dk(self, dk: FreqaiDataKitchen) -> FreqaiDataKitchen:
+        """
+        Copy of the datakitchen to train one backtest window in a worker process.
+        Predictions of previous windows are not copied.
+        """
+        full_df, dk.full_df = dk.full_df, DataFrame()
+        data_dictionary, dk.data_dictionary = dk.data_dictionary, {}
+        # config is not modified - no need to copy it
+        window_dk = copy.deepcopy(dk, memo={id(dk.config): dk.config})
+        dk.full_df, dk.data_dictionary = full_df, data_dictionary
+        return window_dk
+
+    def _train_backtest_model(
+        self, dataframe_train: DataFrame, pair: str, dk: FreqaiDataKitchen
+    ) -> Any:
+        """
+        Train the model of a backtest window.
+        :return: trained model, None if training failed
+        """
+        try:
+            self.tb_logger = get_tb_logger(
+                self.dd.model_type, dk.data_path, self.activate_tensorboard
+            )
+            model = self.train(dataframe_train, pair, dk)
+            self.tb_logger.close()
+        except Exception as msg:
+            logger.warning(
+                f"Training {pair} raised exception {msg.__class__.__name__}. "
+                f"Message: {msg}, skipping.",
+                exc_info=True,
+            )
+            model = None
+        return model
+
+    def _save_backtest_model(
+        self, model: Any, pair: str, dk: FreqaiDataKitchen, tr_train: TimeRange
+    ) -> None:
+        """
+        Save the model (or only its metadata) of a backtest window to disk.
+        """
+        self.model = model
+        self.dd.pair_dict[pair]["trained_timestamp"] = int(tr_train.stopts)
+        if self.plot_features and model is not None:
+            plot_feature_importance(model, pair, dk, self.plot_features)
+        if self.save_backtest_models and model is not None:
+            logger.info("Saving backtest model to disk.")
+            self.dd.save_data(model, pair, dk)
+        else:
+            logger.info("Saving metadata to disk.")
+            self.dd.save_metadata(dk)
+
+    def _append_backtest_predictions(
+        self,
+        dk: FreqaiDataKitchen,
+        pair: str,
+        windows: deque[DataFrame | BacktestTraining],
+        max_training: int,
+    ) -> None:
+        """
+        Append the predictions of backtest windows in order. Waits for the oldest
+        training until at most `max_training` windows are still training.
+        Windows which failed in a worker process are retrained in this process.
+        :param windows: predictions or pending training of each window, in order
+        """
+        while windows:
+            training = sum(1 for window in windows if isinstance(window, tuple))
+            if isinstance(windows[0], tuple) and training <= max_training:
+                break
+            window = windows.popleft()
+            if isinstance(window, tuple):
+                future, window_dk, tr_train, dataframe_train, dataframe_backtest = window
+                try:
+                    model, window_dk, append_df = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Training {pair} in a backtest training worker failed with "
+                        f"{e.__class__.__name__}: {e}. Retraining the window sequentially."
+                    )
+                    model = self._train_backtest_model(dataframe_train, pair, window_dk)
+                    self._save_backtest_model(model, pair, window_dk, tr_train)
+                    pred_df, do_preds = self.predict(dataframe_backtest, window_dk)
+                    append_df = window_dk.get_predictions_to_append(
+                        pred_df, do_preds, dataframe_backtest
+                    )
+                else:
+                    self._save_backtest_model(model, pair, window_dk, tr_train)
+                window_dk.save_backtesting_prediction(append_df)
+            else:
+                append_df = window
+            dk.append_predictions(append_df)
+
     def start_live(
         self, dataframe: DataFrame, metadata: dict, strategy: IStrategy, dk: FreqaiDataKitchen
     ) -> FreqaiDataKitchen:
@@ -1041,3 +1192,35 @@ class IFreqaiModel(ABC):
             dk.DI_values = np.zeros(outliers.shape[0])
         dk.do_predict = outliers
         return
+
+
+# FreqAI model of a backtest training worker process
+_worker_freqai: IFreqaiModel | None = None
+
+
+def _init_backtest_training_worker(config: Config) -> None:
+    """
+    Load the FreqAI model once per backtest training worker process.
+    The model does not load (or write) the state of the main process on disk.
+    """
+    from freqtrade.resolvers.freqaimodel_resolver import FreqaiModelResolver
+
+    global _worker_freqai
+    IFreqaiModel._backtest_training_worker = True
+    _worker_freqai = FreqaiModelResolver.load_freqaimodel(config)
+    _worker_freqai.live = False
+
+
+def _train_backtest_window(
+    dk: FreqaiDataKitchen, pair: str, dataframe_train: DataFrame, dataframe_backtest: DataFrame
+) -> tuple[Any, FreqaiDataKitchen, DataFrame]:
+    """
+    Train and predict one backtest window in a backtest training worker process.
+    :return: trained model, datakitchen of the window and the predictions to append
+    """
+    if _worker_freqai is None:
+        raise OperationalException("Backtest training worker is not initialized.")
+    freqai = _worker_freqai
+    freqai.model = freqai._train_backtest_model(dataframe_train, pair, dk)
+    pred_df, do_preds = freqai.predict(dataframe_backtest, dk)
+    return freqai.model, dk, dk.get_predictions_to_append(pred_df, do_preds, dataframe_backtest)
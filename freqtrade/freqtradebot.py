@@ -179,11 +179,16 @@ class FreqtradeBot(LoggingMixin):
         self.protections = ProtectionManager(self.config, self.strategy.protections)
 
         def log_took_too_long(duration: float, time_limit: float):
+            slowest = ", ".join(
+                f"{pair} ({pair_duration:.2f}s)"
+                for pair, pair_duration in self.strategy.get_slowest_analyzed_pairs()
+            )
             logger.warning(
                 f"Strategy analysis took {duration:.2f}s, more than 25% of the timeframe "
                 f"({time_limit:.2f}s). This can lead to delayed orders and missed signals."
                 "Consider either reducing the amount of work your strategy performs "
-                "or reduce the amount of pairs in the Pairlist."
+                "or reduce the amount of pairs in the Pairlist. "
+                f"Slowest pairs: {slowest}."
             )
 
         self._measure_execution = MeasureTime(log_took_too_long, timeframe_secs * 0.25)
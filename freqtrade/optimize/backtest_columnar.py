@@ -0,0 +1,133 @@
+"""
+Columnar storage helpers for backtesting.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+from pandas import DataFrame, Timedelta, Timestamp
+
+
+class ColumnarPairData:
+    """
+    Backtest candles of one pair, stored as one NumPy array per column.
+    Rows are only materialized when accessed - and contain the same values as the rows
+    produced by `dataframe.values.tolist()`.
+    """
+
+    __slots__ = ("_columns", "_length", "dates", "enter_long", "enter_short", "consume_steps")
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        """
+        :param dataframe: Dataframe in backtesting HEADERS layout (date column first).
+        """
+        self._length = len(dataframe)
+        self._columns: list = [dataframe["date"].array] + [
+            dataframe[col].to_numpy() for col in dataframe.columns[1:]
+        ]
+        self.dates: np.ndarray = (
+            dataframe["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+            if self._length
+            else np.empty(0, dtype=np.int64)
+        )
+        self.enter_long: np.ndarray = (dataframe["enter_long"] == 1).to_numpy(dtype=bool)
+        self.enter_short: np.ndarray = (dataframe["enter_short"] == 1).to_numpy(dtype=bool)
+        # Backtest step at which each row is processed - see `assign_steps()`.
+        self.consume_steps: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnarPairData index out of range")
+        dates = self._columns[0]
+        return (dates[index], *(col.item(index) for col in self._columns[1:]))
+
+    def assign_steps(self, time_axis: np.ndarray) -> None:
+        """
+        Calculate the backtest step at which each row gets processed.
+        Mirrors the per-candle row pointer of the regular backtest loop:
+        one row per step at most, and only once the row date is reached.
+        :param time_axis: int64 (ns) timestamps of all backtest steps.
+        """
+        steps = np.arange(len(time_axis), dtype=np.int64)
+        # Rows available (row date <= current time) at each step
+        available = np.searchsorted(self.dates, time_axis, side="right")
+        consumed = np.minimum(steps + 1, np.minimum.accumulate(available - steps) + steps)
+        self.consume_steps = np.flatnonzero(np.diff(consumed, prepend=0))
+
+    def row_index_at(self, step: int) -> int:
+        """
+        Get the index of the row processed at step `step`.
+        :return: row index, or -1 if no row is processed for this step.
+        """
+        index = int(np.searchsorted(self.consume_steps, step))
+        if index < len(self.consume_steps) and self.consume_steps[index] == step:
+            return index
+        return -1
+
+    def entry_signal_steps(self, can_short: bool) -> np.ndarray:
+        """
+        Steps at which the processed row contains an entry signal.
+        """
+        mask = self.enter_long | self.enter_short if can_short else self.enter_long
+        return self.consume_steps[mask[: len(self.consume_steps)]]
+
+
+class DetailPairData:
+    """
+    Detail timeframe candles of one pair, stored as NumPy arrays.
+    Allows retrieving the detail candles of one main candle with a binary search
+    on the date column - without filtering or copying the detail DataFrame.
+    """
+
+    __slots__ = ("source", "dates", "_date_array", "_ohlc")
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        # Keep a reference to the source, so stale indexes can be detected.
+        self.source = dataframe
+        self.dates: np.ndarray = (
+            dataframe["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+            if len(dataframe)
+            else np.empty(0, dtype=np.int64)
+        )
+        self._date_array = dataframe["date"].array
+        self._ohlc = [dataframe[col].to_numpy() for col in ("open", "high", "low", "close")]
+
+    def candle_range(self, candle_start: int, candle_end: int) -> tuple[int, int]:
+        """
+        Get the [start, end) range of detail rows within one main candle.
+        :param candle_start: Main candle open date (int64 ns)
+        :param candle_end: Main candle close date (int64 ns), exclusive
+        """
+        start, end = np.searchsorted(self.dates, (candle_start, candle_end), side="left")
+        return int(start), int(end)
+
+    def rows(self, start: int, end: int, signals: tuple) -> list[tuple]:
+        """
+        Build backtest rows (HEADERS layout) for the detail rows in [start, end).
+        :param signals: signal and tag columns of the main candle - appended to every row.
+        """
+        return [
+            (*ohlc_row, *signals)
+            for ohlc_row in zip(
+                self._date_array[start:end],
+                *(col[start:end].tolist() for col in self._ohlc),
+                strict=True,
+            )
+        ]
+
+
+def build_time_axis(start_date: datetime, end_date: datetime, increment: timedelta) -> np.ndarray:
+    """
+    Build the int64 (ns) timestamps the backtest iterates over.
+    Identical to the candles generated by `Backtesting.time_pair_generator()`.
+    """
+    start = Timestamp(start_date + increment).value
+    end = Timestamp(end_date).value
+    if start > end:
+        return np.empty(0, dtype=np.int64)
+    return np.arange(start, end + 1, Timedelta(increment).value, dtype=np.int64)
@@ -6,8 +6,10 @@ This module contains the backtesting logic
 
 import logging
 from collections import defaultdict
+from collections.abc import Hashable, MutableMapping
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
+from itertools import chain
 from typing import Any
 
 from numpy import nan
@@ -41,6 +43,11 @@ from freqtrade.ft_types import BacktestResultType, get_BacktestResultType_defaul
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_columnar import (
+    ColumnarPairData,
+    DetailPairData,
+    build_time_axis,
+)
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -158,6 +165,7 @@ class Backtesting:
             )
         self.timeframe = str(self.config.get("timeframe"))
         self.timeframe_secs = timeframe_to_seconds(self.timeframe)
+        self.dataload_workers: int = self.config.get("dataload_workers", 1)
         self.timeframe_min = self.timeframe_secs // 60
         self.timeframe_td = timedelta(seconds=self.timeframe_secs)
         self.disable_database_use()
@@ -214,6 +222,7 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
+        self.backtest_engine: str = self.config.get("backtest_engine", "default")
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -248,6 +257,7 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
+        self.detail_index: dict[str, DetailPairData] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -295,6 +305,7 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            workers=self.dataload_workers,
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -313,6 +324,16 @@ class Backtesting:
         self.progress.set_new_value(1)
         return data, self.timerange
 
+    def preload_informative_data(self) -> None:
+        """
+        Load the informative pairs of the current strategy concurrently.
+        Otherwise, they're loaded one by one while calculating indicators.
+        """
+        if self.dataload_workers > 1:
+            self.dataprovider.preload_historic_ohlcv(
+                self.strategy.gather_informative_pairs(), self.dataload_workers
+            )
+
     def load_bt_data_detail(self) -> None:
         """
         Loads backtest detail data (smaller timeframe) if necessary.
@@ -327,9 +348,14 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                workers=self.dataload_workers,
             )
+            self.detail_index = {
+                pair: DetailPairData(detail) for pair, detail in self.detail_data.items()
+            }
         else:
             self.detail_data = {}
+            self.detail_index = {}
         if self.trading_mode == TradingMode.FUTURES:
             funding_fee_timeframe: str = self.exchange.get_option("funding_fee_timeframe")
             self.funding_fee_timeframe_secs: int = timeframe_to_seconds(funding_fee_timeframe)
@@ -345,6 +371,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.FUNDING_RATE,
+                workers=self.dataload_workers,
             )
 
             # For simplicity, assign to CandleType.Mark (might contain index candles!)
@@ -357,6 +384,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                workers=self.dataload_workers,
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -409,15 +437,33 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_ohlcv_as_lists(
+        self,
+        processed: dict[str, DataFrame],
+        signal_cache: MutableMapping[Hashable, dict[str, dict]] | None = None,
+        signal_cache_key: Hashable = None,
+    ) -> dict[str, Any]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
+        With the "columnar" backtest engine, data is kept as NumPy columns per pair instead.
 
         Used by backtest() - so keep this optimized for performance.
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
+        :param signal_cache: Optional cache for the generated signals. The caller must make sure
+        that signals are identical for identical `signal_cache_key` values.
+        :param signal_cache_key: Key of the current signals in `signal_cache`.
         """
+        if signal_cache is not None:
+            if cached := signal_cache.get(signal_cache_key):
+                for pair, df_analyzed in cached["analyzed"].items():
+                    self.dataprovider._set_cached_df(
+                        pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+                    )
+                processed.update(cached["processed"])
+                return cached["data"]
+            analyzed: dict[str, DataFrame] = {}
 
         data: dict = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
@@ -436,6 +482,8 @@ class Backtesting:
             self.dataprovider._set_cached_df(
                 pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
             )
+            if signal_cache is not None:
+                analyzed[pair] = df_analyzed
 
             # Trim startup period from analyzed dataframe
             df_analyzed = processed[pair] = pair_data = trim_dataframe(
@@ -461,9 +509,21 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            if self.backtest_engine == "columnar":
+                data[pair] = ColumnarPairData(
+                    df_analyzed[HEADERS] if not df_analyzed.empty else DataFrame(columns=HEADERS)
+                )
+            else:
+                # Convert from Pandas to list for performance reasons
+                # (Looping Pandas is slow.)
+                data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+
+        if signal_cache is not None:
+            signal_cache[signal_cache_key] = {
+                "analyzed": analyzed,
+                "processed": {pair: processed[pair] for pair in data},
+                "data": data,
+            }
         return data
 
     def _get_close_rate(
@@ -1434,7 +1494,155 @@ class Backtesting:
             self.progress.increment()
             current_time += increment
 
-    def backtest(self, processed: dict, start_date: datetime, end_date: datetime) -> dict[str, Any]:
+    def _backtest_candle_start(self, current_time: datetime) -> None:
+        """
+        Called once per candle, before the first pair of this candle is processed.
+        """
+        self.check_abort()
+        # Reset open trade count for this candle
+        # Critical to avoid exceeding max_open_trades in backtesting
+        # when timeframe-detail is used and trades close within the opening candle.
+        LocalTrade.bt_open_open_trade_count_candle = LocalTrade.bt_open_open_trade_count
+        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+            current_time=current_time
+        )
+
+    def _get_detail_rows(self, pair: str, row: tuple) -> list[tuple]:
+        """
+        Get the detail timeframe rows for the main candle `row`.
+        Signals and tags of the main candle are applied to all detail rows.
+        """
+        detail = self.detail_index.get(pair)
+        if detail is None or detail.source is not self.detail_data[pair]:
+            # Detail data was replaced (or not loaded via load_bt_data_detail)
+            detail = self.detail_index[pair] = DetailPairData(self.detail_data[pair])
+        candle_start = row[DATE_IDX].value
+        start, end = detail.candle_range(
+            candle_start, candle_start + self.timeframe_secs * 1_000_000_000
+        )
+        return detail.rows(start, end, row[LONG_IDX:])
+
+    def backtest_pair_candle(
+        self, row: tuple, pair: str, row_index: int, current_time: datetime, end_date: datetime
+    ) -> None:
+        """
+        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
+
+        Process one candle of one pair - spreading out into the detail timeframe if necessary.
+        :param row_index: Number of rows processed for this pair (including this one)
+        """
+        is_last_row = current_time == end_date
+        self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
+        self.dataprovider._set_dataframe_max_date(current_time)
+        trade_dir: LongShort | None = self.check_for_trade_entry(row)
+
+        if (
+            (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
+            and self.timeframe_detail
+            and pair in self.detail_data
+        ):
+            # Spread out into detail timeframe.
+            # Should only happen when we are either in a trade for this pair
+            # or when we got the signal for a new trade.
+            detail_rows = self._get_detail_rows(pair, row)
+            if len(detail_rows) == 0:
+                # Fall back to "regular" data if no detail data was found for this candle
+                self.dataprovider._set_dataframe_max_date(current_time)
+                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                return
+            is_first = True
+            current_time_det = current_time
+            for det_row in detail_rows:
+                self.dataprovider._set_dataframe_max_date(current_time_det)
+                self.backtest_loop(
+                    det_row,
+                    pair,
+                    current_time_det,
+                    trade_dir,
+                    is_first and not is_last_row,
+                )
+                current_time_det += self.timeframe_detail_td
+                is_first = False
+        else:
+            self.dataprovider._set_dataframe_max_date(current_time)
+            self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+
+    def _backtest_columnar(
+        self, data: dict[str, ColumnarPairData], start_date: datetime, end_date: datetime
+    ) -> None:
+        """
+        Columnar backtest engine.
+        Produces the same results as the regular loop, but only processes pairs which either
+        have an open trade or an entry signal on the current candle.
+        Candles without anything to do are skipped in bulk based on the precomputed
+        entry signal arrays.
+        """
+        pairs = list(data.keys())
+        time_axis = build_time_axis(start_date, end_date, self.timeframe_td)
+        # Pairs with an entry signal - per step, in pairlist order
+        signal_pairs: dict[int, list[str]] = defaultdict(list)
+        for pair in pairs:
+            data[pair].assign_steps(time_axis)
+            for step in data[pair].entry_signal_steps(self._can_short).tolist():
+                signal_pairs[step].append(pair)
+
+        self.progress.init_step(
+            BacktestState.BACKTEST, int((end_date - start_date) / self.timeframe_td)
+        )
+        current_time = start_date + self.timeframe_td
+        for step in range(len(time_axis)):
+            if pairs:
+                self._backtest_candle_start(current_time)
+            # Pairs that have open trades should be processed first
+            open_pairs = list(dict.fromkeys([t.pair for t in LocalTrade.bt_trades_open]))
+            processed_pairs = dict.fromkeys(open_pairs + signal_pairs.pop(step, []))
+            for pair in processed_pairs:
+                row_index = data[pair].row_index_at(step)
+                if row_index < 0:
+                    continue
+                self.backtest_pair_candle(
+                    data[pair][row_index], pair, row_index + 1, current_time, end_date
+                )
+
+            self._sync_dataprovider_to_last_pair(
+                data, step, pairs, open_pairs, processed_pairs, current_time
+            )
+            self.progress.increment()
+            current_time += self.timeframe_td
+
+    def _sync_dataprovider_to_last_pair(
+        self,
+        data: dict[str, ColumnarPairData],
+        step: int,
+        pairs: list[str],
+        open_pairs: list[str],
+        processed_pairs: dict[str, None],
+        current_time: datetime,
+    ) -> None:
+        """
+        Leave the dataprovider in the state the regular loop would leave it in -
+        which is the state of the last pair processed for this candle.
+        """
+        open_pairs_set = set(open_pairs)
+        for pair in chain(
+            (p for p in reversed(pairs) if p not in open_pairs_set), reversed(open_pairs)
+        ):
+            row_index = data[pair].row_index_at(step)
+            if row_index < 0:
+                continue
+            if pair not in processed_pairs:
+                self.dataprovider._set_dataframe_max_index(self.required_startup + row_index + 1)
+                self.dataprovider._set_dataframe_max_date(current_time)
+            return
+
+    def backtest(
+        self,
+        processed: dict,
+        start_date: datetime,
+        end_date: datetime,
+        signal_cache: MutableMapping[Hashable, dict[str, dict]] | None = None,
+        signal_cache_key: Hashable = None,
+    ) -> dict[str, Any]:
         """
         Implement backtesting functionality
 
@@ -1446,6 +1654,8 @@ class Backtesting:
         optimize memory usage!
         :param start_date: backtesting timerange start datetime
         :param end_date: backtesting timerange end datetime
+        :param signal_cache: Optional cache to reuse signals across runs (used by hyperopt)
+        :param signal_cache_key: Key identifying the signals of this run in `signal_cache`
         :return: DataFrame with trades (results of backtesting)
         """
         self.prepare_backtest(self.enable_protections)
@@ -1453,79 +1663,28 @@ class Backtesting:
         self.wallets.update()
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
-
-        # Indexes per pair, so some pairs are allowed to have a missing start.
-        indexes: dict = defaultdict(int)
-
-        # Loop timerange and get candle for each pair at that point in time
-        for current_time, pair, is_first_call in self.time_pair_generator(
-            start_date, end_date, self.timeframe_td, list(data.keys())
-        ):
-            if is_first_call:
-                self.check_abort()
-                # Reset open trade count for this candle
-                # Critical to avoid exceeding max_open_trades in backtesting
-                # when timeframe-detail is used and trades close within the opening candle.
-                LocalTrade.bt_open_open_trade_count_candle = LocalTrade.bt_open_open_trade_count
-                strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-                    current_time=current_time
-                )
-            row_index = indexes[pair]
-            row = self.validate_row(data, pair, row_index, current_time)
-            if not row:
-                continue
+        data: dict = self._get_ohlcv_as_lists(processed, signal_cache, signal_cache_key)
 
-            row_index += 1
-            indexes[pair] = row_index
-            is_last_row = current_time == end_date
-            self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
-            self.dataprovider._set_dataframe_max_date(current_time)
-            current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-            trade_dir: LongShort | None = self.check_for_trade_entry(row)
+        if self.backtest_engine == "columnar":
+            self._backtest_columnar(data, start_date, end_date)
+        else:
+            # Indexes per pair, so some pairs are allowed to have a missing start.
+            indexes: dict = defaultdict(int)
 
-            if (
-                (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
-                and self.timeframe_detail
-                and pair in self.detail_data
+            # Loop timerange and get candle for each pair at that point in time
+            for current_time, pair, is_first_call in self.time_pair_generator(
+                start_date, end_date, self.timeframe_td, list(data.keys())
             ):
-                # Spread out into detail timeframe.
-                # Should only happen when we are either in a trade for this pair
-                # or when we got the signal for a new trade.
-                exit_candle_end = current_detail_time + self.timeframe_td
-
-                detail_data = self.detail_data[pair]
-                detail_data = detail_data.loc[
-                    (detail_data["date"] >= current_detail_time)
-                    & (detail_data["date"] < exit_candle_end)
-                ].copy()
-                if len(detail_data) == 0:
-                    # Fall back to "regular" data if no detail data was found for this candle
-                    self.dataprovider._set_dataframe_max_date(current_time)
-                    self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                if is_first_call:
+                    self._backtest_candle_start(current_time)
+                row_index = indexes[pair]
+                row = self.validate_row(data, pair, row_index, current_time)
+                if not row:
                     continue
-                detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-                detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-                detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-                detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-                detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-                detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-                is_first = True
-                current_time_det = current_time
-                for det_row in detail_data[HEADERS].values.tolist():
-                    self.dataprovider._set_dataframe_max_date(current_time_det)
-                    self.backtest_loop(
-                        det_row,
-                        pair,
-                        current_time_det,
-                        trade_dir,
-                        is_first and not is_last_row,
-                    )
-                    current_time_det += self.timeframe_detail_td
-                    is_first = False
-            else:
-                self.dataprovider._set_dataframe_max_date(current_time)
-                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+
+                row_index += 1
+                indexes[pair] = row_index
+                self.backtest_pair_candle(row, pair, row_index, current_time, end_date)
 
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
@@ -1552,6 +1711,7 @@ class Backtesting:
         logger.info(f"Running backtesting for Strategy {strategy_name}")
         backtest_start_time = datetime.now(timezone.utc)
         self._set_strategy(strat)
+        self.preload_informative_data()
 
         # need to reprocess data every time to populate signals
         preprocessed = self.strategy.advise_all_indicators(data)
@@ -7,16 +7,23 @@ This module contains the hyperopt logic
 import logging
 import random
 import sys
+import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from copy import copy
 from datetime import datetime
 from math import ceil
 from multiprocessing import Manager
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import rapidjson
 from joblib import Parallel, cpu_count, delayed, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
+from joblib.externals.loky import get_reusable_executor
 from rich.console import Console
+from rich.progress import TaskID
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
 from freqtrade.enums import HyperoptState
@@ -30,7 +37,13 @@ from freqtrade.optimize.hyperopt_tools import (
     HyperoptTools,
     hyperopt_serializer,
 )
-from freqtrade.util import get_progress_tracker
+from freqtrade.util import CustomProgress, get_progress_tracker
+
+
+# Suppress scikit-learn FutureWarnings from skopt
+with warnings.catch_warnings():
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    from skopt import Optimizer
 
 
 logger = logging.getLogger(__name__)
@@ -60,6 +73,7 @@ class Hyperopt:
         self.config = config
 
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        self.hyperopt_async = self.config.get("hyperopt_async", False)
         HyperoptStateContainer.set_state(HyperoptState.STARTUP)
 
         if self.config.get("hyperopt"):
@@ -75,16 +89,13 @@ class Hyperopt:
             / "hyperopt_results"
             / f"strategy_{strategy}_{time_now}.fthypt"
         )
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
-        )
         self.total_epochs = config.get("epochs", 0)
 
         self.current_best_loss = 100
 
-        self.clean_hyperopt()
-
         self.num_epochs_saved = 0
+        # Hashed points (see `_point_key()`) told to the optimizer.
+        self.evaluated_points: set[tuple] = set()
         self.current_best_epoch: dict[str, Any] | None = None
 
         if HyperoptTools.has_space(self.config, "sell"):
@@ -97,6 +108,7 @@ class Hyperopt:
         self.print_json = self.config.get("print_json", False)
 
         self.hyperopter = HyperOptimizer(self.config)
+        self.clean_hyperopt()
 
     @staticmethod
     def get_lock_filename(config: Config) -> str:
@@ -104,10 +116,10 @@ class Hyperopt:
 
     def clean_hyperopt(self) -> None:
         """
-        Remove hyperopt pickle files to restart hyperopt.
+        Remove hyperopt data store and result files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
-            p = Path(f)
+        self.hyperopter.data_store.cleanup()
+        for p in (self.results_file, HyperoptTools.get_index_filename(self.results_file)):
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
                 p.unlink()
@@ -128,12 +140,25 @@ class Hyperopt:
         Save hyperopt results to file
         Store one line per epoch.
         While not a valid json object - this allows appending easily.
+        A summary of the epoch and the position of its line is appended to the results index.
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
-        with self.results_file.open("a") as f:
-            rapidjson.dump(
+        line = (
+            rapidjson.dumps(
                 epoch,
+                default=hyperopt_serializer,
+                number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
+            )
+            + "\n"
+        ).encode()
+        with self.results_file.open("ab") as f:
+            offset = f.tell()
+            f.write(line)
+        index_entry = HyperoptTools.epoch_index_entry(epoch, offset, len(line))
+        with HyperoptTools.get_index_filename(self.results_file).open("a") as f:
+            rapidjson.dump(
+                index_entry,
                 f,
                 default=hyperopt_serializer,
                 number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
@@ -164,9 +189,7 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
-        """Start optimizer in a parallel way"""
-
+    def _get_optimizer_wrapper(self):
         def optimizer_wrapper(*args, **kwargs):
             # global log queue. This must happen in the file that initializes Parallel
             logging_mp_setup(
@@ -175,15 +198,111 @@ class Hyperopt:
 
             return self.hyperopter.generate_optimizer(*args, **kwargs)
 
+        return optimizer_wrapper
+
+    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
+        """Start optimizer in a parallel way"""
+        optimizer_wrapper = self._get_optimizer_wrapper()
         return parallel(delayed(wrap_non_picklable_objects(optimizer_wrapper))(v) for v in asked)
 
+    def run_optimizer_async(
+        self, jobs: int, start: int, pbar: CustomProgress, task: TaskID
+    ) -> None:
+        """
+        Run the remaining epochs asynchronously.
+        A new epoch is started as soon as a worker is free - instead of waiting for the slowest
+        epoch of a batch. Results are told without refitting the optimizer. Points are asked
+        in batches of `jobs` points - which fits the optimizer once, plus once per asked point
+        (like asking a batch of points in the regular mode). Points which are still being
+        evaluated are accounted for by the optimizer using the "constant liar" strategy.
+        Epochs are numbered in the order they complete.
+        """
+        executor = get_reusable_executor(max_workers=jobs)
+        optimizer_wrapper = self._get_optimizer_wrapper()
+        pending: dict[Future, tuple[list, bool]] = {}
+        # Asked points which are waiting for a free worker.
+        queued: deque[tuple[list, bool]] = deque()
+        current = start
+
+        def submit(n_workers: int) -> None:
+            for _ in range(n_workers):
+                if not queued:
+                    n_points = min(jobs, self.total_epochs - current - len(pending))
+                    if n_points <= 0:
+                        return
+                    asked, is_random = self.get_asked_points(
+                        n_points=n_points, pending=[x for x, _ in pending.values()]
+                    )
+                    queued.extend(zip(asked, is_random, strict=False))
+                x, rand = queued.popleft()
+                pending[executor.submit(optimizer_wrapper, x)] = (x, rand)
+
+        try:
+            submit(jobs)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                results = [(pending.pop(f), f.result()) for f in done]
+                # The optimizer is refitted when asking the next batch of points.
+                self.tell_results(
+                    [x for (x, _), _ in results], [val["loss"] for _, val in results], fit=False
+                )
+
+                for (_, rand), val in results:
+                    # Use human-friendly indexes here (starting from 1)
+                    current += 1
+                    self.evaluate_result(val, current, rand)
+                    pbar.update(task, advance=1)
+                logging_mp_handle(log_queue)
+
+                submit(len(done))
+        finally:
+            for f in pending:
+                f.cancel()
+
     def _set_random_state(self, random_state: int | None) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
 
-    def get_asked_points(self, n_points: int) -> tuple[list[list[Any]], list[bool]]:
+    @staticmethod
+    def _point_key(point: list[Any]) -> tuple:
+        """
+        Hashable representation of a point, used to detect already evaluated points.
+        NumPy scalars are converted to python types - so points returned by `ask()`
+        and `space.rvs()` compare equal.
+        """
+        return tuple(v.item() if isinstance(v, np.generic) else v for v in point)
+
+    def tell_results(self, asked: list[list[Any]], losses: list[float], fit: bool = True) -> None:
+        """
+        Tell evaluated points to the optimizer, and record them as evaluated.
+        :param fit: Refit the optimizer. Can be disabled if the next points are asked
+            with `n_points`, which fits a copy of the optimizer anyway.
+        """
+        self.opt.tell(asked, losses, fit=fit)
+        self.evaluated_points.update(self._point_key(x) for x in asked)
+
+    def _get_constant_liar_optimizer(self, pending: list[list[Any]]) -> Optimizer:
+        """
+        Get a shallow copy of the optimizer, which assumes the maximal loss seen so far
+        for all pending points (same as the "cl_max" strategy of `Optimizer.ask()`) -
+        so new points are not asked close to points which are still being evaluated.
+        The copy is not fitted (`Optimizer.copy()` would fit it) - `ask()` with `n_points`
+        fits a copy of it anyway, before asking the requested points.
+        """
+        opt = copy(self.opt)
+        y_lie = max(self.opt.yi) if self.opt.yi else 0.0
+        opt.Xi = [*self.opt.Xi, *pending]
+        opt.yi = [*self.opt.yi, *[y_lie] * len(pending)]
+        return opt
+
+    def get_asked_points(
+        self, n_points: int, pending: list[list[Any]] | None = None
+    ) -> tuple[list[list[Any]], list[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
 
+        :param pending: Points which are currently evaluated. These will not be returned,
+            and are considered when asking new points.
+
         Steps:
         1. Try to get points using `self.opt.ask` first
         2. Discard the points that have already been evaluated
@@ -193,32 +312,26 @@ class Hyperopt:
         6. Return a list with length truncated at `n_points`
         """
 
-        def unique_list(a_list):
-            new_list = []
-            for item in a_list:
-                if item not in new_list:
-                    new_list.append(item)
-            return new_list
-
+        opt = self._get_constant_liar_optimizer(pending) if pending else self.opt
+        # Pending or already selected points - which must not be returned.
+        skip = {self._point_key(x) for x in pending or []}
         i = 0
         asked_non_tried: list[list[Any]] = []
         is_random_non_tried: list[bool] = []
         while i < 5 and len(asked_non_tried) < n_points:
             if i < 3:
-                self.opt.cache_ = {}
-                asked = unique_list(self.opt.ask(n_points=n_points * 5 if i > 0 else n_points))
-                is_random = [False for _ in range(len(asked))]
+                opt.cache_ = {}
+                asked = opt.ask(n_points=n_points * 5 if i > 0 else n_points)
+                is_random = False
             else:
-                asked = unique_list(self.opt.space.rvs(n_samples=n_points * 5))
-                is_random = [True for _ in range(len(asked))]
-            is_random_non_tried += [
-                rand
-                for x, rand in zip(asked, is_random, strict=False)
-                if x not in self.opt.Xi and x not in asked_non_tried
-            ]
-            asked_non_tried += [
-                x for x in asked if x not in self.opt.Xi and x not in asked_non_tried
-            ]
+                asked = opt.space.rvs(n_samples=n_points * 5)
+                is_random = True
+            for x in asked:
+                key = self._point_key(x)
+                if key not in self.evaluated_points and key not in skip:
+                    skip.add(key)
+                    asked_non_tried.append(x)
+                    is_random_non_tried.append(is_random)
             i += 1
 
         if asked_non_tried:
@@ -227,7 +340,7 @@ class Hyperopt:
                 is_random_non_tried[: min(len(asked_non_tried), n_points)],
             )
         else:
-            return self.opt.ask(n_points=n_points), [False for _ in range(n_points)]
+            return opt.ask(n_points=n_points), [False for _ in range(n_points)]
 
     def evaluate_result(self, val: dict[str, Any], current: int, is_random: bool):
         """
@@ -276,6 +389,7 @@ class Hyperopt:
         self.opt = self.hyperopter.get_optimizer(
             config_jobs, self.random_state, INITIAL_POINTS, SKOPT_MODEL_QUEUE_SIZE
         )
+        self.evaluated_points = set()
         self._setup_logging_mp_workaround()
         try:
             with Parallel(n_jobs=config_jobs) as parallel:
@@ -299,29 +413,32 @@ class Hyperopt:
                         # This allows dataprovider to load it's informative cache.
                         asked, is_random = self.get_asked_points(n_points=1)
                         f_val0 = self.hyperopter.generate_optimizer(asked[0])
-                        self.opt.tell(asked, [f_val0["loss"]])
+                        self.tell_results(asked, [f_val0["loss"]])
                         self.evaluate_result(f_val0, 1, is_random[0])
                         pbar.update(task, advance=1)
                         start += 1
 
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v["loss"] for v in f_val])
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        logging_mp_handle(log_queue)
+                    if self.hyperopt_async and jobs > 1:
+                        self.run_optimizer_async(jobs, start, pbar, task)
+                    else:
+                        evals = ceil((self.total_epochs - start) / jobs)
+                        for i in range(evals):
+                            # Correct the number of epochs to be processed for the last
+                            # iteration (should not exceed self.total_epochs in total)
+                            n_rest = (i + 1) * jobs - (self.total_epochs - start)
+                            current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                            asked, is_random = self.get_asked_points(n_points=current_jobs)
+                            f_val = self.run_optimizer_parallel(parallel, asked)
+                            self.tell_results(asked, [v["loss"] for v in f_val])
+
+                            for j, val in enumerate(f_val):
+                                # Use human-friendly indexes here (starting from 1)
+                                current = i * jobs + j + 1 + start
+
+                                self.evaluate_result(val, current, is_random[j])
+                                pbar.update(task, advance=1)
+                            logging_mp_handle(log_queue)
 
         except KeyboardInterrupt:
             print("User interrupted..")
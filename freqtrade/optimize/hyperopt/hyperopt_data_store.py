@@ -0,0 +1,128 @@
+"""
+Memory-mapped store for the processed hyperopt data.
+The data is written once by the main process - worker processes attach to it
+once and keep the mapping for all following epochs.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import rapidjson
+from joblib import dump, load
+from pandas import DataFrame
+
+from freqtrade.misc import file_dump_json
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+# Data attached by this process, keyed by store id.
+_attached_data: dict[str, dict[str, DataFrame]] = {}
+
+
+class HyperoptDataStore:
+    """
+    Stores the (analyzed) hyperopt dataframes in a directory.
+    All float64 columns of a pair are stored as one 2D NumPy array, which is memory-mapped
+    by the workers - so all processes share the same pages.
+    Remaining columns (dates, tags, ...) are small, and are stored with joblib.
+
+    This class is pickled and sent to the hyperopt workers - so keep it small.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.store_id: str | None = None
+
+    def store(self, data: dict[str, DataFrame]) -> None:
+        """
+        Write data to the store - replacing prior content.
+        """
+        self.cleanup()
+        self.directory.mkdir(parents=True)
+        self.store_id = uuid4().hex
+        pairs = {}
+        for idx, (pair, df) in enumerate(data.items()):
+            float_columns = [col for col, dtype in df.dtypes.items() if dtype == np.float64]
+            np.save(
+                self.directory / f"{idx}_float.npy",
+                np.ascontiguousarray(df[float_columns].to_numpy(dtype=np.float64).T),
+            )
+            dump(
+                df[[col for col in df.columns if col not in float_columns]],
+                self.directory / f"{idx}_other.pkl",
+            )
+            pairs[pair] = {
+                "file_prefix": str(idx),
+                "rows": len(df),
+                "columns": list(df.columns),
+                "float_columns": float_columns,
+            }
+
+        file_dump_json(
+            self.directory / MANIFEST_FILE,
+            {"store_id": self.store_id, "pairs": pairs},
+            log=False,
+        )
+        logger.info(f"Stored hyperopt data for {len(pairs)} pairs in `{self.directory}`.")
+
+    def load(self) -> dict[str, DataFrame]:
+        """
+        Get the stored data.
+        Data is attached once per process - every call returns copies, so modifications by
+        the strategy don't leak into the next epoch.
+        Float columns are shared read-only memory-maps, all other columns are copied.
+        """
+        if self.store_id not in _attached_data:
+            _attached_data.clear()
+            _attached_data[str(self.store_id)] = self._attach()
+        return {
+            pair: self._copy_dataframe(df)
+            for pair, df in _attached_data[str(self.store_id)].items()
+        }
+
+    @staticmethod
+    def _copy_dataframe(df: DataFrame) -> DataFrame:
+        res = df.copy(deep=False)
+        for col in df.columns[df.dtypes != np.float64]:
+            res[col] = df[col].copy()
+        return res
+
+    def _attach(self) -> dict[str, DataFrame]:
+        with (self.directory / MANIFEST_FILE).open("r") as f:
+            manifest = rapidjson.load(f)
+        if manifest["store_id"] != self.store_id:
+            raise ValueError(f"Hyperopt data in `{self.directory}` was replaced.")
+
+        data = {}
+        for pair, pair_manifest in manifest["pairs"].items():
+            prefix = pair_manifest["file_prefix"]
+            float_columns = pair_manifest["float_columns"]
+            other: DataFrame = load(self.directory / f"{prefix}_other.pkl")
+            # Empty arrays can't be memory-mapped.
+            floats = np.load(
+                self.directory / f"{prefix}_float.npy",
+                mmap_mode="r" if float_columns and pair_manifest["rows"] else None,
+            )
+
+            df = DataFrame(floats.T, columns=float_columns, index=other.index, copy=False)
+            # Restore original column order
+            for pos, col in enumerate(pair_manifest["columns"]):
+                if col not in float_columns:
+                    df.insert(pos, col, other[col])
+            data[pair] = df
+        return data
+
+    def cleanup(self) -> None:
+        """
+        Remove the store from disk.
+        """
+        _attached_data.pop(str(self.store_id), None)
+        if self.directory.is_dir():
+            logger.info(f"Removing `{self.directory}`.")
+            shutil.rmtree(self.directory)
@@ -9,7 +9,7 @@ import warnings
 from datetime import datetime, timezone
 from typing import Any
 
-from joblib import dump, load
+from cachetools import LRUCache
 from joblib.externals import cloudpickle
 from pandas import DataFrame
 
@@ -24,6 +24,7 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data_store import HyperoptDataStore
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
@@ -42,6 +43,11 @@ logger = logging.getLogger(__name__)
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Signals generated by this process for the current data store.
+# Only a single entry is kept, as signals are only reused while the buy and sell
+# spaces are not optimized - in which case they are identical for all epochs.
+_signal_cache: LRUCache = LRUCache(maxsize=1)
+
 
 class HyperOptimizer:
     """
@@ -85,8 +91,8 @@ class HyperOptimizer:
         )
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+        self.data_store = HyperoptDataStore(
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
         )
 
         self.market_change = 0.0
@@ -137,6 +143,18 @@ class HyperOptimizer:
         # and the values are taken from the list of parameters.
         return {d.name: v for d, v in zip(dimensions, raw_params, strict=False)}
 
+    def _get_signal_cache_key(self) -> tuple | None:
+        """
+        Get the signal cache key for this epoch.
+        Entry and exit signals only depend on the buy and sell space parameters - if these
+        are not optimized, signals are identical for all epochs and can be reused.
+        :return: cache key, or None if signals must be recalculated.
+        """
+        if self.analyze_per_epoch or self.buy_space or self.sell_space:
+            # Signals change between epochs.
+            return None
+        return (self.data_store.store_id,)
+
     def _get_params_details(self, params: dict) -> dict:
         """
         Return the params for each space
@@ -300,14 +318,18 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        processed = self.data_store.load()
+        if self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(processed)
 
+        signal_cache_key = self._get_signal_cache_key()
         bt_results = self.backtesting.backtest(
-            processed=processed, start_date=self.min_date, end_date=self.max_date
+            processed=processed,
+            start_date=self.min_date,
+            end_date=self.max_date,
+            signal_cache=_signal_cache if signal_cache_key else None,
+            signal_cache_key=signal_cache_key,
         )
         backtest_end_time = datetime.now(timezone.utc)
         bt_results.update(
@@ -405,6 +427,7 @@ class HyperOptimizer:
         )
 
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        self.backtesting.preload_informative_data()
         preprocessed = self.backtesting.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
@@ -436,6 +459,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            self.data_store.store(preprocessed)
         else:
-            dump(data, self.data_pickle_file)
+            self.data_store.store(data)
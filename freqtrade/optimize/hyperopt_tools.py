@@ -22,6 +22,25 @@ NON_OPT_PARAM_APPENDIX = "  # value loaded from strategy"
 
 HYPER_PARAMS_FILE_FORMAT = rapidjson.NM_NATIVE | rapidjson.NM_NAN
 
+# Epoch values stored in the results index - used for listing and filtering epochs.
+HYPEROPT_INDEX_KEYS = ("loss", "is_best", "is_initial_point", "is_random", "current_epoch")
+HYPEROPT_INDEX_METRICS = (
+    "total_trades",
+    "wins",
+    "draws",
+    "losses",
+    "profit_mean",
+    "profit_median",
+    "profit_total",
+    "profit_total_abs",
+    "holding_avg",
+    "holding_avg_s",
+    "max_drawdown_abs",
+    "max_drawdown_account",
+    "trade_count_long",
+    "trade_count_short",
+)
+
 
 def hyperopt_serializer(x):
     if isinstance(x, np.integer):
@@ -130,6 +149,69 @@ class HyperoptTools:
                     data = []
         yield data
 
+    @staticmethod
+    def get_index_filename(results_file: Path) -> Path:
+        """
+        Filename of the epoch index belonging to a hyperopt results file
+        """
+        return results_file.with_name(f"{results_file.name}.idx")
+
+    @staticmethod
+    def epoch_index_entry(epoch: dict[str, Any], offset: int, length: int) -> dict[str, Any]:
+        """
+        Reduce an epoch to the values needed to list and filter epochs.
+        :param offset: Position of the epoch's record in the results file (in bytes)
+        :param length: Length of the epoch's record (in bytes)
+        """
+        entry = {key: epoch[key] for key in HYPEROPT_INDEX_KEYS if key in epoch}
+        metrics = epoch.get("results_metrics", {})
+        entry["results_metrics"] = {
+            key: metrics[key] for key in HYPEROPT_INDEX_METRICS if key in metrics
+        }
+        entry["results_offset"] = offset
+        entry["results_length"] = length
+        return entry
+
+    @staticmethod
+    def _read_index(results_file: Path) -> list[dict[str, Any]] | None:
+        """
+        Read the epoch index of a results file.
+        :return: List of index entries - or None if there's no index matching the results file
+        """
+        index_file = HyperoptTools.get_index_filename(results_file)
+        if not index_file.is_file():
+            return None
+        try:
+            with index_file.open("r") as f:
+                entries = [rapidjson.loads(line) for line in f]
+        except ValueError:
+            entries = []
+        if (
+            not entries
+            or entries[-1]["results_offset"] + entries[-1]["results_length"]
+            != results_file.stat().st_size
+        ):
+            logger.info(f"Index '{index_file}' is outdated, reading all epochs.")
+            return None
+        return entries
+
+    @staticmethod
+    def load_epochs(results_file: Path, epochs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Load the full results of epochs returned by `load_filtered_results(summary=True)`.
+        Epochs loaded without index are already complete and returned unchanged.
+        """
+        if not any("results_offset" in epoch for epoch in epochs):
+            return epochs
+        result = []
+        with results_file.open("rb") as f:
+            for epoch in epochs:
+                if "results_offset" in epoch:
+                    f.seek(epoch["results_offset"])
+                    epoch = rapidjson.loads(f.read(epoch["results_length"]))
+                result.append(epoch)
+        return result
+
     @staticmethod
     def _test_hyperopt_results_exist(results_file) -> bool:
         if results_file.is_file() and results_file.stat().st_size > 0:
@@ -144,7 +226,17 @@ class HyperoptTools:
             return False
 
     @staticmethod
-    def load_filtered_results(results_file: Path, config: Config) -> tuple[list, int]:
+    def load_filtered_results(
+        results_file: Path, config: Config, summary: bool = False
+    ) -> tuple[list, int]:
+        """
+        Load and filter epochs of a results file.
+        Epochs are filtered based on the results index if available - reading only the
+        matching epochs from the results file.
+        :param summary: Only return the values stored in the index (if available).
+                        Use `load_epochs()` to load the full results of these epochs.
+        :return: Tuple of (filtered epochs, total number of epochs)
+        """
         filteroptions = {
             "only_best": config.get("hyperopt_list_best", False),
             "only_profitable": config.get("hyperopt_list_profitable", False),
@@ -164,6 +256,14 @@ class HyperoptTools:
             logger.warning(f"Hyperopt file {results_file} not found.")
             return [], 0
 
+        index = HyperoptTools._read_index(results_file)
+        if index is not None:
+            logger.info(f"Loaded {len(index)} previous evaluations from index.")
+            epochs = hyperopt_filter_epochs(index, filteroptions, log=True)
+            if not summary:
+                epochs = HyperoptTools.load_epochs(results_file, epochs)
+            return epochs, len(index)
+
         epochs = []
         total_epochs = 0
         for epochs_tmp in HyperoptTools._read_results(results_file):
@@ -1,4 +1,5 @@
 import logging
+from bisect import bisect_left, insort
 from collections.abc import Sequence
 from datetime import datetime, timezone
 
@@ -11,6 +12,10 @@ from freqtrade.persistence.models import PairLock
 logger = logging.getLogger(__name__)
 
 
+def _lock_end_time(lock: PairLock) -> datetime:
+    return lock.lock_end_time
+
+
 class PairLocks:
     """
     Pairlocks middleware class
@@ -20,6 +25,9 @@ class PairLocks:
 
     use_db = True
     locks: list[PairLock] = []
+    # Backtesting only: locks per pair (including "*"), sorted by lock_end_time.
+    # Allows skipping expired locks with a binary search.
+    locks_by_pair: dict[str, list[PairLock]] = {}
 
     timeframe: str = ""
 
@@ -30,6 +38,7 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks.locks_by_pair = {}
 
     @staticmethod
     def lock_pair(
@@ -63,6 +72,7 @@ class PairLocks:
             PairLock.session.commit()
         else:
             PairLocks.locks.append(lock)
+            insort(PairLocks.locks_by_pair.setdefault(pair, []), lock, key=_lock_end_time)
         return lock
 
     @staticmethod
@@ -80,18 +90,27 @@ class PairLocks:
 
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
-        else:
-            locks = [
+        elif pair is None:
+            return [
                 lock
                 for lock in PairLocks.locks
                 if (
                     lock.lock_end_time >= now
                     and lock.active is True
-                    and (pair is None or lock.pair == pair)
                     and (lock.side == "*" or lock.side == side)
                 )
             ]
-            return locks
+        else:
+            pair_locks = PairLocks.locks_by_pair.get(pair)
+            if not pair_locks:
+                return []
+            # Expired locks are at the start of the sorted list.
+            start = bisect_left(pair_locks, now, key=_lock_end_time)
+            return [
+                lock
+                for lock in pair_locks[start:]
+                if lock.active is True and (lock.side == "*" or lock.side == side)
+            ]
 
     @staticmethod
     def get_pair_longest_lock(
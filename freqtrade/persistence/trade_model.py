@@ -19,6 +19,7 @@ from sqlalchemy import (
     Select,
     String,
     UniqueConstraint,
+    case,
     desc,
     func,
     select,
@@ -48,6 +49,7 @@ from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
 from freqtrade.persistence.custom_data import CustomDataWrapper, _CustomData
+from freqtrade.persistence.trade_stats import ClosedTradeStats
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 
 
@@ -393,6 +395,8 @@ class LocalTrade:
     bt_open_open_trade_count: int = 0
     bt_open_open_trade_count_candle: int = 0
     bt_total_profit: float = 0
+    # Closed trades sorted by close date - per pair, and for all pairs ("*")
+    bt_closed_stats: dict[str, ClosedTradeStats] = defaultdict(ClosedTradeStats)
     realized_profit: float = 0
 
     id: int = 0
@@ -762,6 +766,7 @@ class LocalTrade:
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_open_open_trade_count_candle = 0
         LocalTrade.bt_total_profit = 0
+        LocalTrade.bt_closed_stats = defaultdict(ClosedTradeStats)
 
     def adjust_min_max_rates(self, current_price: float, current_price_low: float) -> None:
         """
@@ -1430,6 +1435,15 @@ class LocalTrade:
         """
 
         # Offline mode - without database
+        if is_open is False and close_date:
+            # Closed trades within a lookback window (protections) - use the sorted index.
+            sel_trades = LocalTrade.get_closed_trade_stats(pair, close_date).trades_since(
+                close_date
+            )
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
@@ -1451,6 +1465,22 @@ class LocalTrade:
 
         return sel_trades
 
+    @staticmethod
+    def get_closed_trade_stats(pair: str | None, close_date: datetime) -> ClosedTradeStats:
+        """
+        Get closed trades, sorted by close date.
+        Contains at least all trades closed after close_date (filters via trade.close_date > input)
+        - callers should use the `*_since(close_date)` methods to query it.
+        :param pair: Filter by pair - all pairs if None
+        :param close_date: Start of the lookback window
+        """
+        return LocalTrade.bt_closed_stats.get(pair or "*") or ClosedTradeStats()
+
+    @staticmethod
+    def _add_bt_closed_stats(trade: "LocalTrade") -> None:
+        LocalTrade.bt_closed_stats["*"].add(trade)
+        LocalTrade.bt_closed_stats[trade.pair].add(trade)
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.bt_trades_open.remove(trade)
@@ -1462,6 +1492,7 @@ class LocalTrade:
             # Must be reset at the start of every candle during backesting.
             LocalTrade.bt_open_open_trade_count_candle -= 1
         LocalTrade.bt_trades.append(trade)
+        LocalTrade._add_bt_closed_stats(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
 
     @staticmethod
@@ -1473,6 +1504,7 @@ class LocalTrade:
             LocalTrade.bt_open_open_trade_count_candle += 1
         else:
             LocalTrade.bt_trades.append(trade)
+            LocalTrade._add_bt_closed_stats(trade)
 
     @staticmethod
     def remove_bt_trade(trade):
@@ -1808,6 +1840,21 @@ class Trade(ModelBase, LocalTrade):
                 pair=pair, is_open=is_open, open_date=open_date, close_date=close_date
             )
 
+    @staticmethod
+    def get_closed_trade_stats(pair: str | None, close_date: datetime) -> ClosedTradeStats:
+        """
+        Get closed trades (filters via trade.close_date > input), sorted by close date.
+        Queries the database in live mode.
+        :param pair: Filter by pair - all pairs if None
+        :param close_date: Start of the lookback window
+        """
+        if Trade.use_db:
+            return ClosedTradeStats(
+                Trade.get_trades_proxy(pair=pair, is_open=False, close_date=close_date)
+            )
+        else:
+            return LocalTrade.get_closed_trade_stats(pair, close_date)
+
     @staticmethod
     def get_trades_query(trade_filter=None, include_orders: bool = True) -> Select:
         """
@@ -2024,51 +2071,30 @@ class Trade(ModelBase, LocalTrade):
         filters: list = [Trade.is_open.is_(False)]
         if pair is not None:
             filters.append(Trade.pair == pair)
+        # Grouped by label - so databases see the same (parametrized) expression
         mix_tag_perf = Trade.session.execute(
             select(
-                Trade.id,
-                Trade.enter_tag,
-                Trade.exit_reason,
+                func.coalesce(Trade.enter_tag, "Other").label("mix_enter_tag"),
+                func.coalesce(Trade.exit_reason, "Other").label("mix_exit_reason"),
                 func.sum(Trade.close_profit).label("profit_sum"),
                 func.sum(Trade.close_profit_abs).label("profit_sum_abs"),
                 func.count(Trade.pair).label("count"),
             )
             .filter(*filters)
-            .group_by(Trade.id)
+            .group_by("mix_enter_tag", "mix_exit_reason")
             .order_by(desc("profit_sum_abs"))
         ).all()
 
-        resp: list[dict] = []
-        for _, enter_tag, exit_reason, profit, profit_abs, count in mix_tag_perf:
-            enter_tag = enter_tag if enter_tag is not None else "Other"
-            exit_reason = exit_reason if exit_reason is not None else "Other"
-
-            if exit_reason is not None and enter_tag is not None:
-                mix_tag = enter_tag + " " + exit_reason
-                i = 0
-                if not any(item["mix_tag"] == mix_tag for item in resp):
-                    resp.append(
-                        {
-                            "mix_tag": mix_tag,
-                            "profit_ratio": profit,
-                            "profit_pct": round(profit * 100, 2),
-                            "profit_abs": profit_abs,
-                            "count": count,
-                        }
-                    )
-                else:
-                    while i < len(resp):
-                        if resp[i]["mix_tag"] == mix_tag:
-                            resp[i] = {
-                                "mix_tag": mix_tag,
-                                "profit_ratio": profit + resp[i]["profit_ratio"],
-                                "profit_pct": round(profit + resp[i]["profit_ratio"] * 100, 2),
-                                "profit_abs": profit_abs + resp[i]["profit_abs"],
-                                "count": 1 + resp[i]["count"],
-                            }
-                        i += 1
-
-        return resp
+        return [
+            {
+                "mix_tag": f"{enter_tag} {exit_reason}",
+                "profit_ratio": profit,
+                "profit_pct": round(profit * 100, 2),
+                "profit_abs": profit_abs,
+                "count": count,
+            }
+            for enter_tag, exit_reason, profit, profit_abs, count in mix_tag_perf
+        ]
 
     @staticmethod
     def get_best_pair(start_date: datetime | None = None):
@@ -2090,6 +2116,36 @@ class Trade(ModelBase, LocalTrade):
 
         return best_pair
 
+    @staticmethod
+    def get_closed_profit_summary(start_date: datetime | None = None) -> dict[str, Any]:
+        """
+        Aggregated profit statistics of closed trades - calculated by the database.
+        Trades without close_profit are counted as winning trades with 0 profit.
+        NOTE: Not supported in Backtesting.
+        :returns: Dict with trade_count, profit_abs, profit_ratio (sums),
+            winning_trades, winning_profit, losing_trades and losing_profit
+        """
+        filters: list = [Trade.is_open.is_(False)]
+        if start_date:
+            filters.append(Trade.close_date >= start_date)
+
+        profit_ratio = func.coalesce(Trade.close_profit, 0.0)
+        profit_abs = func.coalesce(Trade.close_profit_abs, 0.0)
+        is_win = profit_ratio >= 0
+        is_loss = profit_ratio < 0
+        summary = Trade.session.execute(
+            select(
+                func.count(Trade.id).label("trade_count"),
+                func.coalesce(func.sum(profit_abs), 0.0).label("profit_abs"),
+                func.coalesce(func.sum(profit_ratio), 0.0).label("profit_ratio"),
+                func.count(case((is_win, 1))).label("winning_trades"),
+                func.coalesce(func.sum(case((is_win, profit_abs))), 0.0).label("winning_profit"),
+                func.count(case((is_loss, 1))).label("losing_trades"),
+                func.coalesce(func.sum(case((is_loss, profit_abs))), 0.0).label("losing_profit"),
+            ).filter(*filters)
+        ).one()
+        return summary._asdict()
+
     @staticmethod
     def get_trading_volume(start_date: datetime | None = None) -> float:
         """
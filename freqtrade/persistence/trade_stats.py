@@ -0,0 +1,67 @@
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+
+if TYPE_CHECKING:
+    from freqtrade.persistence.trade_model import LocalTrade
+
+
+class ClosedTradeStats:
+    """
+    Closed trades sorted by close date.
+    Trades (and profit statistics) of a lookback window are found via binary search,
+    instead of filtering all trades.
+    """
+
+    __slots__ = ("trades", "_close_ts", "_profits")
+
+    def __init__(self, trades: Iterable["LocalTrade"] = ()) -> None:
+        self.trades: list[LocalTrade] = []
+        self._close_ts: list[float] = []
+        self._profits: list[float] = []
+        for trade in sorted(trades, key=lambda t: t.close_date_utc):
+            self.add(trade)
+
+    def __len__(self) -> int:
+        return len(self.trades)
+
+    def add(self, trade: "LocalTrade") -> None:
+        """
+        Add a closed trade.
+        Trades are usually added in close date order, which makes this an append.
+        """
+        close_ts = trade.close_date_utc.timestamp()
+        idx = bisect_right(self._close_ts, close_ts)
+        self.trades.insert(idx, trade)
+        self._close_ts.insert(idx, close_ts)
+        self._profits.insert(idx, trade.close_profit or 0.0)
+
+    def _start(self, since: datetime) -> int:
+        return bisect_right(self._close_ts, since.timestamp())
+
+    def trades_since(self, since: datetime) -> list["LocalTrade"]:
+        """
+        Trades closed after `since`, sorted by close date.
+        """
+        return self.trades[self._start(since) :]
+
+    def profit_since(self, since: datetime) -> float:
+        """
+        Sum of close_profit of all trades closed after `since`.
+        """
+        return sum(self._profits[self._start(since) :])
+
+    def max_drawdown_since(self, since: datetime) -> float:
+        """
+        Max drawdown (based on close_profit) of all trades closed after `since`.
+        Same as `calculate_max_drawdown(trades, value_col="close_profit").drawdown_abs`
+        for these trades - but returns 0.0 instead of raising if there's no drawdown.
+        """
+        cumulative = np.cumsum(self._profits[self._start(since) :])
+        if len(cumulative) == 0:
+            return 0.0
+        return float(np.max(np.maximum.accumulate(cumulative) - cumulative))
@@ -53,17 +53,21 @@ class LowProfitPairs(IProtection):
         # if pair:
         #     filters.append(Trade.pair == pair)
 
-        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
+        trade_stats = Trade.get_closed_trade_stats(pair, close_date=look_back_until)
+        trades = trade_stats.trades_since(look_back_until)
         # trades = Trade.get_trades(filters).all()
         if len(trades) < self._trade_limit:
             # Not enough trades in the relevant period
             return None
 
-        profit = sum(
-            trade.close_profit
-            for trade in trades
-            if trade.close_profit and (not self._only_per_side or trade.trade_direction == side)
-        )
+        if self._only_per_side:
+            profit = sum(
+                trade.close_profit
+                for trade in trades
+                if trade.close_profit and trade.trade_direction == side
+            )
+        else:
+            profit = trade_stats.profit_since(look_back_until)
         if profit < self._required_profit:
             self.log_once(
                 f"Trading for {pair} stopped due to {profit:.2f} < {self._required_profit} "
@@ -2,10 +2,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any
 
-import pandas as pd
-
 from freqtrade.constants import Config, LongShort
-from freqtrade.data.metrics import calculate_max_drawdown
 from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
@@ -48,20 +45,18 @@ class MaxDrawdown(IProtection):
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
 
-        trades = Trade.get_trades_proxy(is_open=False, close_date=look_back_until)
-
-        trades_df = pd.DataFrame([trade.to_json() for trade in trades])
+        trade_stats = Trade.get_closed_trade_stats(None, close_date=look_back_until)
+        trades = trade_stats.trades_since(look_back_until)
 
         if len(trades) < self._trade_limit:
             # Not enough trades in the relevant period
             return None
 
         # Drawdown is always positive
-        try:
-            # TODO: This should use absolute profit calculation, considering account balance.
-            drawdown_obj = calculate_max_drawdown(trades_df, value_col="close_profit")
-            drawdown = drawdown_obj.drawdown_abs
-        except ValueError:
+        # TODO: This should use absolute profit calculation, considering account balance.
+        drawdown = trade_stats.max_drawdown_since(look_back_until)
+        if not drawdown:
+            # No losing trade, therefore no drawdown.
             return None
 
         if drawdown > self._max_allowed_drawdown:
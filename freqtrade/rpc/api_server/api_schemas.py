@@ -521,6 +521,7 @@ class PairCandlesRequest(BaseModel):
     timeframe: str
     limit: int | None = None
     columns: list[str] | None = None
+    columnar: bool = False
 
 
 class PairHistoryRequest(PairCandlesRequest):
@@ -536,7 +537,7 @@ class PairHistory(BaseModel):
     timeframe_ms: int
     columns: list[str]
     all_columns: list[str] = []
-    data: SerializeAsAny[list[Any]]
+    data: SerializeAsAny[list[Any] | dict[str, list[Any]]]
     length: int
     buy_signals: int
     sell_signals: int
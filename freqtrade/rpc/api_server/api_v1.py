@@ -84,7 +84,8 @@ logger = logging.getLogger(__name__)
 # 2.35: pair_candles and pair_history endpoints as Post variant
 # 2.40: Add hyperopt-loss endpoint
 # 2.41: Add download-data endpoint
-API_VERSION = 2.41
+# 2.42: Add columnar option to pair_candles and pair_history
+API_VERSION = 2.42
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -330,15 +331,21 @@ def reload_config(rpc: RPC = Depends(get_rpc)):
 
 
 @router.get("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles(pair: str, timeframe: str, limit: int | None = None, rpc: RPC = Depends(get_rpc)):
-    return rpc._rpc_analysed_dataframe(pair, timeframe, limit, None)
+def pair_candles(
+    pair: str,
+    timeframe: str,
+    limit: int | None = None,
+    columnar: bool = False,
+    rpc: RPC = Depends(get_rpc),
+):
+    return rpc._rpc_analysed_dataframe(pair, timeframe, limit, None, columnar)
 
 
 @router.post("/pair_candles", response_model=PairHistory, tags=["candle data"])
 def pair_candles_filtered(payload: PairCandlesRequest, rpc: RPC = Depends(get_rpc)):
     # Advanced pair_candles endpoint with column filtering
     return rpc._rpc_analysed_dataframe(
-        payload.pair, payload.timeframe, payload.limit, payload.columns
+        payload.pair, payload.timeframe, payload.limit, payload.columns, payload.columnar
     )
 
 
@@ -388,7 +395,7 @@ def pair_history_filtered(
     )
     try:
         return RPC._rpc_analysed_history_full(
-            config, payload.pair, payload.timeframe, exchange, payload.columns
+            config, payload.pair, payload.timeframe, exchange, payload.columns, payload.columnar
         )
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
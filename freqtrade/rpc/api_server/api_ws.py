@@ -12,8 +12,15 @@ from freqtrade.rpc.api_server.api_auth import validate_ws_token
 from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import (
+    ArrowWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+    WebSocketSerializer,
+    pa,
+)
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
+    WSAnalyzedDFSince,
     WSErrorMessage,
     WSMessageSchema,
     WSRequestSchema,
@@ -61,6 +68,18 @@ async def channel_broadcaster(channel: WebSocketChannel, message_stream: Message
             await channel.send(message, use_timeout=True)
 
 
+def _get_analyzed_df_since(data: Any, channel: WebSocketChannel) -> dict[str, int] | None:
+    """
+    Validate `since` of an analyzed_df request.
+    Invalid values are ignored - full dataframes are sent instead.
+    """
+    try:
+        return WSAnalyzedDFSince.validate_python(data.get("since") if data else None)
+    except ValidationError as e:
+        logger.warning(f"Invalid `since` in request from {channel}, ignoring it: {e}")
+        return None
+
+
 async def _process_consumer_request(request: dict[str, Any], channel: WebSocketChannel, rpc: RPC):
     """
     Validate and handle a request from a websocket consumer
@@ -102,9 +121,11 @@ async def _process_consumer_request(request: dict[str, Any], channel: WebSocketC
         # Limit the amount of candles per dataframe to 'limit' or 1500
         limit = int(min(data.get("limit", 1500), 1500)) if data else None
         pair = data.get("pair", None) if data else None
+        # Last candle per pair the consumer already has - only newer candles are sent
+        since = _get_analyzed_df_since(data, channel)
 
         # For every pair in the generator, send a separate message
-        for message in rpc._ws_request_analyzed_df(limit, pair):
+        for message in rpc._ws_request_analyzed_df(limit, pair, since):
             # Format response
             response = WSAnalyzedDFMessage(data=message)
             await channel.send(response.model_dump(exclude_none=True))
@@ -116,9 +137,15 @@ async def message_endpoint(
     token: str = Depends(validate_ws_token),
     rpc: RPC = Depends(get_rpc),
     message_stream: MessageStream = Depends(get_message_stream),
+    encoding: str = "json",
 ):
     if token:
-        async with create_channel(websocket) as channel:
+        # Consumers request binary dataframes via `encoding=arrow`.
+        # Older consumers don't - and keep receiving JSON.
+        serializer_cls: type[WebSocketSerializer] = HybridJSONWebSocketSerializer
+        if encoding == "arrow" and pa is not None:
+            serializer_cls = ArrowWebSocketSerializer
+        async with create_channel(websocket, serializer_cls=serializer_cls) as channel:
             await channel.run_channel_tasks(
                 channel_reader(channel, rpc), channel_broadcaster(channel, message_stream)
             )
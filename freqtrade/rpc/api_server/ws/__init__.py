@@ -1,6 +1,9 @@
 # isort: off
 from freqtrade.rpc.api_server.ws.types import WebSocketType  # noqa: F401
 from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy  # noqa: F401
-from freqtrade.rpc.api_server.ws.serializer import HybridJSONWebSocketSerializer  # noqa: F401
+from freqtrade.rpc.api_server.ws.serializer import (  # noqa: F401
+    ArrowWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+)
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel  # noqa: F401
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream  # noqa: F401
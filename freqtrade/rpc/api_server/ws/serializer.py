@@ -1,4 +1,5 @@
 import logging
+import struct
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -11,8 +12,18 @@ from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy
 from freqtrade.rpc.api_server.ws_schemas import WSMessageSchemaType
 
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
 logger = logging.getLogger(__name__)
 
+# Binary message layout: magic, header length, JSON header, (length, Arrow IPC stream)*
+ARROW_MESSAGE_MAGIC = b"FTA1"
+_LENGTH = struct.Struct("<Q")
+
 
 class WebSocketSerializer(ABC):
     def __init__(self, websocket: WebSocketProxy):
@@ -43,6 +54,81 @@ class HybridJSONWebSocketSerializer(WebSocketSerializer):
         return rapidjson.loads(data, object_hook=_json_object_hook)
 
 
+class ArrowWebSocketSerializer(HybridJSONWebSocketSerializer):
+    """
+    Sends messages containing DataFrames as binary messages, with the DataFrames encoded as
+    Arrow IPC streams. All other messages are sent as JSON text.
+    Receives both binary and JSON text messages.
+    """
+
+    def _serialize(self, data) -> str | bytes:  # type: ignore[override]
+        tables: list[bytes | pa.Buffer] = []
+
+        def default(z):
+            if isinstance(z, DataFrame):
+                try:
+                    tables.append(dataframe_to_arrow(z))
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    # Columns with mixed types - fall back to JSON for this DataFrame
+                    return _json_default(z)
+                return {"__type__": "dataframe_arrow", "__value__": len(tables) - 1}
+            raise TypeError
+
+        header = orjson.dumps(data, default=default)
+        if not tables:
+            return str(header, "utf-8")
+
+        parts = [ARROW_MESSAGE_MAGIC, _LENGTH.pack(len(header)), header]
+        for table in tables:
+            parts.extend((_LENGTH.pack(len(table)), table))
+        return b"".join(parts)
+
+    def _deserialize(self, data: str | bytes):
+        if isinstance(data, str):
+            return super()._deserialize(data)
+
+        view = memoryview(data)
+        if view[: len(ARROW_MESSAGE_MAGIC)] != ARROW_MESSAGE_MAGIC:
+            raise ValueError("Unknown binary message format.")
+        offset = len(ARROW_MESSAGE_MAGIC)
+        (header_len,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        header = str(view[offset : offset + header_len], "utf-8")
+        offset += header_len
+        tables = []
+        while offset < len(view):
+            (table_len,) = _LENGTH.unpack_from(view, offset)
+            offset += _LENGTH.size
+            tables.append(view[offset : offset + table_len])
+            offset += table_len
+
+        def object_hook(z):
+            if z.get("__type__") == "dataframe_arrow":
+                return arrow_to_dataframe(tables[z["__value__"]])
+            return _json_object_hook(z)
+
+        return rapidjson.loads(header, object_hook=object_hook)
+
+
+def dataframe_to_arrow(dataframe: DataFrame) -> "pa.Buffer":
+    """
+    Serialize a DataFrame (including its index) to an Arrow IPC stream
+    """
+    table = pa.Table.from_pandas(dataframe)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def arrow_to_dataframe(data) -> DataFrame:
+    """
+    Deserialize an Arrow IPC stream into a DataFrame
+    """
+    with pa.ipc.open_stream(pa.py_buffer(data)) as reader:
+        return reader.read_all().to_pandas()
+
+
 # Support serializing pandas DataFrames
 def _json_default(z):
     if isinstance(z, DataFrame):
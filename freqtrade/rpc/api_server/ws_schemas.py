@@ -1,8 +1,8 @@
 from datetime import datetime
-from typing import Any, TypedDict
+from typing import Annotated, Any, TypedDict
 
-from pandas import DataFrame
-from pydantic import BaseModel, ConfigDict
+from pandas import DataFrame, Timestamp
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from freqtrade.constants import PairWithTimeframe
 from freqtrade.enums import RPCMessageType, RPCRequestType
@@ -47,6 +47,12 @@ class WSAnalyzedDFRequest(WSRequestSchema):
     data: dict[str, Any] = {"limit": 1500, "pair": None}
 
 
+# Last candle (timestamp in ms) per pair, passed as `since` in WSAnalyzedDFRequest data
+WSAnalyzedDFSince: TypeAdapter[dict[str, int] | None] = TypeAdapter(
+    dict[str, Annotated[int, Field(ge=0, le=Timestamp.max.value // 10**6)]] | None
+)
+
+
 # ------------------------------ MESSAGE SCHEMAS ----------------------------
 
 
@@ -21,6 +21,12 @@ from freqtrade.enums import RPCMessageType
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import (
+    ArrowWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+    WebSocketSerializer,
+    pa,
+)
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSAnalyzedDFRequest,
@@ -79,16 +85,21 @@ class ExternalMessageConsumer:
         # as the websockets client expects bytes.
         self.message_size_limit = self._emc_config.get("message_size_limit", 8) << 20
 
+        # Request dataframes as Arrow IPC (binary) messages instead of JSON
+        self.serializer_cls: type[WebSocketSerializer] = HybridJSONWebSocketSerializer
+        if self._emc_config.get("message_encoding", "arrow") == "arrow" and pa is not None:
+            self.serializer_cls = ArrowWebSocketSerializer
+
         # Setting these explicitly as they probably shouldn't be changed by a user
         # Unless we somehow integrate this with the strategy to allow creating
         # callbacks for the messages
         self.topics = [RPCMessageType.WHITELIST, RPCMessageType.ANALYZED_DF]
 
         # Allow setting data for each initial request
+        # The analyzed dataframe request is built per connection, see _analyzed_df_request()
         self._initial_requests: list[WSRequestSchema] = [
             WSSubscribeRequest(data=self.topics),
             WSWhitelistRequest(),
-            WSAnalyzedDFRequest(),
         ]
 
         # Specify which function to use for which RPCMessageType
@@ -191,19 +202,27 @@ class ExternalMessageConsumer:
                 name = producer["name"]
                 scheme = "wss" if producer.get("secure", False) else "ws"
                 ws_url = f"{scheme}://{host}:{port}/api/v1/message/ws?token={token}"
+                if self.serializer_cls is ArrowWebSocketSerializer:
+                    # Older producers ignore this, and send JSON
+                    ws_url += "&encoding=arrow"
 
                 # This will raise InvalidURI if the url is bad
                 async with websockets.connect(
                     ws_url, max_size=self.message_size_limit, ping_interval=None
                 ) as ws:
-                    async with create_channel(ws, channel_id=name, send_throttle=0.5) as channel:
+                    async with create_channel(
+                        ws,
+                        channel_id=name,
+                        send_throttle=0.5,
+                        serializer_cls=self.serializer_cls,
+                    ) as channel:
                         # Create the message stream for this channel
                         self._channel_streams[name] = MessageStream()
 
                         # Run the channel tasks while connected
                         await channel.run_channel_tasks(
                             self._receive_messages(channel, producer, lock),
-                            self._send_requests(channel, self._channel_streams[name]),
+                            self._send_requests(channel, self._channel_streams[name], name),
                         )
 
             except (websockets.exceptions.InvalidURI, ValueError) as e:
@@ -234,9 +253,22 @@ class ExternalMessageConsumer:
                 await asyncio.sleep(self.sleep_time)
                 continue
 
-    async def _send_requests(self, channel: WebSocketChannel, channel_stream: MessageStream):
+    def _analyzed_df_request(self, producer_name: str) -> WSAnalyzedDFRequest:
+        """
+        Request analyzed dataframes from a producer.
+        Pairs we already have data for (e.g. on reconnect) are resumed from their last candle,
+        so the producer only sends the missing candles.
+        """
+        data: dict[str, Any] = {"limit": self.initial_candle_limit, "pair": None}
+        if since := self._dp._get_producer_last_candles(producer_name):
+            data["since"] = since
+        return WSAnalyzedDFRequest(data=data)
+
+    async def _send_requests(
+        self, channel: WebSocketChannel, channel_stream: MessageStream, producer_name: str
+    ):
         # Send the initial requests
-        for init_request in self._initial_requests:
+        for init_request in [*self._initial_requests, self._analyzed_df_request(producer_name)]:
             await channel.send(schema_to_dict(init_request))
 
         # Now send any subsequent requests published to
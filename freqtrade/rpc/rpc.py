@@ -7,18 +7,25 @@ from abc import abstractmethod
 from collections.abc import Generator, Sequence
 from datetime import date, datetime, timedelta, timezone
 from math import isnan
+from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 import psutil
+from cachetools import LRUCache
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, mean, nan
-from pandas import DataFrame, NaT
+from numpy import flatnonzero, inf, int64, isfinite, nan
+from pandas import DataFrame, NaT, Series, Timestamp
 from sqlalchemy import func, select
 
 from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
-from freqtrade.constants import CANCEL_REASON, DEFAULT_DATAFRAME_COLUMNS, Config
+from freqtrade.constants import (
+    CANCEL_REASON,
+    DEFAULT_DATAFRAME_COLUMNS,
+    FULL_DATAFRAME_THRESHOLD,
+    Config,
+)
 from freqtrade.data.history import load_data
 from freqtrade.data.metrics import DrawDownResult, calculate_expectancy, calculate_max_drawdown
 from freqtrade.enums import (
@@ -111,6 +118,10 @@ class RPC:
         """
         self._freqtrade = freqtrade
         self._config: Config = freqtrade.config
+        # Responses of _rpc_analysed_dataframe, keyed by request arguments and last candle.
+        # Only covers the charts a UI is polling - responses can contain full histories.
+        self._pair_candles_cache: LRUCache = LRUCache(maxsize=8)
+        self._pair_candles_lock = Lock()
         if self._config.get("fiat_display_currency"):
             self._fiat_converter = CryptoToFiatConverter(self._config)
 
@@ -501,71 +512,54 @@ class RPC:
 
         start_date = datetime.fromtimestamp(0) if start_date is None else start_date
 
-        trade_filter = (
-            Trade.is_open.is_(False) & (Trade.close_date >= start_date)
-        ) | Trade.is_open.is_(True)
-        trades: Sequence[Trade] = Trade.session.scalars(
-            Trade.get_trades_query(trade_filter, include_orders=False).order_by(Trade.id)
+        # Closed trades are aggregated by the database - only open trades are loaded as objects.
+        closed = Trade.get_closed_profit_summary(start_date)
+        closed_trade_count: int = closed["trade_count"]
+        closed_rows = Trade.session.execute(
+            select(Trade.id, Trade.open_date, Trade.close_date, Trade.close_profit_abs)
+            .filter(Trade.is_open.is_(False), Trade.close_date >= start_date)
+            .order_by(Trade.id)
+        ).all()
+        open_trades: Sequence[Trade] = Trade.session.scalars(
+            Trade.get_trades_query(Trade.is_open.is_(True), include_orders=False).order_by(Trade.id)
         ).all()
 
-        profit_all_coin = []
-        profit_all_ratio = []
-        profit_closed_coin = []
-        profit_closed_ratio = []
-        durations = []
-        winning_trades = 0
-        losing_trades = 0
-        winning_profit = 0.0
-        losing_profit = 0.0
+        profit_open_coin = []
+        profit_open_ratio = []
 
-        for trade in trades:
+        for trade in open_trades:
             current_rate: float = 0.0
 
-            if trade.close_date:
-                durations.append((trade.close_date - trade.open_date).total_seconds())
-
-            if not trade.is_open:
-                profit_ratio = trade.close_profit or 0.0
-                profit_abs = trade.close_profit_abs or 0.0
-                profit_closed_coin.append(profit_abs)
-                profit_closed_ratio.append(profit_ratio)
-                if profit_ratio >= 0:
-                    winning_trades += 1
-                    winning_profit += profit_abs
-                else:
-                    losing_trades += 1
-                    losing_profit += profit_abs
+            # Get current rate
+            if len(trade.select_filled_orders(trade.entry_side)) == 0:
+                # Skip trades with no filled orders
+                continue
+            try:
+                current_rate = self._freqtrade.exchange.get_rate(
+                    trade.pair, side="exit", is_short=trade.is_short, refresh=False
+                )
+            except (PricingError, ExchangeError):
+                current_rate = nan
+                profit_ratio = nan
+                profit_abs = nan
             else:
-                # Get current rate
-                if len(trade.select_filled_orders(trade.entry_side)) == 0:
-                    # Skip trades with no filled orders
-                    continue
-                try:
-                    current_rate = self._freqtrade.exchange.get_rate(
-                        trade.pair, side="exit", is_short=trade.is_short, refresh=False
-                    )
-                except (PricingError, ExchangeError):
-                    current_rate = nan
-                    profit_ratio = nan
-                    profit_abs = nan
-                else:
-                    _profit = trade.calculate_profit(trade.close_rate or current_rate)
-
-                    profit_ratio = _profit.profit_ratio
-                    profit_abs = _profit.total_profit
+                _profit = trade.calculate_profit(trade.close_rate or current_rate)
 
-            profit_all_coin.append(profit_abs)
-            profit_all_ratio.append(profit_ratio)
+                profit_ratio = _profit.profit_ratio
+                profit_abs = _profit.total_profit
 
-        closed_trade_count = len([t for t in trades if not t.is_open])
+            profit_open_coin.append(profit_abs)
+            profit_open_ratio.append(profit_ratio)
 
         best_pair = Trade.get_best_pair(start_date)
         trading_volume = Trade.get_trading_volume(start_date)
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(closed["profit_abs"], 8)
+        profit_closed_ratio_sum = closed["profit_ratio"]
+        profit_closed_ratio_mean = (
+            profit_closed_ratio_sum / closed_trade_count if closed_trade_count else 0.0
+        )
 
         profit_closed_fiat = (
             self._fiat_converter.convert_amount(
@@ -575,10 +569,11 @@ class RPC:
             else 0
         )
 
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
+        profit_all_count = closed_trade_count + len(profit_open_ratio)
+        profit_all_coin_sum = round(closed["profit_abs"] + sum(profit_open_coin), 8)
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
+        profit_all_ratio_sum = profit_closed_ratio_sum + sum(profit_open_ratio)
+        profit_all_ratio_mean = profit_all_ratio_sum / profit_all_count if profit_all_count else 0.0
         starting_balance = self._freqtrade.wallets.get_starting_balance()
         profit_closed_ratio_fromstart = 0.0
         profit_all_ratio_fromstart = 0.0
@@ -586,20 +581,16 @@ class RPC:
             profit_closed_ratio_fromstart = profit_closed_coin_sum / starting_balance
             profit_all_ratio_fromstart = profit_all_coin_sum / starting_balance
 
+        winning_trades: int = closed["winning_trades"]
+        losing_trades: int = closed["losing_trades"]
+        winning_profit: float = closed["winning_profit"]
+        losing_profit: float = closed["losing_profit"]
         profit_factor = winning_profit / abs(losing_profit) if losing_profit else float("inf")
 
         winrate = (winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
 
         trades_df = DataFrame(
-            [
-                {
-                    "close_date": format_date(trade.close_date),
-                    "close_date_dt": trade.close_date,
-                    "profit_abs": trade.close_profit_abs,
-                }
-                for trade in trades
-                if not trade.is_open and trade.close_date
-            ]
+            closed_rows, columns=["id", "open_date", "close_date_dt", "profit_abs"]
         )
 
         expectancy, expectancy_ratio = calculate_expectancy(trades_df)
@@ -625,9 +616,18 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date_utc if trades else None
-        last_date = trades[-1].open_date_utc if trades else None
-        num = float(len(durations) or 1)
+        # First and last trade (by id) of both closed and open trades
+        trade_ends = [(t.id, t.open_date) for t in (*closed_rows[:1], *closed_rows[-1:])] + [
+            (t.id, t.open_date) for t in (*open_trades[:1], *open_trades[-1:])
+        ]
+        first_date = min(trade_ends)[1].replace(tzinfo=timezone.utc) if trade_ends else None
+        last_date = max(trade_ends)[1].replace(tzinfo=timezone.utc) if trade_ends else None
+        duration_sum = 0.0
+        if len(trades_df) > 0:
+            duration_sum = float(
+                (trades_df["close_date_dt"] - trades_df["open_date"]).dt.total_seconds().sum()
+            )
+        num = float(len(trades_df) or 1)
         bot_start = KeyValueStore.get_datetime_value(KeyStoreKeys.BOT_START_TIME)
         return {
             "profit_closed_coin": profit_closed_coin_sum,
@@ -646,7 +646,7 @@ class RPC:
             "profit_all_ratio": profit_all_ratio_fromstart,
             "profit_all_percent": round(profit_all_ratio_fromstart * 100, 2),
             "profit_all_fiat": profit_all_fiat,
-            "trade_count": len(trades),
+            "trade_count": closed_trade_count + len(open_trades),
             "closed_trade_count": closed_trade_count,
             "first_trade_date": format_date(first_date),
             "first_trade_humanized": dt_humanize_delta(first_date) if first_date else "",
@@ -654,7 +654,7 @@ class RPC:
             "latest_trade_date": format_date(last_date),
             "latest_trade_humanized": dt_humanize_delta(last_date) if last_date else "",
             "latest_trade_timestamp": dt_ts_def(last_date, 0),
-            "avg_duration": str(timedelta(seconds=sum(durations) / num)).split(".")[0],
+            "avg_duration": str(timedelta(seconds=duration_sum / num)).split(".")[0],
             "best_pair": best_pair[0] if best_pair else "",
             "best_rate": round(best_pair[1] * 100, 2) if best_pair else 0,  # Deprecated
             "best_pair_profit_ratio": best_pair[1] if best_pair else 0,
@@ -1293,6 +1293,7 @@ class RPC:
         dataframe: DataFrame,
         last_analyzed: datetime,
         selected_cols: list[str] | None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         has_content = len(dataframe) != 0
         dataframe_columns = list(dataframe.columns)
@@ -1325,7 +1326,15 @@ class RPC:
                 # replace NaT with `None`
                 dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
 
-            dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
+            if not columnar:
+                dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
+
+        if columnar:
+            data: list[Any] | dict[str, list[Any]] = {
+                col: RPC._column_to_list(dataframe[col]) for col in dataframe.columns
+            }
+        else:
+            data = dataframe.values.tolist()
 
         res = {
             "pair": pair,
@@ -1334,7 +1343,7 @@ class RPC:
             "strategy": strategy,
             "all_columns": dataframe_columns,
             "columns": list(dataframe.columns),
-            "data": dataframe.values.tolist(),
+            "data": data,
             "length": len(dataframe),
             "buy_signals": signals["enter_long"],  # Deprecated
             "sell_signals": signals["exit_long"],  # Deprecated
@@ -1360,18 +1369,67 @@ class RPC:
             )
         return res
 
+    @staticmethod
+    def _column_to_list(column: Series) -> list[Any]:
+        """
+        Convert a dataframe column to a list, replacing NaN / inf with None.
+        Float columns are converted as a whole - only non-finite cells are touched individually.
+        """
+        values = column.to_numpy()
+        if values.dtype.kind != "f":
+            if values.dtype.kind == "O":
+                return column.replace({inf: None, -inf: None, nan: None}).tolist()
+            return values.tolist()
+        res = values.tolist()
+        for idx in flatnonzero(~isfinite(values)):
+            res[idx] = None
+        return res
+
     def _rpc_analysed_dataframe(
-        self, pair: str, timeframe: str, limit: int | None, selected_cols: list[str] | None
+        self,
+        pair: str,
+        timeframe: str,
+        limit: int | None,
+        selected_cols: list[str] | None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
-        """Analyzed dataframe in Dict form"""
+        """
+        Analyzed dataframe in Dict form.
+        Responses are cached until the dataframe is analyzed again.
+        :param columnar: Return data as column -> list of values instead of a list of rows.
+        """
+        _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(pair, timeframe)
+        key = (
+            pair,
+            timeframe,
+            limit,
+            tuple(selected_cols) if selected_cols is not None else None,
+            columnar,
+            _data["date"].iloc[-1] if not _data.empty else None,
+            last_analyzed,
+        )
+        with self._pair_candles_lock:
+            res = self._pair_candles_cache.get(key)
+        if res is not None:
+            # Callers may modify the response - but not the cached data.
+            return dict(res)
 
         _data, last_analyzed = self.__rpc_analysed_dataframe_raw(pair, timeframe, limit)
-        return RPC._convert_dataframe_to_dict(
-            self._freqtrade.config["strategy"], pair, timeframe, _data, last_analyzed, selected_cols
+        res = RPC._convert_dataframe_to_dict(
+            self._freqtrade.config["strategy"],
+            pair,
+            timeframe,
+            _data,
+            last_analyzed,
+            selected_cols,
+            columnar,
         )
+        with self._pair_candles_lock:
+            self._pair_candles_cache[key] = res
+        return dict(res)
 
     def __rpc_analysed_dataframe_raw(
-        self, pair: str, timeframe: str, limit: int | None
+        self, pair: str, timeframe: str, limit: int | None, since: int | None = None
     ) -> tuple[DataFrame, datetime]:
         """
         Get the dataframe and last analyze from the dataprovider
@@ -1379,17 +1437,23 @@ class RPC:
         :param pair: The pair to get
         :param timeframe: The timeframe of data to get
         :param limit: The amount of candles in the dataframe
+        :param since: Only return candles from this candle (timestamp in ms) onwards -
+                      unless that's at least FULL_DATAFRAME_THRESHOLD candles.
         """
         _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(pair, timeframe)
-        _data = _data.copy()
+
+        if since is not None and not _data.empty:
+            start = _data["date"].searchsorted(Timestamp(since, unit="ms", tz="UTC"))
+            if 0 < len(_data) - start < FULL_DATAFRAME_THRESHOLD:
+                limit = len(_data) - start
 
         if limit:
             _data = _data.iloc[-limit:]
 
-        return _data, last_analyzed
+        return _data.copy(), last_analyzed
 
     def _ws_all_analysed_dataframes(
-        self, pairlist: list[str], limit: int | None
+        self, pairlist: list[str], limit: int | None, since: dict[str, int] | None = None
     ) -> Generator[dict[str, Any], None, None]:
         """
         Get the analysed dataframes of each pair in the pairlist.
@@ -1399,21 +1463,31 @@ class RPC:
         :param pairlist: A list of pairs to get
         :param limit: If an integer, limits the size of dataframe
                       If a list of string date times, only returns those candles
+        :param since: Last candle (timestamp in ms) the consumer has per pair.
+                      Only candles from this candle onwards are returned for these pairs,
+                      unless that's at least FULL_DATAFRAME_THRESHOLD candles.
         :returns: A generator of dictionaries with the key, dataframe, and last analyzed timestamp
         """
         timeframe = self._freqtrade.config["timeframe"]
         candle_type = self._freqtrade.config.get("candle_type_def", CandleType.SPOT)
 
         for pair in pairlist:
-            dataframe, last_analyzed = self.__rpc_analysed_dataframe_raw(pair, timeframe, limit)
+            dataframe, last_analyzed = self.__rpc_analysed_dataframe_raw(
+                pair, timeframe, limit, since.get(pair) if since else None
+            )
 
             yield {"key": (pair, timeframe, candle_type), "df": dataframe, "la": last_analyzed}
 
-    def _ws_request_analyzed_df(self, limit: int | None = None, pair: str | None = None):
+    def _ws_request_analyzed_df(
+        self,
+        limit: int | None = None,
+        pair: str | None = None,
+        since: dict[str, int] | None = None,
+    ):
         """Historical Analyzed Dataframes for WebSocket"""
         pairlist = [pair] if pair else self._freqtrade.active_pair_whitelist
 
-        return self._ws_all_analysed_dataframes(pairlist, limit)
+        return self._ws_all_analysed_dataframes(pairlist, limit, since)
 
     def _ws_request_whitelist(self):
         """Whitelist data for WebSocket"""
@@ -1421,7 +1495,12 @@ class RPC:
 
     @staticmethod
     def _rpc_analysed_history_full(
-        config: Config, pair: str, timeframe: str, exchange, selected_cols: list[str] | None
+        config: Config,
+        pair: str,
+        timeframe: str,
+        exchange,
+        selected_cols: list[str] | None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         timerange_parsed = TimeRange.parse_timerange(config.get("timerange"))
 
@@ -1459,6 +1538,7 @@ class RPC:
             df_analyzed.copy(),
             dt_now(),
             selected_cols,
+            columnar,
         )
 
     def _rpc_plot_config(self) -> dict[str, Any]:
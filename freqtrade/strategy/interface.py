@@ -4,12 +4,17 @@ This module defines the interface to apply for strategies
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from math import isinf, isnan
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, concat
 
+from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
 from freqtrade.data.converter import populate_dataframe_with_trades
 from freqtrade.data.dataprovider import DataProvider
@@ -42,6 +47,11 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+# Analyzed dataframes waiting to be published - only set while analyzing pairs concurrently.
+_pending_publish: ContextVar[list[tuple[str, DataFrame, bool]] | None] = ContextVar(
+    "pending_publish", default=None
+)
+
 
 class IStrategy(ABC, HyperStrategyMixin):
     """
@@ -101,6 +111,8 @@ class IStrategy(ABC, HyperStrategyMixin):
 
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
+    # Only analyze new candles (using `startup_candle_count` prior candles) in dry/live mode
+    incremental_analysis: bool = False
 
     use_exit_signal: bool
     exit_profit_only: bool
@@ -146,6 +158,10 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Duration (in seconds) of the last analysis of each pair
+        self._analysis_durations: dict[str, float] = {}
+        # Last analyzed dataframe per pair - used for incremental analysis
+        self._incremental_state: dict[str, DataFrame] = {}
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -227,6 +243,20 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         return dataframe
 
+    def populate_indicators_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Populate indicators for new candles only.
+        Only used in dry/live mode if `incremental_analysis` is enabled.
+        Defaults to calling populate_indicators() - which is correct for all indicators
+        which don't require more than `startup_candle_count` candles.
+        Override this to update recursive indicators from their prior values instead.
+        :param dataframe: The last `startup_candle_count` analyzed candles (including all
+            indicators), followed by the new candles (with indicator columns set to NaN)
+        :param metadata: Additional information, like the currently traded pair
+        :return: a Dataframe with indicators populated for the new candles
+        """
+        return self.populate_indicators(dataframe, metadata)
+
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         DEPRECATED - please migrate to populate_entry_trend
@@ -1040,12 +1070,71 @@ class IStrategy(ABC, HyperStrategyMixin):
         :return: DataFrame of candle (OHLCV) data with indicator data and signals added
         """
         logger.debug("TA Analysis Launched")
+        if self.incremental_analysis:
+            analyzed = self._analyze_ticker_incremental(dataframe, metadata)
+            if analyzed is not None:
+                logger.debug("TA Analysis Ended (incremental)")
+                return analyzed
         dataframe = self.advise_indicators(dataframe, metadata)
         dataframe = self.advise_entry(dataframe, metadata)
         dataframe = self.advise_exit(dataframe, metadata)
+        if self.incremental_analysis:
+            self._incremental_state[metadata["pair"]] = dataframe.copy()
         logger.debug("TA Analysis Ended")
         return dataframe
 
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame | None:
+        """
+        Analyze only the candles added since the last analysis of this pair.
+        The previously analyzed dataframe is extended by the new candles, which are analyzed
+        together with the `startup_candle_count` candles before them.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: Analyzed dataframe - or None if a full analysis is required.
+        """
+        pair = metadata["pair"]
+        window = self.startup_candle_count
+        previous = self._incremental_state.pop(pair, None)
+        if (
+            previous is None
+            or window <= 0
+            or self._ft_informative
+            or self.config.get("exchange", {}).get("use_public_trades", False)
+        ):
+            return None
+
+        dates = dataframe["date"]
+        new_start = int(dates.searchsorted(previous["date"].iloc[-1], side="right"))
+        if new_start < window or new_start > len(previous) or new_start == len(dataframe):
+            return None
+        # Already analyzed candles must still be identical - otherwise data was replaced.
+        previous = previous.iloc[len(previous) - new_start :]
+        ohlc_cols = ["open", "high", "low", "close", "volume"]
+        if not np.array_equal(previous["date"].values, dates.values[:new_start]) or not (
+            np.array_equal(
+                previous[ohlc_cols].to_numpy()[-window:],
+                dataframe[ohlc_cols].to_numpy()[new_start - window : new_start],
+            )
+        ):
+            return None
+
+        tail = concat(
+            [previous.iloc[-window:], dataframe.iloc[new_start:]], axis=0, ignore_index=True
+        )
+        tail = self.populate_indicators_incremental(tail, metadata)
+        tail = self.advise_entry(tail, metadata)
+        tail = self.advise_exit(tail, metadata)
+        if list(tail.columns) != list(previous.columns):
+            logger.info(
+                f"Columns changed during incremental analysis of {pair}, analyzing all candles."
+            )
+            return None
+
+        analyzed = concat([previous, tail.iloc[window:]], axis=0)
+        analyzed.index = dataframe.index
+        self._incremental_state[pair] = analyzed.copy()
+        return analyzed
+
     def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
@@ -1065,10 +1154,7 @@ class IStrategy(ABC, HyperStrategyMixin):
             dataframe = self.analyze_ticker(dataframe, metadata)
 
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
-
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            self._publish_analyzed_df(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1108,13 +1194,65 @@ class IStrategy(ABC, HyperStrategyMixin):
             logger.warning("Empty dataframe for pair %s", pair)
             return
 
+    def _publish_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider and emit it to consumers.
+        Deferred while pairs are analyzed concurrently - see `analyze()`.
+        """
+        pending = _pending_publish.get()
+        if pending is not None:
+            pending.append((pair, dataframe, new_candle))
+            return
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
+    def _timed_analyze_pair(self, pair: str) -> None:
+        start = time.perf_counter()
+        self.analyze_pair(pair)
+        self._analysis_durations[pair] = time.perf_counter() - start
+
+    def _analyze_pair_deferred(self, pair: str) -> list[tuple[str, DataFrame, bool]]:
+        """
+        Analyze one pair (called in a worker thread).
+        :return: Analyzed dataframes to publish
+        """
+        pending: list[tuple[str, DataFrame, bool]] = []
+        token = _pending_publish.set(pending)
+        try:
+            self._timed_analyze_pair(pair)
+        finally:
+            _pending_publish.reset(token)
+        return pending
+
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `analyze_workers` configured, pairs are analyzed concurrently in threads.
+        Results are published to the dataprovider in the order of `pairs` either way -
+        when analyzing concurrently, once all pairs have been analyzed.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        self._analysis_durations = {}
+        workers = min(self.config.get("analyze_workers", 1), len(pairs))
+        if workers <= 1 or self.config.get("freqai", {}).get("enabled", False):
+            for pair in pairs:
+                self._timed_analyze_pair(pair)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ft_analyze") as executor:
+            results = list(executor.map(self._analyze_pair_deferred, pairs))
+        for pending in results:
+            for pair, dataframe, new_candle in pending:
+                self._publish_analyzed_df(pair, dataframe, new_candle)
+
+    def get_slowest_analyzed_pairs(self, count: int = 3) -> list[tuple[str, float]]:
+        """
+        Get the pairs which took the longest to analyze during the last `analyze()` call.
+        :param count: Number of pairs to return
+        :return: List of (pair, duration in seconds) tuples - slowest first
+        """
+        return sorted(self._analysis_durations.items(), key=lambda x: x[1], reverse=True)[:count]
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> tuple[int, float, datetime]:
@@ -1599,10 +1737,17 @@ class IStrategy(ABC, HyperStrategyMixin):
     def _if_enabled_populate_trades(self, dataframe: DataFrame, metadata: dict):
         use_public_trades = self.config.get("exchange", {}).get("use_public_trades", False)
         if use_public_trades:
-            trades = self.dp.trades(pair=metadata["pair"], copy=False)
+            timerange = None
+            if not dataframe.empty:
+                # Only trades within the last max_candles candles are used
+                start = dataframe["date"].iloc[-self.config["orderflow"]["max_candles"] :].iat[0]
+                stop = dataframe["date"].iat[-1] + timedelta(
+                    seconds=timeframe_to_seconds(self.config["timeframe"])
+                )
+                timerange = TimeRange("date", "date", int(start.timestamp()), int(stop.timestamp()))
+            trades = self.dp.trades(pair=metadata["pair"], copy=False, timerange=timerange)
 
             pair = metadata["pair"]
-            # TODO: slice trades to size of dataframe for faster backtesting
             cached_grouped_trades: DataFrame | None = self._cached_grouped_trades_per_pair.get(pair)
             dataframe, cached_grouped_trades = populate_dataframe_with_trades(
                 cached_grouped_trades, self.config, dataframe, trades
@@ -57,6 +57,13 @@ class Worker:
         internals_config = self._config.get("internals", {})
         self._throttle_secs = internals_config.get("process_throttle_secs", PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get("heartbeat_interval", 60)
+        self._process_on_candle_close = internals_config.get("process_on_candle_close", False)
+        if self._process_on_candle_close and not self.freqtrade.exchange.has_candle_close_events:
+            logger.warning(
+                "`process_on_candle_close` requires exchange websockets, "
+                "which are not available. Falling back to regular throttling."
+            )
+            self._process_on_candle_close = False
 
         self._sd_notify = (
             sdnotify.SystemdNotifier()
@@ -122,6 +129,7 @@ class Worker:
                 throttle_secs=self._throttle_secs,
                 timeframe=self._config["timeframe"] if self._config else None,
                 timeframe_offset=1,
+                wait_for_candle_close=self._process_on_candle_close,
             )
 
         if self._heartbeat_interval:
@@ -144,6 +152,7 @@ class Worker:
         throttle_secs: float,
         timeframe: str | None = None,
         timeframe_offset: float = 1.0,
+        wait_for_candle_close: bool = False,
         *args,
         **kwargs,
     ) -> Any:
@@ -154,6 +163,7 @@ class Worker:
         :param throttle_secs: throttling iteration execution time limit in seconds
         :param timeframe: ensure iteration is executed at the beginning of the next candle.
         :param timeframe_offset: offset in seconds to apply to the next candle time.
+        :param wait_for_candle_close: wake up as soon as candles closed (exchange websockets).
         :return: Any (result of execution of func)
         """
         last_throttle_start_time = time.time()
@@ -179,7 +189,11 @@ class Worker:
             f"last iteration took {time_passed:.2f} s."
             #  f"next: {next_iter}"
         )
-        self._sleep(sleep_duration)
+        if wait_for_candle_close:
+            if self.freqtrade.exchange.wait_for_candle_close(sleep_duration):
+                logger.debug("Woken up by candle close.")
+        else:
+            self._sleep(sleep_duration)
         return result
 
     @staticmethod
@@ -418,13 +418,14 @@ class FtRestClient:
             },
         )
 
-    def pair_candles(self, pair, timeframe, limit=None, columns=None):
+    def pair_candles(self, pair, timeframe, limit=None, columns=None, columnar=False):
         """Return live dataframe for <pair><timeframe>.
 
         :param pair: Pair to get data for
         :param timeframe: Only pairs with this timeframe available.
         :param limit: Limit result to the last n candles.
         :param columns: List of dataframe columns to return. Empty list will return OHLCV.
+        :param columnar: Return data as a mapping of column to values instead of rows.
         :return: json object
         """
         params = {
@@ -433,6 +434,8 @@ class FtRestClient:
         }
         if limit:
             params["limit"] = limit
+        if columnar:
+            params["columnar"] = columnar
 
         if columns is not None:
             params["columns"] = columns
@@ -125,6 +125,7 @@ def test_FtRestClient_call_invalid(caplog):
         ("pair_candles", ["XRP/USDT", "5m"], {}),
         ("pair_candles", ["XRP/USDT", "5m", 500], {}),
         ("pair_candles", ["XRP/USDT", "5m", 500], {"columns": ["close_time,close"]}),
+        ("pair_candles", ["XRP/USDT", "5m", 500], {"columnar": True}),
         ("pair_history", ["XRP/USDT", "5m", "SampleStrategy"], {}),
         ("pair_history", ["XRP/USDT", "5m"], {"strategy": "SampleStrategy"}),
         ("sysinfo", [], {}),
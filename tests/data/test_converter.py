@@ -26,8 +26,8 @@ from freqtrade.data.history import (
     load_pair_history,
     validate_backtest_data,
 )
-from freqtrade.data.history.datahandlers import IDataHandler
-from freqtrade.enums import CandleType
+from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from tests.conftest import generate_test_data, generate_trades_history, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -589,3 +589,38 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
         candle_type=CandleType.SPOT,
     )
     assert log_has(msg, caplog)
+
+
+def test_convert_trades_to_ohlcv_partitioned(tmp_path):
+    trades = generate_trades_history(n_rows=5000, days=10)
+    trades["timestamp"] = trades["date"].values.astype("datetime64[ms]").astype("int64")
+    timeframes = ["1m", "1h", "1d", "1w"]
+    results = {}
+    for name, partitioned in (("single", False), ("partitioned", True)):
+        datadir = tmp_path / name
+        datadir.mkdir()
+        dh = get_datahandler(datadir, "feather")
+        if partitioned:
+            dh.trades_append("XRP/ETH", trades, TradingMode.SPOT)
+            assert dh.trades_is_partitioned("XRP/ETH", TradingMode.SPOT)
+        else:
+            dh.trades_store("XRP/ETH", trades, TradingMode.SPOT)
+        convert_trades_to_ohlcv(
+            ["XRP/ETH"],
+            timeframes=timeframes,
+            datadir=datadir,
+            timerange=TimeRange(),
+            erase=False,
+            data_format_ohlcv="feather",
+            data_format_trades="feather",
+            candle_type=CandleType.SPOT,
+        )
+        results[name] = {
+            tf: dh.ohlcv_load("XRP/ETH", tf, CandleType.SPOT, fill_missing=False)
+            for tf in timeframes
+        }
+
+    for tf in timeframes:
+        # Candles spanning multiple days (1w) are merged from the daily partitions
+        assert_frame_equal(results["single"][tf], results["partitioned"][tf])
+    assert len(results["partitioned"]["1d"]) == 10
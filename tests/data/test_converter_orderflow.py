@@ -6,7 +6,10 @@ from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.data.converter import populate_dataframe_with_trades
 from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
+    stacked_imbalance_ask,
+    stacked_imbalance_bid,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
@@ -388,6 +391,82 @@ def test_public_trades_binned_big_sample_list(public_trades_list):
     assert 52.7199999 == pytest.approx(df["delta"].iat[0])  # delta
 
 
+def test_public_trades_populate_dataframe_per_candle_equivalence(public_trades_list):
+    trades = trades_list_to_df(public_trades_list[DEFAULT_TRADES_COLUMNS].values.tolist())
+    dataframe = pd.DataFrame(
+        {"date": pd.date_range("2023-02-02 09:18:00", periods=6, freq="1min", tz="UTC")}
+    )
+    config = {
+        "timeframe": "1m",
+        "orderflow": {
+            "cache_size": 1000,
+            "max_candles": 1500,
+            "scale": 0.05,
+            "imbalance_volume": 0,
+            "imbalance_ratio": 3,
+            "stacked_imbalance_range": 2,
+        },
+    }
+    orderflow_config = config["orderflow"]
+    df, cached = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+
+    # Candles without trades stay empty
+    assert df["total_trades"].isna().tolist() == [True, True, False, False, False, False]
+    assert df["total_trades"].sum() == len(trades)
+    assert df["stacked_imbalances_bid"].count() > 0
+    assert df["stacked_imbalances_ask"].count() > 0
+
+    trades["candle_start"] = trades["date"].dt.floor("1min")
+    for candle_start, candle_trades in trades.groupby("candle_start"):
+        row = df.loc[df["date"] == candle_start].iloc[0]
+        candle_trades = candle_trades.drop(columns=["candle_start"])
+        assert row["trades"] == candle_trades.to_dict(orient="records")
+
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
+            candle_trades, scale=orderflow_config["scale"]
+        )
+        assert row["orderflow"] == orderflow.to_dict(orient="index")
+        imbalances = trades_orderflow_to_imbalances(
+            orderflow,
+            imbalance_ratio=orderflow_config["imbalance_ratio"],
+            imbalance_volume=orderflow_config["imbalance_volume"],
+        )
+        assert row["imbalances"] == imbalances.to_dict(orient="index")
+        assert row["stacked_imbalances_bid"] == pytest.approx(
+            stacked_imbalance_bid(imbalances, stacked_imbalance_range=2), nan_ok=True
+        )
+        assert row["stacked_imbalances_ask"] == pytest.approx(
+            stacked_imbalance_ask(imbalances, stacked_imbalance_range=2), nan_ok=True
+        )
+
+        bid = candle_trades.loc[candle_trades["side"] == "sell", "amount"]
+        ask = candle_trades.loc[candle_trades["side"] == "buy", "amount"]
+        cumulative_delta = np.where(
+            candle_trades["side"] == "buy", candle_trades["amount"], -candle_trades["amount"]
+        ).cumsum()
+        assert row["bid"] == pytest.approx(bid.sum())
+        assert row["ask"] == pytest.approx(ask.sum())
+        assert row["delta"] == pytest.approx(ask.sum() - bid.sum())
+        assert row["max_delta"] == pytest.approx(cumulative_delta.max())
+        assert row["min_delta"] == pytest.approx(cumulative_delta.min())
+        assert row["total_trades"] == len(candle_trades)
+
+    # Cached candles are reused - only the new candle is calculated
+    dataframe2 = pd.DataFrame(
+        {"date": pd.date_range("2023-02-02 09:19:00", periods=6, freq="1min", tz="UTC")}
+    )
+    new_trade = trades.iloc[[-1]].drop(columns=["candle_start"])
+    new_trade["date"] = new_trade["date"] + pd.Timedelta(minutes=1)
+    new_trade["timestamp"] = new_trade["timestamp"] + 60_000
+    trades2 = pd.concat([trades.drop(columns=["candle_start"]), new_trade], ignore_index=True)
+    df2, _ = populate_dataframe_with_trades(cached, config, dataframe2, trades2)
+    for col in ORDERFLOW_ADDED_COLUMNS:
+        for value, cached_value in zip(df2[col].iloc[1:5], df[col].iloc[2:6], strict=True):
+            assert value is cached_value or value == cached_value
+    assert df2["total_trades"].iat[5] == 1
+    assert df2["trades"].iat[5][0]["id"] == new_trade["id"].iat[0]
+
+
 def test_public_trades_config_max_trades(
     default_conf, populate_dataframe_with_trades_dataframe, populate_dataframe_with_trades_trades
 ):
@@ -501,7 +580,7 @@ def test_analyze_with_orderflow(
     mocker.patch.object(strategy.dp, "trades", return_value=populate_dataframe_with_trades_trades)
     import freqtrade.data.converter.orderflow as orderflow_module
 
-    spy = mocker.spy(orderflow_module, "trades_to_volumeprofile_with_total_delta_bid_ask")
+    spy = mocker.spy(orderflow_module, "_trades_to_levels")
 
     pair = "ETH/BTC"
     df = strategy.advise_indicators(ohlcv_history, {"pair:": pair})
@@ -528,7 +607,8 @@ def test_analyze_with_orderflow(
     df1 = strategy.advise_indicators(ohlcv_history, {"pair": pair})
     assert len(df1) == len(ohlcv_history)
     assert "open" in df1.columns
-    assert spy.call_count == 5
+    # All candles are calculated at once
+    assert spy.call_count == 1
 
     for col in ORDERFLOW_ADDED_COLUMNS:
         assert col in df1.columns, f"Column {col} not found in df.columns"
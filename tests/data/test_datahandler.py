@@ -3,14 +3,17 @@
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pandas as pd
 import pytest
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, concat, date_range
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import AVAILABLE_DATAHANDLERS
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS
+from freqtrade.data.converter import trades_convert_types, trim_dataframe
 from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.hdf5datahandler import HDF5DataHandler
 from freqtrade.data.history.datahandlers.idatahandler import (
@@ -20,8 +23,9 @@ from freqtrade.data.history.datahandlers.idatahandler import (
 )
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
+from freqtrade.data.history.datahandlers.partitioneddatahandler import PartitionedDataMixin
 from freqtrade.enums import CandleType, TradingMode
-from tests.conftest import log_has, log_has_re
+from tests.conftest import generate_trades_history, log_has, log_has_re
 
 
 def test_datahandler_ohlcv_get_pairs(testdatadir):
@@ -298,23 +302,296 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz", "hdf5"])
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
 ):
     dh = get_datahandler(testdatadir, datahandler)
+    assert not dh.supports_partitions()
+    assert not dh.ohlcv_is_partitioned("UNITTEST/ETH", "5m", CandleType.SPOT)
     with pytest.raises(NotImplementedError):
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.SPOT)
     with pytest.raises(NotImplementedError):
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+def _ohlcv_frame(start: str, periods: int, open_start: float) -> DataFrame:
+    dates = date_range(start, periods=periods, freq="1h", tz="UTC")
+    return DataFrame(
+        {
+            "date": dates,
+            "open": np.arange(periods, dtype="float") + open_start,
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 10.0,
+        }
+    )
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_append_partitioned(tmp_path, caplog, datahandler):
+    dh = get_datahandler(tmp_path, datahandler)
+    ext = dh._get_file_extension()
+    pair_path = tmp_path / "futures" / f"UNITTEST_USDT_USDT-1h-mark.{ext}"
+    data1 = _ohlcv_frame("2023-01-01", 24 * 45, 0)
+    dh.ohlcv_store("UNITTEST/USDT:USDT", "1h", data1, CandleType.MARK)
+    assert pair_path.is_file()
+    assert not dh.ohlcv_is_partitioned("UNITTEST/USDT:USDT", "1h", CandleType.MARK)
+
+    # Overlaps with the last day of data1 - appended candles replace stored ones
+    data2 = _ohlcv_frame("2023-02-14", 24 * 60, 10000)
+    dh.ohlcv_append("UNITTEST/USDT:USDT", "1h", data2, CandleType.MARK)
+    assert log_has(f"Migrating {pair_path} to partitioned storage.", caplog)
+    assert pair_path.is_dir()
+    assert dh.ohlcv_is_partitioned("UNITTEST/USDT:USDT", "1h", CandleType.MARK)
+    assert sorted(p.name for p in pair_path.iterdir()) == [
+        f"2023-01.{ext}",
+        f"2023-02.{ext}",
+        f"2023-03.{ext}",
+        f"2023-04.{ext}",
+        "manifest.json",
+    ]
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.FUTURES) == [
+        ("UNITTEST/USDT:USDT", "1h", CandleType.MARK)
+    ]
+
+    expected = (
+        pd.concat([data1[data1["date"] < data2["date"].iloc[0]], data2])
+        .reset_index(drop=True)
+        .astype({"date": "datetime64[ns, UTC]"})
+    )
+    res = dh.ohlcv_load("UNITTEST/USDT:USDT", "1h", CandleType.MARK, fill_missing=False)
+    assert_frame_equal(res, expected, check_dtype=False)
+    assert dh.ohlcv_data_min_max("UNITTEST/USDT:USDT", "1h", CandleType.MARK) == (
+        datetime(2023, 1, 1, tzinfo=timezone.utc),
+        datetime(2023, 4, 14, 23, tzinfo=timezone.utc),
+        len(expected),
+    )
+
+    # Appending only rewrites the months contained in the new data
+    data3 = _ohlcv_frame("2023-04-14 12:00", 24, 20000)
+    with patch.object(dh, "_write_ohlcv_file", wraps=dh._write_ohlcv_file) as write_mock:
+        dh.ohlcv_append("UNITTEST/USDT:USDT", "1h", data3, CandleType.MARK)
+    # Files are written to a temporary file first
+    assert [c[0][0].name for c in write_mock.call_args_list] == [f"2023-04.{ext}.tmp"]
+    res = dh.ohlcv_load("UNITTEST/USDT:USDT", "1h", CandleType.MARK, fill_missing=False)
+    assert len(res) == len(expected) + 12
+    assert res.iloc[-1]["open"] == 20023
+
+    # Loading a timerange only reads the partitions within it
+    timerange = TimeRange.parse_timerange("20230305-20230310")
+    with patch.object(dh, "_read_ohlcv_file", wraps=dh._read_ohlcv_file) as read_mock:
+        res1 = dh.ohlcv_load("UNITTEST/USDT:USDT", "1h", CandleType.MARK, timerange=timerange)
+    assert [c[0][0].name for c in read_mock.call_args_list] == [f"2023-03.{ext}"]
+    assert_frame_equal(
+        res1, trim_dataframe(res, timerange).reset_index(drop=True), check_dtype=False
+    )
+
+    # Storing keeps the partitioned layout
+    dh.ohlcv_store("UNITTEST/USDT:USDT", "1h", data1, CandleType.MARK)
+    assert pair_path.is_dir()
+    assert len((pair_path / "manifest.json").read_text()) > 0
+    assert not (pair_path / f"2023-03.{ext}").exists()
+    res = dh.ohlcv_load("UNITTEST/USDT:USDT", "1h", CandleType.MARK, fill_missing=False)
+    assert_frame_equal(res, data1.astype({"date": "datetime64[ns, UTC]"}), check_dtype=False)
+
+    assert dh.ohlcv_purge("UNITTEST/USDT:USDT", "1h", CandleType.MARK)
+    assert not pair_path.exists()
+
+    # Appending to missing data starts partitioned data
+    dh.ohlcv_append("UNITTEST/USDT:USDT", "1h", data3, CandleType.MARK)
+    assert pair_path.is_dir()
+    assert dh.ohlcv_data_min_max("UNITTEST/USDT:USDT", "1h", CandleType.MARK)[2] == 24
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_append_partitioned_same_month(tmp_path, datahandler):
+    dh = get_datahandler(tmp_path, datahandler)
+    # Contiguous append within the stored month
+    dh.ohlcv_append("UNITTEST/BTC", "1h", _ohlcv_frame("2023-01-01", 24, 0), CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/BTC", "1h", _ohlcv_frame("2023-01-02", 24, 24), CandleType.SPOT)
+    res = dh.ohlcv_load("UNITTEST/BTC", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(res) == 48
+    assert res["open"].tolist() == list(range(48))
+
+    # Prepend within the stored month, without overlap
+    assert dh.ohlcv_purge("UNITTEST/BTC", "1h", CandleType.SPOT)
+    data1 = _ohlcv_frame("2023-01-10", 24 * 5, 1000)
+    data2 = _ohlcv_frame("2023-01-05", 24 * 5, 0)
+    dh.ohlcv_append("UNITTEST/BTC", "1h", data1, CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/BTC", "1h", data2, CandleType.SPOT)
+    res = dh.ohlcv_load("UNITTEST/BTC", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(res) == 240
+    assert_frame_equal(
+        res,
+        pd.concat([data2, data1], ignore_index=True).astype({"date": "datetime64[ns, UTC]"}),
+        check_dtype=False,
+    )
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "1h", CandleType.SPOT)[2] == 240
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_migrate_to_partitions_interrupted(tmp_path, caplog, datahandler):
+    dh = get_datahandler(tmp_path, datahandler)
+    ext = dh._get_file_extension()
+    pair_path = tmp_path / f"UNITTEST_BTC-1h.{ext}"
+    backup_path = tmp_path / f"UNITTEST_BTC-1h.{ext}.bak"
+    data1 = _ohlcv_frame("2023-01-01", 24 * 45, 0)
+    data2 = _ohlcv_frame("2023-02-14", 24, 10000)
+    dh.ohlcv_store("UNITTEST/BTC", "1h", data1, CandleType.SPOT)
+
+    # Interrupted after moving the original file away
+    with patch.object(Path, "rename", side_effect=OSError("Interrupted")):
+        with pytest.raises(OSError, match="Interrupted"):
+            dh.ohlcv_append("UNITTEST/BTC", "1h", data2, CandleType.SPOT)
+    assert not pair_path.exists()
+    assert backup_path.is_file()
+
+    # The next append restores the original file, and repeats the migration
+    dh.ohlcv_append("UNITTEST/BTC", "1h", data2, CandleType.SPOT)
+    assert log_has(f"Restoring {pair_path} from an interrupted migration.", caplog)
+    assert log_has(f"Migrating {pair_path} to partitioned storage.", caplog)
+    assert pair_path.is_dir()
+    assert not backup_path.exists()
+    assert not (tmp_path / f"UNITTEST_BTC-1h.{ext}.tmp").exists()
+    res = dh.ohlcv_load("UNITTEST/BTC", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(res) == 24 * 45
+    assert res.iloc[-1]["open"] == 10023
+
+    # Interrupted before removing the backup
+    caplog.clear()
+    backup_path.touch()
+    dh.ohlcv_append("UNITTEST/BTC", "1h", data2, CandleType.SPOT)
+    assert not backup_path.exists()
+    assert not log_has_re("Migrating", caplog)
+
+
+def test_datahandler_partition_manifest_atomic(tmp_path):
+    dh = get_datahandler(tmp_path, "feather")
+    dh.ohlcv_append("UNITTEST/BTC", "1h", _ohlcv_frame("2023-01-01", 24, 0), CandleType.SPOT)
+    pair_path = tmp_path / "UNITTEST_BTC-1h.feather"
+    manifest = (pair_path / "manifest.json").read_text()
+
+    # An interrupted manifest write keeps the previous manifest
+    with patch("freqtrade.misc.rapidjson.dump", side_effect=OSError("Interrupted")):
+        with pytest.raises(OSError, match="Interrupted"):
+            dh.ohlcv_append(
+                "UNITTEST/BTC", "1h", _ohlcv_frame("2023-02-01", 24, 0), CandleType.SPOT
+            )
+    assert (pair_path / "manifest.json").read_text() == manifest
+    res = dh.ohlcv_load("UNITTEST/BTC", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(res) == 24
+
+
+@pytest.mark.parametrize("datahandler", ["json", "jsongz", "hdf5"])
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
+    assert not dh.trades_is_partitioned("XRP/ETH", TradingMode.SPOT)
+    assert len(list(dh.trades_iter("XRP/ETH", TradingMode.SPOT))) == 1
     with pytest.raises(NotImplementedError):
-        dh.trades_append("UNITTEST/ETH", DataFrame())
+        dh.trades_append("UNITTEST/ETH", DataFrame(), TradingMode.SPOT)
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_trades_append_partitioned(tmp_path, caplog, datahandler):
+    dh = get_datahandler(tmp_path, datahandler)
+    ext = dh._get_file_extension()
+    pair_path = tmp_path / f"XRP_ETH-trades.{ext}"
+    trades = generate_trades_history(n_rows=2000, days=4)
+    trades["timestamp"] = trades["date"].values.astype("datetime64[ms]").astype("int64")
+    trades1 = trades[trades["date"] < "2020-01-03 12:00:00+00:00"]
+    dh.trades_store("XRP/ETH", trades1, TradingMode.SPOT)
+    assert pair_path.is_file()
+    assert not dh.trades_is_partitioned("XRP/ETH", TradingMode.SPOT)
+
+    # Overlaps with the stored trades - duplicates are removed
+    trades2 = trades[trades["date"] >= "2020-01-03 06:00:00+00:00"]
+    dh.trades_append("XRP/ETH", trades2, TradingMode.SPOT)
+    assert log_has(f"Migrating {pair_path} to partitioned storage.", caplog)
+    assert dh.trades_is_partitioned("XRP/ETH", TradingMode.SPOT)
+    assert sorted(p.name for p in pair_path.iterdir()) == [
+        f"2020-01-01.{ext}",
+        f"2020-01-02.{ext}",
+        f"2020-01-03.{ext}",
+        f"2020-01-04.{ext}",
+        "manifest.json",
+    ]
+    assert dh.trades_get_available_data(tmp_path, TradingMode.SPOT) == ["XRP/ETH"]
+    assert dh.trades_get_pairs(tmp_path) == ["XRP/ETH"]
+
+    expected = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    assert len(expected) == len(trades)
+    assert_frame_equal(
+        expected.reset_index(drop=True),
+        trades_convert_types(trades[DEFAULT_TRADES_COLUMNS]).reset_index(drop=True),
+    )
+    assert dh.trades_data_min_max("XRP/ETH", TradingMode.SPOT) == (
+        expected.iloc[0]["date"].to_pydatetime(),
+        expected.iloc[-1]["date"].to_pydatetime(),
+        len(trades),
+    )
+
+    # Appending only rewrites the days contained in the new trades
+    with patch.object(dh, "_write_trades_file", wraps=dh._write_trades_file) as write_mock:
+        dh.trades_append("XRP/ETH", trades.iloc[-10:], TradingMode.SPOT)
+    assert [c[0][0].name for c in write_mock.call_args_list] == [f"2020-01-04.{ext}.tmp"]
+    assert dh.trades_data_min_max("XRP/ETH", TradingMode.SPOT)[2] == len(trades)
+
+    # Loading a timerange only reads the days within it
+    timerange = TimeRange.parse_timerange("20200102-20200104")
+    with patch.object(dh, "_read_trades_file", wraps=dh._read_trades_file) as read_mock:
+        res = dh.trades_load("XRP/ETH", TradingMode.SPOT, timerange=timerange)
+    assert [c[0][0].name for c in read_mock.call_args_list] == [
+        f"2020-01-02.{ext}",
+        f"2020-01-03.{ext}",
+    ]
+    in_range = (expected["timestamp"] >= timerange.startts * 1000) & (
+        expected["timestamp"] <= timerange.stopts * 1000
+    )
+    assert_frame_equal(res.reset_index(drop=True), expected[in_range].reset_index(drop=True))
+
+    chunks = list(dh.trades_iter("XRP/ETH", TradingMode.SPOT))
+    assert len(chunks) == 4
+    assert_frame_equal(concat(chunks, ignore_index=True), expected.reset_index(drop=True))
+
+    # Storing keeps the partitioned layout
+    dh.trades_store("XRP/ETH", trades1, TradingMode.SPOT)
+    assert pair_path.is_dir()
+    assert not (pair_path / f"2020-01-04.{ext}").exists()
+    assert len(dh.trades_load("XRP/ETH", TradingMode.SPOT)) == len(trades1)
+
+    assert dh.trades_purge("XRP/ETH", TradingMode.SPOT)
+    assert not pair_path.exists()
+
+
+def _trades_frame(start: str, n: int) -> DataFrame:
+    timestamps = Timestamp(start, tz="UTC").value // 10**6 + np.arange(n) * 1000
+    return DataFrame(
+        {
+            "timestamp": timestamps,
+            "id": [str(ts) for ts in timestamps],
+            "type": None,
+            "side": "buy",
+            "price": 1.0,
+            "amount": 2.0,
+            "cost": 2.0,
+        }
+    )
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_trades_append_partitioned_same_day(tmp_path, datahandler):
+    dh = get_datahandler(tmp_path, datahandler)
+    trades1 = _trades_frame("2020-01-01 00:00", 10)
+    trades2 = _trades_frame("2020-01-01 01:00", 10)
+    dh.trades_append("XRP/ETH", trades1, TradingMode.SPOT)
+    dh.trades_append("XRP/ETH", trades2, TradingMode.SPOT)
+    res = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    assert len(res) == 20
+    assert res["id"].tolist() == [*trades1["id"], *trades2["id"]]
+    assert dh.trades_data_min_max("XRP/ETH", TradingMode.SPOT)[2] == 20
 
 
 @pytest.mark.parametrize(
@@ -592,14 +869,19 @@ def test_gethandlerclass():
     cl = get_datahandlerclass("hdf5")
     assert cl == HDF5DataHandler
     assert issubclass(cl, IDataHandler)
+    assert not issubclass(cl, PartitionedDataMixin)
 
     cl = get_datahandlerclass("feather")
     assert cl == FeatherDataHandler
     assert issubclass(cl, IDataHandler)
+    assert issubclass(cl, PartitionedDataMixin)
+    assert cl.supports_partitions()
 
     cl = get_datahandlerclass("parquet")
     assert cl == ParquetDataHandler
     assert issubclass(cl, IDataHandler)
+    assert issubclass(cl, PartitionedDataMixin)
+    assert cl.supports_partitions()
 
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass("DeadBeef")
@@ -615,3 +897,80 @@ def test_get_datahandler(testdatadir):
 
     dh = get_datahandler(testdatadir, "hdf5")
     assert isinstance(dh, HDF5DataHandler)
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_load_timerange_pushdown(tmp_path, datahandler):
+    # Large enough to span multiple record batches / row groups
+    dates = date_range("2023-01-01", periods=150_000, freq="1min", tz="UTC")
+    ohlcv = DataFrame(
+        {
+            "date": dates,
+            "open": np.arange(len(dates), dtype="float"),
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 10.0,
+        }
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/BTC", "1m", ohlcv, CandleType.SPOT)
+    full = dh._ohlcv_load("UNITTEST/BTC", "1m", None, CandleType.SPOT)
+    assert len(full) == len(ohlcv)
+
+    for timerange_str in (
+        "20230110-20230115",
+        "20230110-",
+        "-20230110",
+        "20221201-20230102",
+        "20230401-20230701",
+        "20230701-20230801",
+    ):
+        timerange = TimeRange.parse_timerange(timerange_str)
+        partial = dh._ohlcv_load("UNITTEST/BTC", "1m", timerange, CandleType.SPOT)
+        assert len(partial) <= len(full)
+        trimmed = trim_dataframe(partial, timerange).reset_index(drop=True)
+        assert_frame_equal(trimmed, trim_dataframe(full, timerange).reset_index(drop=True))
+
+        kwargs = {"drop_incomplete": True, "startup_candles": 30}
+        res = dh.ohlcv_load("UNITTEST/BTC", "1m", CandleType.SPOT, timerange=timerange, **kwargs)
+        with patch.object(dh, "_ohlcv_load_bounds", return_value=(None, None)):
+            expected = dh.ohlcv_load(
+                "UNITTEST/BTC", "1m", CandleType.SPOT, timerange=timerange, **kwargs
+            )
+        assert_frame_equal(res, expected)
+
+    # Only a fraction of the file is read
+    timerange = TimeRange.parse_timerange("20230110-20230115")
+    partial = dh._ohlcv_load("UNITTEST/BTC", "1m", timerange, CandleType.SPOT)
+    assert len(partial) < len(full) / 2
+
+
+@pytest.mark.parametrize("tz", [None, "UTC", "Europe/Vienna"])
+def test_parquethandler_ohlcv_load_timerange_tz(tmp_path, tz):
+    dates = date_range("2024-01-01", periods=100, freq="1h", tz=tz)
+    ohlcv = DataFrame(
+        {
+            "date": dates,
+            "open": np.arange(len(dates), dtype="float"),
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 10.0,
+        }
+    )
+    dh = get_datahandler(tmp_path, "parquet")
+    # Written by other tools - the date column is not necessarily UTC
+    ohlcv.to_parquet(dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "1h", CandleType.SPOT))
+
+    full = dh._ohlcv_load("UNITTEST/BTC", "1h", None, CandleType.SPOT)
+    assert len(full) == 100
+
+    timerange = TimeRange.parse_timerange("20240102-20240103")
+    res = dh._ohlcv_load("UNITTEST/BTC", "1h", timerange, CandleType.SPOT)
+    assert len(res) > 0
+    assert len(res) < len(full)
+    assert_frame_equal(
+        trim_dataframe(res, timerange).reset_index(drop=True),
+        trim_dataframe(full, timerange).reset_index(drop=True),
+    )
@@ -3,12 +3,14 @@ from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame, Timestamp
+from pandas.testing import assert_frame_equal
 
+from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import CandleType, RunMode
 from freqtrade.exceptions import ExchangeError, OperationalException
 from freqtrade.plugins.pairlistmanager import PairListManager
-from tests.conftest import EXMS, generate_test_data, get_patched_exchange
+from tests.conftest import EXMS, generate_test_data, get_patched_exchange, log_has
 
 
 @pytest.mark.parametrize(
@@ -62,6 +64,38 @@ def test_historic_ohlcv(mocker, default_conf, ohlcv_history):
     assert historymock.call_args_list[0][1]["timeframe"] == "5m"
 
 
+def test_preload_historic_ohlcv(mocker, default_conf, ohlcv_history):
+    historymock = MagicMock(return_value=ohlcv_history)
+    mocker.patch("freqtrade.data.dataprovider.load_pair_history", historymock)
+    default_conf["runmode"] = RunMode.BACKTEST
+
+    dp = DataProvider(default_conf, None)
+    dp.historic_ohlcv("UNITTEST/BTC", "5m")
+    assert historymock.call_count == 1
+
+    dp.preload_historic_ohlcv(
+        [
+            ("UNITTEST/BTC", "5m", CandleType.SPOT),
+            ("XRP/BTC", "1h", CandleType.SPOT),
+            ("XRP/BTC", "1h", ""),
+            ("ETH/BTC", "1h", CandleType.MARK),
+        ],
+        workers=2,
+    )
+    # Cached and duplicate pairs are not loaded again
+    assert historymock.call_count == 3
+    assert {(c[1]["pair"], c[1]["candle_type"]) for c in historymock.call_args_list[1:]} == {
+        ("XRP/BTC", CandleType.SPOT),
+        ("ETH/BTC", CandleType.MARK),
+    }
+
+    historymock.reset_mock()
+    data = dp.historic_ohlcv("XRP/BTC", "1h")
+    assert_frame_equal(data, ohlcv_history)
+    dp.historic_ohlcv("ETH/BTC", "1h", "mark")
+    assert historymock.call_count == 0
+
+
 def test_historic_trades(mocker, default_conf, trades_history_df):
     historymock = MagicMock(return_value=trades_history_df)
     mocker.patch(
@@ -90,6 +124,11 @@ def test_historic_trades(mocker, default_conf, trades_history_df):
     assert isinstance(data, DataFrame)
     assert len(data) == len(trades_history_df)
 
+    timerange = TimeRange.parse_timerange("20190814-20190815")
+    data = dp.trades("UNITTEST/BTC", "5m", timerange=timerange)
+    assert historymock.call_args[1]["timerange"] == timerange
+    assert len(data) == len(trades_history_df)
+
 
 def test_historic_ohlcv_dataformat(mocker, default_conf, ohlcv_history):
     hdf5loadmock = MagicMock(return_value=ohlcv_history)
@@ -555,6 +594,27 @@ def test_dp__add_external_df(default_conf_usdt):
     assert res[1] == 0
 
 
+def test_dp__add_external_df_columns_changed(default_conf_usdt, caplog):
+    timeframe = "1h"
+    dp = DataProvider(default_conf_usdt, None)
+    df = generate_test_data(timeframe, 24, "2022-01-01 00:00:00+00:00")
+    last_analyzed = datetime.now(timezone.utc)
+    assert dp._get_producer_last_candles() == {}
+
+    dp._replace_external_df("ETH/USDT", df, last_analyzed, timeframe, CandleType.SPOT)
+    # 2022-01-01 23:00:00
+    assert dp._get_producer_last_candles() == {"ETH/USDT": 1641078000000}
+    assert dp._get_producer_last_candles("other") == {}
+
+    df2 = generate_test_data(timeframe, 2, "2022-01-02 00:00:00+00:00")
+    df2["rsi"] = 50
+    res = dp._add_external_df("ETH/USDT", df2, last_analyzed, timeframe, CandleType.SPOT)
+    assert res == (False, 1000)
+    assert log_has("Columns of ETH/USDT, 1h, spot from default changed.", caplog)
+    df_res, _ = dp.get_producer_df("ETH/USDT", timeframe, CandleType.SPOT)
+    assert len(df_res) == 24
+
+
 def test_dp_get_required_startup(default_conf_usdt):
     timeframe = "1h"
     default_conf_usdt["timeframe"] = timeframe
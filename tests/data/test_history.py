@@ -2,20 +2,23 @@
 
 import json
 import logging
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 from shutil import copyfile
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, concat, date_range
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
 from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.data.history import get_datahandler
+from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.history_utils import (
     _download_pair_history,
@@ -24,6 +27,7 @@ from freqtrade.data.history.history_utils import (
     get_timerange,
     load_data,
     load_pair_history,
+    map_pair_loads,
     refresh_backtest_ohlcv_data,
     refresh_backtest_trades_data,
     refresh_data,
@@ -121,6 +125,39 @@ def test_load_data_startup_candles(mocker, testdatadir) -> None:
     assert ltfmock.call_args_list[0][1]["timerange"].startts == timerange.startts - 20 * 60
 
 
+@pytest.mark.parametrize("threaded", [True, False])
+def test_load_data_workers(mocker, testdatadir, threaded) -> None:
+    mocker.patch.object(FeatherDataHandler, "_threaded_load", threaded)
+    pairs = ["XRP/ETH", "NOPAIR/XXX", "ETH/BTC", "ADA/BTC", "UNITTEST/BTC", "LTC/BTC"]
+    timerange = TimeRange.parse_timerange("20180115-20180120")
+    serial = load_data(testdatadir, "5m", pairs, timerange=timerange)
+    assert list(serial) == ["ETH/BTC", "ADA/BTC", "UNITTEST/BTC", "LTC/BTC"]
+
+    map_mock = mocker.spy(ThreadPoolExecutor, "map")
+    data = load_data(testdatadir, "5m", pairs, timerange=timerange, workers=4)
+    # Threads are only used for data handlers releasing the GIL
+    assert map_mock.call_count == (1 if threaded else 0)
+    # Same data, in the same order
+    assert list(data) == list(serial)
+    for pair, df in serial.items():
+        assert_frame_equal(data[pair], df)
+
+
+def test_map_pair_loads(testdatadir) -> None:
+    dh = get_datahandler(testdatadir, "feather")
+    items = list(range(20))
+
+    def load(item: int) -> DataFrame:
+        # Finish in reverse order
+        time.sleep((20 - item) / 1000)
+        return DataFrame({"item": [item]})
+
+    for workers in (1, 4, 50):
+        res = map_pair_loads(load, items, dh, workers)
+        assert [df.iloc[0]["item"] for df in res] == items
+    assert map_pair_loads(load, [], dh, 4) == []
+
+
 @pytest.mark.parametrize("candle_type", ["mark", ""])
 def test_load_data_with_new_pair_1min(
     ohlcv_history, mocker, caplog, default_conf, tmp_path, candle_type
@@ -383,6 +420,59 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
     assert json_dump_mock.call_count == 3
 
 
+def test_download_pair_history_partitioned(mocker, default_conf, caplog, tmp_path) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    dh = get_datahandler(tmp_path, "feather")
+    stored = DataFrame(
+        {
+            "date": date_range("2023-01-01", periods=24 * 50, freq="1h", tz="UTC"),
+            "open": 1.0,
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 1.0,
+        }
+    )
+    dh.ohlcv_store("UNITTEST/BTC", "1h", stored, CandleType.SPOT)
+    new_data = stored.iloc[-2:].assign(open=2.0)
+    new_data = concat([new_data, new_data.assign(date=new_data["date"] + timedelta(hours=2))])
+    dl_mock = mocker.patch.object(exchange, "get_historic_ohlcv", return_value=new_data)
+
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="UNITTEST/BTC",
+        timeframe="1h",
+        candle_type=CandleType.SPOT,
+        data_handler=dh,
+        partitioned=True,
+    )
+    # Download restarts at the last complete candle
+    assert dl_mock.call_args[1]["since_ms"] == dt_ts(stored["date"].iloc[-2])
+    assert log_has_re(r"Migrating .*UNITTEST_BTC-1h.feather to partitioned storage\.", caplog)
+    assert dh.ohlcv_is_partitioned("UNITTEST/BTC", "1h", CandleType.SPOT)
+
+    # Updating partitioned data only loads the last candles
+    caplog.clear()
+    load_mock = mocker.spy(dh, "_ohlcv_load")
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="UNITTEST/BTC",
+        timeframe="1h",
+        candle_type=CandleType.SPOT,
+        data_handler=dh,
+    )
+    assert load_mock.call_args[1]["timerange"].startts == dt_ts(new_data["date"].iloc[-2]) // 1000
+    assert dl_mock.call_args[1]["since_ms"] == dt_ts(new_data["date"].iloc[-2])
+    assert not log_has_re(r"Migrating .*", caplog)
+
+    res = dh.ohlcv_load("UNITTEST/BTC", "1h", CandleType.SPOT, fill_missing=False)
+    assert len(res) == len(stored) + 2
+    assert (res["open"].iloc[-4:] == 2.0).all()
+    assert (res["open"].iloc[:-4] == 1.0).all()
+
+
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
     mocker.patch(f"{EXMS}.get_historic_ohlcv", side_effect=Exception("File Error"))
     exchange = get_patched_exchange(mocker, default_conf)
@@ -571,6 +661,60 @@ def test_refresh_backtest_ohlcv_data(
         assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
 
 
+@pytest.mark.parametrize("trademode,jobs", [("spot", 4), ("futures", 8)])
+def test_refresh_backtest_ohlcv_data_concurrent(
+    mocker, default_conf, markets, caplog, tmp_path, ohlcv_history, trademode, jobs
+):
+    caplog.set_level(logging.DEBUG)
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    default_conf["trading_mode"] = trademode
+    ex = get_patched_exchange(mocker, default_conf, exchange="bybit")
+    dl_mock = mocker.patch.object(
+        ex, "_async_get_historic_ohlcv_df", AsyncMock(return_value=ohlcv_history)
+    )
+
+    pairs_not_available = refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=["ETH/BTC", "XRP/BTC", "NOPE/BTC"],
+        timeframes=["1m", "5m"],
+        datadir=tmp_path,
+        trading_mode=trademode,
+        workers=3,
+    )
+    assert pairs_not_available == ["NOPE/BTC: Pair not available on exchange."]
+    assert dl_mock.call_count == jobs
+    assert log_has_re(r"Downloading pair ETH/BTC, .* interval 1m\.", caplog)
+    assert log_has_re(
+        rf"Downloaded {len(ohlcv_history) * jobs} candles for {jobs} pair / timeframe "
+        r"combinations from Bybit in .*s \(\d+ candles/s\)\.",
+        caplog,
+    )
+    dh = get_datahandler(tmp_path, "feather")
+    candle_type = CandleType.get_default(trademode)
+    for pair in ["ETH/BTC", "XRP/BTC"]:
+        for tf in ["1m", "5m"]:
+            data = dh.ohlcv_load(pair, tf, candle_type=candle_type, fill_missing=False)
+            assert len(data) == len(ohlcv_history)
+    if trademode == "futures":
+        assert log_has_re(r"Downloading pair ETH/BTC, funding_rate, interval 8h\.", caplog)
+        assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
+
+    # A failing download does not stop the remaining ones
+    caplog.clear()
+    dl_mock.side_effect = [ValueError("boom")] + [ohlcv_history] * (jobs - 1)
+    refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=["ETH/BTC", "XRP/BTC"],
+        timeframes=["1m", "5m"],
+        datadir=tmp_path,
+        trading_mode=trademode,
+        workers=3,
+    )
+    assert dl_mock.call_count == jobs * 2
+    assert log_has_re(r"Failed to download history data for pair: .*", caplog)
+    assert log_has_re(rf"Downloaded .* candles for {jobs} pair / timeframe", caplog)
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch(
         "freqtrade.data.history.history_utils._download_pair_history", MagicMock()
@@ -698,3 +842,46 @@ def test_download_trades_history(
     assert ght_mock.call_count == 0
 
     _clean_test_file(file2)
+
+
+def test_download_trades_history_partitioned(
+    trades_history, mocker, default_conf, caplog, tmp_path
+) -> None:
+    ght_mock = MagicMock(side_effect=lambda pair, *args, **kwargs: (pair, trades_history))
+    mocker.patch(f"{EXMS}.get_historic_trades", ght_mock)
+    exchange = get_patched_exchange(mocker, default_conf)
+    data_handler = get_datahandler(tmp_path, data_format="feather")
+    file1 = tmp_path / "ETH_BTC-trades.feather"
+
+    assert _download_trades_history(
+        data_handler=data_handler,
+        exchange=exchange,
+        pair="ETH/BTC",
+        trading_mode=TradingMode.SPOT,
+        partitioned=True,
+    )
+    assert file1.is_dir()
+    assert log_has("New Amount of trades: 6", caplog)
+    caplog.clear()
+
+    # Updates only load the last trades - and don't duplicate trades
+    load_mock = mocker.spy(data_handler, "_trades_load")
+    assert _download_trades_history(
+        data_handler=data_handler, exchange=exchange, pair="ETH/BTC", trading_mode=TradingMode.SPOT
+    )
+    assert load_mock.call_args[1]["timerange"].startts == trades_history[-1][0] // 1000
+    assert ght_mock.call_args[1]["since"] == trades_history[-1][0] - 5000
+    assert ght_mock.call_args[1]["from_id"] == trades_history[-1][1]
+    assert log_has("Current Amount of trades: 6", caplog)
+    assert log_has("New Amount of trades: 6", caplog)
+
+    # Since before first start date
+    since_time = int(trades_history[0][0] // 1000) - 500
+    with pytest.raises(ValueError, match=r"Start .* earlier than available data"):
+        _download_trades_history(
+            data_handler=data_handler,
+            exchange=exchange,
+            pair="ETH/BTC",
+            timerange=TimeRange("date", None, since_time, 0),
+            trading_mode=TradingMode.SPOT,
+        )
@@ -781,7 +781,7 @@ def patch_binance_vision_ohlcv(mocker, start, archive_end, api_end, timeframe):
         ]
 
     candle_mock = mocker.patch(f"{EXMS}._async_get_candle_history", return_value=candle_history)
-    api_mock = mocker.patch(f"{EXMS}.get_historic_ohlcv", side_effect=get_historic_ohlcv)
+    api_mock = mocker.patch(f"{EXMS}._async_get_historic_ohlcv_df", side_effect=get_historic_ohlcv)
     archive_mock = mocker.patch(
         "freqtrade.exchange.binance.download_archive_ohlcv", side_effect=download_archive_ohlcv
     )
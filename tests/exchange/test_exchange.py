@@ -2550,6 +2550,8 @@ def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_mach
     assert len(res[pair2]) == 100
     # Verify index starts at 0
     assert res[pair2].at[0, "open"]
+    assert exchange._klines[pair1] is res[pair1]
+    assert len(exchange._klines_buffers[pair1]) == 100
     assert refresh_pior != exchange._pairs_last_refresh_time[pair1]
 
     assert exchange._pairs_last_refresh_time[pair1] == ohlcv[-2][0] // 1000
@@ -2574,10 +2576,27 @@ def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_mach
     assert len(res) == 2
     # Cache eviction - new data.
     assert len(res[pair1]) == 99
+    assert pair1 not in exchange._klines_buffers
     assert len(res[pair2]) == 99
     assert res[pair2].at[0, "open"]
 
 
+def test_wait_for_candle_close(mocker, default_conf) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    sleep_mock = mocker.patch("freqtrade.exchange.exchange.time.sleep")
+    assert exchange.has_candle_close_events is False
+    assert exchange.wait_for_candle_close(2.5) is False
+    assert sleep_mock.call_args[0][0] == 2.5
+
+    exchange._exchange_ws = MagicMock()
+    exchange._exchange_ws.wait_for_candle_close.return_value = True
+    assert exchange.has_candle_close_events is True
+    assert exchange.wait_for_candle_close(2.5) is True
+    assert exchange._exchange_ws.wait_for_candle_close.call_args[0][0] == 2.5
+    assert sleep_mock.call_count == 1
+    exchange._exchange_ws = None
+
+
 def test_refresh_ohlcv_with_cache(mocker, default_conf, time_machine) -> None:
     start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
     ohlcv = generate_test_data_raw("1h", 100, start.strftime("%Y-%m-%d"))
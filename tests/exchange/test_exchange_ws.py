@@ -1,10 +1,14 @@
 import asyncio
 import threading
-from time import sleep
+from threading import Timer
+from time import monotonic, sleep
 from unittest.mock import AsyncMock, MagicMock
 
+import time_machine
+
 from freqtrade.enums import CandleType
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.util import dt_ts, dt_utc
 
 
 def test_exchangews_init(mocker):
@@ -67,3 +71,90 @@ async def test_exchangews_ohlcv(mocker):
     finally:
         # Cleanup
         exchange_ws.cleanup()
+
+
+def test_exchangews_wait_for_candle_close(mocker):
+    ccxt_object = MagicMock()
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+    exchange_ws = ExchangeWS(MagicMock(), ccxt_object)
+    pair1 = ("ETH/BTC", "5m", CandleType.SPOT)
+    pair2 = ("XRP/BTC", "5m", CandleType.SPOT)
+    try:
+        with time_machine.travel("2024-01-01 00:04:30 +00:00", tick=False) as t:
+            ccxt_object.ohlcvs = {
+                "ETH/BTC": {"5m": [[dt_ts(dt_utc(2024, 1, 1, 0, 0)), 1, 1, 1, 1, 1]]},
+                "XRP/BTC": {"5m": [[dt_ts(dt_utc(2024, 1, 1, 0, 0)), 1, 1, 1, 1, 1]]},
+            }
+            exchange_ws._klines_watching = {pair1, pair2}
+            exchange_ws._update_last_candle(*pair1)
+            exchange_ws._update_last_candle(*pair2)
+            # No candle closed
+            assert exchange_ws.wait_for_candle_close(0.01) is False
+
+            t.move_to("2024-01-01 00:05:00.200 +00:00")
+            ccxt_object.ohlcvs["ETH/BTC"]["5m"].append([dt_ts(dt_utc(2024, 1, 1, 0, 5)), 1])
+            exchange_ws._update_last_candle(*pair1)
+            # pair2 receives its new candle during the grace period
+            Timer(
+                0.05,
+                lambda: (
+                    ccxt_object.ohlcvs["XRP/BTC"]["5m"].append(
+                        [dt_ts(dt_utc(2024, 1, 1, 0, 5)), 1]
+                    ),
+                    exchange_ws._update_last_candle(*pair2),
+                ),
+            ).start()
+            start = monotonic()
+            assert exchange_ws.wait_for_candle_close(10) is True
+            assert monotonic() - start < 1
+            assert exchange_ws._klines_up_to_date()
+            # Closed candles only wake up once
+            assert exchange_ws.wait_for_candle_close(0.01) is False
+
+            # Updates of the current candle
+            exchange_ws._update_last_candle(*pair1)
+            assert exchange_ws.wait_for_candle_close(0.01) is False
+    finally:
+        exchange_ws.cleanup()
+
+
+def test_exchangews_wait_for_candle_close_lagging_pair(mocker):
+    ccxt_object = MagicMock()
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+    exchange_ws = ExchangeWS(MagicMock(), ccxt_object)
+    exchange_ws._candle_close_grace = 0.2
+    pair1 = ("ETH/BTC", "5m", CandleType.SPOT)
+    pair2 = ("XRP/BTC", "5m", CandleType.SPOT)
+    try:
+        with time_machine.travel("2024-01-01 00:04:30 +00:00", tick=False) as t:
+            ccxt_object.ohlcvs = {
+                "ETH/BTC": {"5m": [[dt_ts(dt_utc(2024, 1, 1, 0, 0)), 1, 1, 1, 1, 1]]},
+                "XRP/BTC": {"5m": [[dt_ts(dt_utc(2024, 1, 1, 0, 0)), 1, 1, 1, 1, 1]]},
+            }
+            exchange_ws._klines_watching = {pair1, pair2}
+            exchange_ws._update_last_candle(*pair1)
+            exchange_ws._update_last_candle(*pair2)
+
+            t.move_to("2024-01-01 00:05:00.200 +00:00")
+            ccxt_object.ohlcvs["ETH/BTC"]["5m"].append([dt_ts(dt_utc(2024, 1, 1, 0, 5)), 1])
+            exchange_ws._update_last_candle(*pair1)
+            # pair2 never receives its new candle - waiting is limited to the grace period
+            start = monotonic()
+            assert exchange_ws.wait_for_candle_close(10) is True
+            assert 0.2 <= monotonic() - start < 2
+            assert not exchange_ws._klines_up_to_date()
+
+            # A late candle of the same period doesn't wake up again
+            ccxt_object.ohlcvs["XRP/BTC"]["5m"].append([dt_ts(dt_utc(2024, 1, 1, 0, 5)), 1])
+            exchange_ws._update_last_candle(*pair2)
+            assert exchange_ws.wait_for_candle_close(0.01) is False
+
+            # The grace period is limited by the timeout
+            t.move_to("2024-01-01 00:10:00.200 +00:00")
+            ccxt_object.ohlcvs["ETH/BTC"]["5m"].append([dt_ts(dt_utc(2024, 1, 1, 0, 10)), 1])
+            exchange_ws._update_last_candle(*pair1)
+            start = monotonic()
+            assert exchange_ws.wait_for_candle_close(0.05) is True
+            assert monotonic() - start < 0.2
+    finally:
+        exchange_ws.cleanup()
@@ -0,0 +1,87 @@
+import numpy as np
+from pandas import concat
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe
+from freqtrade.exchange.ohlcv_buffer import OHLCVBuffer
+from tests.conftest import generate_test_data_raw
+
+
+def test_ohlcv_buffer_update():
+    ohlcv = generate_test_data_raw("5m", 500, "2024-01-01")
+    buffer = OHLCVBuffer("5m", 100)
+    assert len(buffer) == 0
+    assert buffer.dataframe().empty
+
+    expected = ohlcv_to_dataframe(ohlcv[:80], "5m", "UNITTEST/USDT", drop_incomplete=False)
+    assert buffer.update(expected)
+    assert len(buffer) == 80
+    assert_frame_equal(buffer.dataframe(), expected)
+    assert buffer.update(expected.iloc[:0])
+    assert len(buffer) == 80
+
+    # Overlapping refreshes, as done by refresh_latest_ohlcv
+    for end in range(82, 500, 7):
+        new = ohlcv_to_dataframe(
+            ohlcv[end - 10 : end], "5m", "UNITTEST/USDT", drop_incomplete=False
+        )
+        assert buffer.update(new)
+        expected = clean_ohlcv_dataframe(
+            concat([expected, new]),
+            "5m",
+            "UNITTEST/USDT",
+            fill_missing=True,
+            drop_incomplete=False,
+        )
+        expected = expected.tail(100).reset_index(drop=True)
+        assert_frame_equal(buffer.dataframe(), expected)
+
+    # Directly adjacent candles
+    new = ohlcv_to_dataframe(ohlcv[end : end + 1], "5m", "UNITTEST/USDT", drop_incomplete=False)
+    assert buffer.update(new)
+    assert len(buffer) == 100
+    assert buffer.dataframe().iloc[-1]["date"] == new.iloc[-1]["date"]
+
+    # More candles than capacity
+    buffer = OHLCVBuffer("5m", 100)
+    new = ohlcv_to_dataframe(ohlcv[200:], "5m", "UNITTEST/USDT", drop_incomplete=False)
+    assert buffer.update(new)
+    assert_frame_equal(buffer.dataframe(), new.tail(100).reset_index(drop=True))
+
+
+def test_ohlcv_buffer_update_rejected():
+    ohlcv = generate_test_data_raw("1h", 100, "2024-01-01")
+    buffer = OHLCVBuffer("1h", 100)
+    buffer.update(ohlcv_to_dataframe(ohlcv[10:50], "1h", "UNITTEST/USDT", drop_incomplete=False))
+    before = buffer.dataframe()
+
+    # Starts before the buffered candles
+    assert not buffer.update(ohlcv_to_dataframe(ohlcv[5:60], "1h", "UNITTEST/USDT"))
+    # Ends before the last buffered candle
+    assert not buffer.update(ohlcv_to_dataframe(ohlcv[20:40], "1h", "UNITTEST/USDT"))
+    # Gap after the buffered candles
+    assert not buffer.update(ohlcv_to_dataframe(ohlcv[51:60], "1h", "UNITTEST/USDT"))
+    # Not aligned to the buffered candles
+    new = ohlcv_to_dataframe(ohlcv[40:60], "1h", "UNITTEST/USDT")
+    new["date"] += np.timedelta64(30, "m")
+    assert not buffer.update(new)
+
+    assert_frame_equal(buffer.dataframe(), before)
+
+
+def test_ohlcv_buffer_reallocation():
+    ohlcv = generate_test_data_raw("1m", 100, "2024-01-01")
+    buffer = OHLCVBuffer("1m", 10)
+    buffer.update(ohlcv_to_dataframe(ohlcv[:10], "1m", "UNITTEST/USDT", drop_incomplete=False))
+    dataframes = [buffer.dataframe()]
+    for end in range(11, 100):
+        new = ohlcv_to_dataframe(ohlcv[end - 2 : end], "1m", "UNITTEST/USDT", drop_incomplete=False)
+        assert buffer.update(new)
+        dataframes.append(buffer.dataframe())
+        assert len(buffer) == 10
+
+    # Storage is limited to twice the capacity
+    assert len(buffer._dates) == 20
+    # Earlier dataframes are not overwritten by later updates
+    for idx, df in enumerate(dataframes):
+        assert df.iloc[0]["open"] == ohlcv[idx][1]
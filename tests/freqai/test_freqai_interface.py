@@ -1,14 +1,19 @@
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import RunMode
+from freqtrade.freqai import freqai_interface
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.freqai_interface import IFreqaiModel, _init_backtest_training_worker
 from freqtrade.freqai.utils import download_all_data_for_training, get_required_data_timerange
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import Trade
@@ -346,6 +351,124 @@ def test_start_backtesting_subdaily_backtest_period(mocker, freqai_conf):
     shutil.rmtree(Path(freqai.dk.full_path))
 
 
+def test_start_backtesting_parallel_training(mocker, freqai_conf, caplog):
+    freqai_conf.update({"timerange": "20180120-20180124"})
+    freqai_conf["runmode"] = "backtest"
+    freqai_conf.get("freqai", {}).update(
+        {
+            "backtest_period_days": 0.5,
+            "save_backtest_models": True,
+        }
+    )
+    freqai_conf.get("freqai", {}).get("feature_parameters", {}).update(
+        {"indicator_periods_candles": [2]}
+    )
+    predictions = {}
+    for workers in (1, 2):
+        freqai_conf["freqai"].update(
+            {"backtest_training_workers": workers, "identifier": f"parallel-{workers}"}
+        )
+        strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+        exchange = get_patched_exchange(mocker, freqai_conf)
+        strategy.dp = DataProvider(freqai_conf, exchange)
+        strategy.freqai_info = freqai_conf.get("freqai", {})
+        freqai = strategy.freqai
+        freqai.live = False
+        freqai.dk = FreqaiDataKitchen(freqai_conf)
+        timerange = TimeRange.parse_timerange("20180110-20180130")
+        freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+        sub_timerange = TimeRange.parse_timerange("20180110-20180130")
+        _, base_df = freqai.dd.get_base_and_corr_dataframes(sub_timerange, "LTC/BTC", freqai.dk)
+        df = base_df[freqai_conf["timeframe"]]
+
+        metadata = {"pair": "LTC/BTC"}
+        dk = freqai.start_backtesting(df, metadata, freqai.dk, strategy)
+        predictions[workers] = dk.return_dataframe
+
+        model_folders = [x for x in freqai.dd.full_path.iterdir() if x.is_dir()]
+        assert len(model_folders) == 9
+        path = freqai.dd.full_path / freqai.dk.backtest_predictions_folder
+        assert len([x for x in path.iterdir() if x.is_file()]) == 8
+        shutil.rmtree(Path(freqai.dk.full_path))
+
+    # Windows trained in parallel are assembled in order - with the same predictions
+    assert not log_has_re("backtest training worker failed", caplog)
+    assert_frame_equal(predictions[1], predictions[2])
+
+
+def test_start_backtesting_parallel_training_failure(mocker, freqai_conf, caplog):
+    freqai_conf.update({"timerange": "20180120-20180124"})
+    freqai_conf["runmode"] = "backtest"
+    freqai_conf.get("freqai", {}).update(
+        {"backtest_period_days": 0.5, "save_backtest_models": True, "backtest_training_workers": 2}
+    )
+    freqai_conf.get("freqai", {}).get("feature_parameters", {}).update(
+        {"indicator_periods_candles": [2]}
+    )
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    strategy.freqai_info = freqai_conf.get("freqai", {})
+    freqai = strategy.freqai
+    freqai.live = False
+    freqai.dk = FreqaiDataKitchen(freqai_conf)
+    timerange = TimeRange.parse_timerange("20180110-20180130")
+    freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+    _, base_df = freqai.dd.get_base_and_corr_dataframes(timerange, "LTC/BTC", freqai.dk)
+    df = base_df[freqai_conf["timeframe"]]
+
+    # Every window fails in the worker - and is retrained sequentially
+    mocker.patch.object(freqai, "_backtest_training_executor", return_value=ThreadPoolExecutor(2))
+    mocker.patch(
+        "freqtrade.freqai.freqai_interface._train_backtest_window",
+        side_effect=BrokenProcessPool("worker died"),
+    )
+    dk = freqai.start_backtesting(df, {"pair": "LTC/BTC"}, freqai.dk, strategy)
+
+    assert log_has_re(r"Training LTC/BTC in a backtest training worker failed", caplog)
+    assert "do_predict" in dk.return_dataframe.columns
+    model_folders = [x for x in freqai.dd.full_path.iterdir() if x.is_dir()]
+    assert len(model_folders) == 9
+    path = freqai.dd.full_path / freqai.dk.backtest_predictions_folder
+    assert len([x for x in path.iterdir() if x.is_file()]) == 8
+    shutil.rmtree(Path(freqai.dk.full_path))
+
+
+def test_init_backtest_training_worker(mocker, freqai_conf):
+    mocker.patch.object(IFreqaiModel, "_backtest_training_worker", False)
+    record_mock = mocker.patch("freqtrade.freqai.freqai_interface.record_params")
+    load_mock = mocker.patch(
+        "freqtrade.freqai.data_drawer.FreqaiDataDrawer.load_historic_predictions_from_disk"
+    )
+
+    _init_backtest_training_worker(freqai_conf)
+    worker_freqai = freqai_interface._worker_freqai
+    assert isinstance(worker_freqai, IFreqaiModel)
+    assert worker_freqai.live is False
+    # The state on disk belongs to the main process
+    assert record_mock.call_count == 0
+    assert load_mock.call_count == 0
+    freqai_interface._worker_freqai = None
+
+
+def test_start_backtesting_parallel_training_unsupported(mocker, freqai_conf, caplog):
+    freqai_conf.get("freqai", {}).update(
+        {"backtest_training_workers": 2, "continual_learning": True}
+    )
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    freqai = strategy.freqai
+
+    assert freqai._backtest_training_executor() is None
+    assert log_has_re("Parallel backtest training requires independent joblib models", caplog)
+    assert freqai.freqai_info["backtest_training_workers"] == 1
+
+    freqai.continual_learning = False
+    freqai.freqai_info["backtest_training_workers"] = 2
+    executor = freqai._backtest_training_executor()
+    assert executor is not None
+    executor.shutdown()
+
+
 def test_start_backtesting_from_existing_folder(mocker, freqai_conf, caplog):
     freqai_conf.update({"timerange": "20180120-20180130"})
     freqai_conf["runmode"] = "backtest"
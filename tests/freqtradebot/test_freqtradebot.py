@@ -106,6 +106,17 @@ def test_process_calls_sendmsg(mocker, default_conf_usdt) -> None:
     assert freqtrade.rpc.process_msg_queue.call_count == 1
 
 
+def test_analysis_took_too_long(mocker, default_conf_usdt, caplog) -> None:
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    freqtrade.strategy._analysis_durations = {"ETH/USDT": 1.5, "XRP/USDT": 4.0, "LTC/USDT": 0.1}
+    freqtrade._measure_execution._callback(20.0, 15.0)
+    assert log_has_re(
+        r"Strategy analysis took 20\.00s.*Slowest pairs: XRP/USDT \(4\.00s\), "
+        r"ETH/USDT \(1\.50s\), LTC/USDT \(0\.10s\)\.",
+        caplog,
+    )
+
+
 def test_bot_cleanup(mocker, default_conf_usdt, caplog) -> None:
     mock_cleanup = mocker.patch("freqtrade.freqtradebot.Trade.commit")
     coo_mock = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.cancel_all_open_orders")
@@ -132,6 +132,28 @@ def test_throttle_sleep_time(mocker, default_conf, caplog) -> None:
         assert 11.1 < sleep_mock.call_args[0][0] < 13.2
 
 
+def test_throttle_wait_for_candle_close(mocker, default_conf, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    default_conf["internals"] = {"process_on_candle_close": True}
+    mocker.patch(f"{EXMS}.has_candle_close_events", PropertyMock(return_value=False))
+    worker = get_patched_worker(mocker, default_conf)
+    assert log_has_re(r"`process_on_candle_close` requires exchange websockets.*", caplog)
+    assert worker._process_on_candle_close is False
+
+    mocker.patch(f"{EXMS}.has_candle_close_events", PropertyMock(return_value=True))
+    worker = get_patched_worker(mocker, default_conf)
+    assert worker._process_on_candle_close is True
+
+    sleep_mock = mocker.patch("freqtrade.worker.Worker._sleep")
+    wait_mock = mocker.patch(f"{EXMS}.wait_for_candle_close", return_value=True)
+    mocker.patch.object(worker.freqtrade, "process")
+    worker._worker(old_state=State.RUNNING)
+    assert sleep_mock.call_count == 0
+    assert wait_mock.call_count == 1
+    assert 0 <= wait_mock.call_args[0][0] <= 5
+    assert log_has("Woken up by candle close.", caplog)
+
+
 def test_throttle_with_assets(mocker, default_conf) -> None:
     def throttled_func(nb_assets=-1):
         return nb_assets
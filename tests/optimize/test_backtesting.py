@@ -23,7 +23,12 @@ from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
-from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.backtest_columnar import (
+    ColumnarPairData,
+    DetailPairData,
+    build_time_axis,
+)
+from freqtrade.optimize.backtesting import HEADERS, Backtesting
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
@@ -301,6 +306,23 @@ def test_backtesting_init(mocker, default_conf, order_types) -> None:
     assert backtesting.strategy.bot_started is True
 
 
+def test_backtesting_preload_informative_data(mocker, default_conf) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    informative = [("ETH/BTC", "1h", CandleType.SPOT)]
+    mocker.patch.object(backtesting.strategy, "gather_informative_pairs", return_value=informative)
+    preload_mock = mocker.patch.object(backtesting.dataprovider, "preload_historic_ohlcv")
+
+    assert backtesting.dataload_workers == 1
+    backtesting.preload_informative_data()
+    assert preload_mock.call_count == 0
+
+    backtesting.dataload_workers = 4
+    backtesting.preload_informative_data()
+    preload_mock.assert_called_once_with(informative, 4)
+
+
 def test_backtesting_init_no_timeframe(mocker, default_conf, caplog) -> None:
     patch_exchange(mocker)
     del default_conf["timeframe"]
@@ -842,6 +864,61 @@ def test_backtest_one(default_conf, mocker, testdatadir) -> None:
         ) < round(t["close_rate"], 6) < round(ln1.iloc[0]["high"], 6)
 
 
+def test_backtest_signal_cache(default_conf, mocker, testdatadir) -> None:
+    default_conf["max_open_trades"] = 10
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    advise_mock = mocker.spy(backtesting.strategy, "ft_advise_signals")
+    signal_cache: dict = {}
+
+    result = backtesting.backtest(
+        processed=deepcopy(processed),
+        start_date=min_date,
+        end_date=max_date,
+        signal_cache=signal_cache,
+        signal_cache_key="key1",
+    )
+    assert advise_mock.call_count == 1
+    assert list(signal_cache) == ["key1"]
+
+    # Same key - signals are reused
+    processed_2 = deepcopy(processed)
+    result_2 = backtesting.backtest(
+        processed=processed_2,
+        start_date=min_date,
+        end_date=max_date,
+        signal_cache=signal_cache,
+        signal_cache_key="key1",
+    )
+    assert advise_mock.call_count == 1
+    pd.testing.assert_frame_equal(result["results"], result_2["results"])
+    # Processed data is trimmed, just like without the cache
+    assert processed_2["UNITTEST/BTC"] is signal_cache["key1"]["processed"]["UNITTEST/BTC"]
+    assert len(processed_2["UNITTEST/BTC"]) < len(processed["UNITTEST/BTC"])
+    df, _ = backtesting.dataprovider.get_analyzed_dataframe("UNITTEST/BTC", "5m")
+    assert "enter_long" in df.columns
+
+    # New key - signals are regenerated
+    backtesting.backtest(
+        processed=deepcopy(processed),
+        start_date=min_date,
+        end_date=max_date,
+        signal_cache=signal_cache,
+        signal_cache_key="key2",
+    )
+    assert advise_mock.call_count == 2
+    assert list(signal_cache) == ["key1", "key2"]
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 def test_backtest_one_detail(default_conf_usdt, mocker, testdatadir, use_detail) -> None:
     default_conf_usdt["use_exit_signal"] = False
@@ -1675,6 +1752,161 @@ def test_backtest_multi_pair_detail(
     assert len(evaluate_result_multi(results["results"], "5m", 1)) == 0
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+@pytest.mark.parametrize("tres", [0, 30])
+def test_backtest_columnar_engine(default_conf_usdt, fee, mocker, tres, use_detail):
+    """
+    The columnar engine must produce the same results as the default engine.
+    """
+
+    def _trend_sparse(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/USDT", "LTC/USDT") else 17
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 3) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        dataframe["enter_tag"] = np.where(dataframe.index % 3 == 0, "tag_a", None)
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "stoploss": -0.01,
+            "minimal_roi": {"0": 0.02},
+            "timeframe": "5m",
+            "max_open_trades": 3,
+        }
+    )
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 1500, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = trim_dictlist({pair: raw_candles for pair in pairs}, -250)
+    if tres > 0:
+        # Missing start for one pair, missing end for another
+        data["LTC/USDT"] = data["LTC/USDT"][tres:].reset_index()
+        data["ADA/USDT"] = data["ADA/USDT"][:-tres].reset_index()
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting.detail_data = {pair: raw_candles_1m for pair in pairs}
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.bot_loop_start = MagicMock()
+        backtesting.strategy.advise_entry = _trend_sparse  # Override
+        backtesting.strategy.advise_exit = _trend_sparse  # Override
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        results[engine]["bot_loop_start_calls"] = backtesting.strategy.bot_loop_start.call_count
+        # Dataprovider is left in the same state by both engines
+        results[engine]["analyzed_len"] = len(
+            backtesting.dataprovider.get_analyzed_dataframe("NXT/USDT", "5m")[0]
+        )
+
+    default, columnar = results["default"], results["columnar"]
+    assert len(default["results"]) > 10
+    pd.testing.assert_frame_equal(default.pop("results"), columnar.pop("results"))
+    default.pop("config")
+    columnar.pop("config")
+    assert default == columnar
+
+
+def test_columnar_pair_data():
+    df = generate_test_data("5m", 20, "2022-01-03 12:00:00+00:00")
+    df["enter_long"] = np.where(df.index % 4 == 0, 1.0, 0.0)
+    df["exit_long"] = 0.0
+    df["enter_short"] = np.where(df.index % 5 == 0, 1.0, 0.0)
+    df["exit_short"] = 0.0
+    df["enter_tag"] = np.where(df.index % 2 == 0, "tag", None)
+    df["exit_tag"] = None
+    # Gap in the data
+    df = df.drop([7, 8]).reset_index(drop=True)
+    columnar = ColumnarPairData(df[HEADERS])
+    expected = df[HEADERS].values.tolist()
+    assert len(columnar) == 18
+    assert [list(columnar[i]) for i in range(len(columnar))] == expected
+    assert [type(x) for x in columnar[3]] == [type(x) for x in expected[3]]
+    assert list(columnar[-1]) == expected[-1]
+    with pytest.raises(IndexError):
+        columnar[18]
+
+    start = df["date"].iloc[0].to_pydatetime() - timedelta(minutes=10)
+    end = df["date"].iloc[-1].to_pydatetime()
+    time_axis = build_time_axis(start, end, timedelta(minutes=5))
+    assert len(time_axis) == 21
+    columnar.assign_steps(time_axis)
+
+    # Same logic as the regular backtest loop (one row per step, once the date is reached)
+    expected_steps = []
+    row_index = 0
+    for step, current_time in enumerate(time_axis):
+        if row_index < len(expected) and expected[row_index][0].value <= current_time:
+            expected_steps.append(step)
+            row_index += 1
+    assert columnar.consume_steps.tolist() == expected_steps
+    assert columnar.row_index_at(0) == -1
+    assert columnar.row_index_at(1) == 0
+    # Gap in the data
+    assert columnar.row_index_at(8) == -1
+    assert columnar.row_index_at(10) == 7
+
+    entry_steps = columnar.entry_signal_steps(False)
+    assert entry_steps.tolist() == [
+        s for s, r in zip(expected_steps, expected, strict=False) if r[5] == 1
+    ]
+    assert len(columnar.entry_signal_steps(True)) > len(entry_steps)
+
+
+@pytest.mark.parametrize(
+    "signals", [(1.0, 0.0, 0.0, 0.0, "tag", None), (0.0, 1.0, 0.0, 0.0, None, "x")]
+)
+def test_detail_pair_data(signals):
+    detail_df = generate_test_data("1m", 100, "2022-01-03 12:00:00+00:00")
+    # Gap in the detail data
+    detail_df = detail_df.drop([12, 13, 14]).reset_index(drop=True)
+    detail = DetailPairData(detail_df)
+
+    for candle_start in pd.date_range("2022-01-03 11:55:00+00:00", periods=23, freq="5min"):
+        candle_end = candle_start + timedelta(minutes=5)
+        # Previous implementation - filtering the detail dataframe
+        expected_df = detail_df.loc[
+            (detail_df["date"] >= candle_start) & (detail_df["date"] < candle_end)
+        ].copy()
+        expected = []
+        if len(expected_df):
+            for col, value in zip(HEADERS[5:], signals, strict=True):
+                expected_df.loc[:, col] = value
+            expected = expected_df[HEADERS].values.tolist()
+
+        start, end = detail.candle_range(candle_start.value, candle_end.value)
+        rows = detail.rows(start, end, signals)
+        assert [list(r) for r in rows] == expected
+        assert [[type(x) for x in r] for r in rows] == [[type(x) for x in r] for r in expected]
+
+    # First candle is before the data, last candle after
+    assert detail.candle_range(
+        pd.Timestamp("2022-01-03 11:55:00+00:00").value,
+        pd.Timestamp("2022-01-03 12:00:00+00:00").value,
+    ) == (0, 0)
+    assert detail.candle_range(
+        pd.Timestamp("2022-01-03 12:10:00+00:00").value,
+        pd.Timestamp("2022-01-03 12:15:00+00:00").value,
+    ) == (10, 12)
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 @pytest.mark.parametrize("pair", ["ADA/USDT", "LTC/USDT"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
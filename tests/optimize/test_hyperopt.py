@@ -1,9 +1,11 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+import pickle
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import numpy as np
 import pandas as pd
 import pytest
 from filelock import Timeout
@@ -15,6 +17,7 @@ from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data_store import HyperoptDataStore
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal
@@ -32,6 +35,9 @@ from tests.conftest import (
 )
 
 
+HDS = "freqtrade.optimize.hyperopt.hyperopt_data_store.HyperoptDataStore"
+
+
 def generate_result_metrics():
     return {
         "trade_count": 1,
@@ -338,7 +344,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
 
 
 def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch(f"{HDS}.store")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -541,9 +547,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     patch_exchange(mocker)
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
-    mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
-    )
+    mocker.patch(f"{HDS}.load", return_value={"XRP/BTC": None})
 
     optimizer_param = {
         "buy_plusdi": 0.02,
@@ -612,6 +616,34 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     assert generate_optimizer_value == response_expected
 
 
+def test_get_signal_cache_key(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"spaces": "all"})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopter = hyperopt.hyperopter
+    hyperopter.init_spaces()
+    hyperopter.data_store.store_id = "store1"
+    # Buy and sell spaces are optimized - signals change every epoch
+    assert hyperopter._get_signal_cache_key() is None
+
+    hyperopt_conf.update({"spaces": ["roi", "stoploss"]})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopter = hyperopt.hyperopter
+    hyperopter.init_spaces()
+    assert hyperopter.buy_space == []
+    assert hyperopter.sell_space == []
+    hyperopter.data_store.store_id = "store1"
+    key = hyperopter._get_signal_cache_key()
+    assert key == ("store1",)
+
+    # New data - new key
+    hyperopter.data_store.store_id = "store2"
+    assert hyperopter._get_signal_cache_key() != key
+
+    hyperopter.analyze_per_epoch = True
+    assert hyperopter._get_signal_cache_key() is None
+
+
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     patch_exchange(mocker)
 
@@ -621,14 +653,66 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     )
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.is_file", MagicMock(return_value=True))
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
+    cleanup_mock = mocker.patch(f"{HDS}.cleanup")
     h = Hyperopt(hyperopt_conf)
 
+    # Results file and results index
     assert unlinkmock.call_count == 2
-    assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
+    assert cleanup_mock.call_count == 1
+    assert log_has(f"Removing `{h.results_file}`.", caplog)
+    assert log_has(f"Removing `{h.results_file}.idx`.", caplog)
+
+
+def test_hyperopt_data_store(mocker, tmp_path, testdatadir):
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC", "XRP/ETH"])
+    data["UNITTEST/BTC"]["enter_tag"] = "tag"
+    data["UNITTEST/BTC"]["int_col"] = 5
+    data["XRP/ETH"] = data["XRP/ETH"].iloc[0:0]
+    store = HyperoptDataStore(tmp_path / "hyperopt_tickerdata")
+    store.store(data)
+    assert (tmp_path / "hyperopt_tickerdata" / "manifest.json").is_file()
+
+    loaded = store.load()
+    assert loaded.keys() == data.keys()
+    for pair, df in data.items():
+        pd.testing.assert_frame_equal(loaded[pair], df)
+
+    # Float columns are read-only memory-maps
+    assert not loaded["UNITTEST/BTC"]["close"].to_numpy().flags.writeable
+
+    # Modifications of the loaded data don't leak into the next load
+    loaded["UNITTEST/BTC"]["enter_long"] = 1
+    loaded["UNITTEST/BTC"].loc[0, "enter_tag"] = "modified"
+    loaded["UNITTEST/BTC"].loc[0, "int_col"] = 10
+    loaded["UNITTEST/BTC"].loc[0, "date"] = dt_utc(2000, 1, 1)
+    loaded_2 = store.load()
+    assert "enter_long" not in loaded_2["UNITTEST/BTC"].columns
+    pd.testing.assert_frame_equal(loaded_2["UNITTEST/BTC"], data["UNITTEST/BTC"])
+    # Float columns can't be modified in place
+    with pytest.raises(ValueError, match="read-only"):
+        loaded_2["UNITTEST/BTC"].loc[0, "close"] = 1.0
+
+    # Pickled store (as sent to the workers) attaches to the same data
+    store_2 = pickle.loads(pickle.dumps(store))  # noqa: S301
+    pd.testing.assert_frame_equal(store_2.load()["UNITTEST/BTC"], data["UNITTEST/BTC"])
+
+    # The store is attached once per process
+    attach_spy = mocker.spy(store, "_attach")
+    store.load()
+    assert attach_spy.call_count == 0
+
+    # Storing new data invalidates the attached data
+    store.store({"UNITTEST/BTC": data["UNITTEST/BTC"].iloc[:10]})
+    assert len(store.load()["UNITTEST/BTC"]) == 10
+    with pytest.raises(ValueError, match=r"Hyperopt data in .* was replaced\."):
+        store_2.load()
+
+    store.cleanup()
+    assert not (tmp_path / "hyperopt_tickerdata").exists()
 
 
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch(f"{HDS}.store")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -695,7 +779,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch(f"{HDS}.store")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -752,7 +836,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch(f"{HDS}.store")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -807,7 +891,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch(f"{HDS}.store")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -861,7 +945,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch(f"{HDS}.store", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -900,7 +984,7 @@ def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
 
 
 def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch(f"{HDS}.store")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -954,7 +1038,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch(f"{HDS}.store")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -1020,7 +1104,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     ],
 )
 def test_simplified_interface_failed(mocker, hyperopt_conf, space) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch(f"{HDS}.store", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -1093,7 +1177,10 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmp_path, fee) -> None
 
 
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
-def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path, fee) -> None:
+@pytest.mark.parametrize("hyperopt_async", [False, True])
+def test_in_strategy_auto_hyperopt_with_parallel(
+    mocker, hyperopt_conf, tmp_path, fee, hyperopt_async
+) -> None:
     mocker.patch(f"{EXMS}.validate_config", MagicMock())
     mocker.patch(f"{EXMS}.get_fee", fee)
     mocker.patch(f"{EXMS}.reload_markets")
@@ -1109,8 +1196,9 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
             "hyperopt_random_state": 42,
             "spaces": ["all"],
             # Enforce parallelity
-            "epochs": 2,
+            "epochs": 4,
             "hyperopt_jobs": 2,
+            "hyperopt_async": hyperopt_async,
             "fee": fee.return_value,
         }
     )
@@ -1137,6 +1225,54 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
 
     hyperopt.start()
 
+    epochs = next(HyperoptTools._read_results(hyperopt.results_file))
+    assert [e["current_epoch"] for e in epochs] == [1, 2, 3, 4]
+    # All points are unique
+    assert len({str(e["params_dict"]) for e in epochs}) == 4
+
+
+def test_get_asked_points_pending(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"spaces": "all"})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.init_spaces()
+    hyperopt.opt = hyperopt.hyperopter.get_optimizer(2, 42, 2, 10)
+
+    asked, is_random = hyperopt.get_asked_points(n_points=2)
+    assert len(asked) == 2
+    assert is_random == [False, False]
+    hyperopt.tell_results(asked[:1], [1.0])
+
+    # Pending points are not asked again - and are not told to the optimizer
+    asked_2, _ = hyperopt.get_asked_points(n_points=3, pending=asked[1:])
+    assert len(asked_2) == 3
+    assert asked[0] not in asked_2
+    assert asked[1] not in asked_2
+    assert hyperopt.opt.Xi == asked[:1]
+    assert hyperopt.opt.yi == [1.0]
+    assert hyperopt.evaluated_points == {hyperopt._point_key(asked[0])}
+
+    # Pending points assume the worst loss - without fitting the optimizer
+    copy_mock = mocker.spy(hyperopt.opt, "copy")
+    liar_opt = hyperopt._get_constant_liar_optimizer(asked[1:])
+    assert liar_opt.Xi == asked
+    assert liar_opt.yi == [1.0, 1.0]
+    assert hyperopt.opt.Xi == asked[:1]
+    assert copy_mock.call_count == 0
+
+    # Results can be told without refitting the optimizer
+    hyperopt.tell_results(asked_2[:2], [2.0, 3.0], fit=False)
+    assert hyperopt.opt.yi == [1.0, 2.0, 3.0]
+    assert hyperopt.opt.models == []
+
+    # Evaluated points are skipped - also when returned as numpy types
+    hyperopt.opt.ask = MagicMock(
+        return_value=[[np.int64(v) if isinstance(v, int) else v for v in asked[0]], asked[1]]
+    )
+    asked_3, is_random = hyperopt.get_asked_points(n_points=1)
+    assert asked_3 == [asked[1]]
+    assert is_random == [False]
+
 
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fee) -> None:
     patch_exchange(mocker)
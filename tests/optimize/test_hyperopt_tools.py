@@ -10,6 +10,7 @@ from freqtrade.constants import FTHYPT_FILEVERSION
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
+from tests.conftest_hyperopt import hyperopt_test_result
 
 
 # Functions for recurrent object patching
@@ -53,6 +54,45 @@ def test_save_results_saves_epochs(hyperopt, tmp_path, caplog) -> None:
         next(result_gen)
 
 
+def test_load_filtered_results_index(hyperopt, tmp_path, caplog) -> None:
+    hyperopt.results_file = tmp_path / "ut_results.fthypt"
+    index_file = tmp_path / "ut_results.fthypt.idx"
+    epochs = hyperopt_test_result()
+    for epoch in epochs:
+        hyperopt._save_result(epoch)
+    assert index_file.is_file()
+    # Epochs as stored in the results file
+    saved = next(HyperoptTools._read_results(hyperopt.results_file, 100))
+
+    config = {"hyperopt_list_best": True}
+    res, total = HyperoptTools.load_filtered_results(hyperopt.results_file, config)
+    assert log_has("Loaded 12 previous evaluations from index.", caplog)
+    assert total == 12
+    assert res == [e for e in saved if e["is_best"]]
+
+    summaries, total = HyperoptTools.load_filtered_results(
+        hyperopt.results_file, {"hyperopt_list_min_trades": 100}, summary=True
+    )
+    assert total == 12
+    assert [s["current_epoch"] for s in summaries] == [3, 7, 9, 11]
+    assert "params_dict" not in summaries[0]
+    assert summaries[0]["results_metrics"]["total_trades"] == 621
+    assert HyperoptTools.load_epochs(hyperopt.results_file, summaries[1:2]) == [saved[6]]
+
+    # Epochs loaded without index are returned unchanged
+    assert HyperoptTools.load_epochs(hyperopt.results_file, epochs[:2]) == epochs[:2]
+
+    # Index not matching the results file
+    with hyperopt.results_file.open("a") as f:
+        f.write(rapidjson.dumps(saved[0]) + "\n")
+    caplog.clear()
+    res, total = HyperoptTools.load_filtered_results(hyperopt.results_file, config)
+    assert log_has(f"Index '{index_file}' is outdated, reading all epochs.", caplog)
+    assert log_has("Loaded 13 previous evaluations from disk.", caplog)
+    assert total == 13
+    assert len(res) == 4
+
+
 def test_load_previous_results2(mocker, testdatadir, caplog) -> None:
     results_file = testdatadir / "hyperopt_results_SampleStrategy.pickle"
     with pytest.raises(
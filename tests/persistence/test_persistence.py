@@ -1926,6 +1926,35 @@ def test_get_overall_performance(fee):
     assert "count" in res[0]
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_get_mix_tag_performance(fee):
+    create_mock_trades_usdt(fee)
+    res = Trade.get_mix_tag_performance(None)
+    assert [r["mix_tag"] for r in res] == ["TEST1 exit_signal", "TEST3 roi", "Other Other"]
+
+    # Trades with the same tags are aggregated - missing tags count as "Other"
+    trade = Trade.session.get(Trade, 3)
+    trade.enter_tag = "TEST1"
+    trade.exit_reason = "exit_signal"
+    trade = Trade.session.get(Trade, 1)
+    trade.enter_tag = "Other"
+    Trade.commit()
+
+    res = Trade.get_mix_tag_performance(None)
+    assert len(res) == 2
+    assert res[0]["mix_tag"] == "TEST1 exit_signal"
+    assert res[0]["count"] == 2
+    assert pytest.approx(res[0]["profit_ratio"]) == 0.15
+    assert pytest.approx(res[0]["profit_pct"]) == 15.0
+    assert pytest.approx(res[0]["profit_abs"]) == 6.83
+    assert res[1]["mix_tag"] == "Other Other"
+    assert res[1]["count"] == 1
+
+    res = Trade.get_mix_tag_performance("XRP/USDT")
+    assert len(res) == 1
+    assert res[0]["count"] == 1
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize(
     "is_short,pair,profit",
@@ -1958,6 +1987,38 @@ def test_get_best_pair_lev(fee):
     assert res[1] == 0.1713156134055116
 
 
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize("is_short", [True, False])
+def test_get_closed_profit_summary(fee, is_short):
+    res = Trade.get_closed_profit_summary()
+    assert res == {
+        "trade_count": 0,
+        "profit_abs": 0.0,
+        "profit_ratio": 0.0,
+        "winning_trades": 0,
+        "winning_profit": 0.0,
+        "losing_trades": 0,
+        "losing_profit": 0.0,
+    }
+
+    create_mock_trades(fee, is_short)
+    closed = Trade.get_trades_proxy(is_open=False)
+    res = Trade.get_closed_profit_summary()
+    assert res["trade_count"] == len(closed)
+    assert pytest.approx(res["profit_abs"]) == sum(t.close_profit_abs for t in closed)
+    assert pytest.approx(res["profit_ratio"]) == sum(t.close_profit for t in closed)
+    winners = [t for t in closed if t.close_profit >= 0]
+    assert res["winning_trades"] == len(winners)
+    assert res["losing_trades"] == len(closed) - len(winners)
+    assert pytest.approx(res["winning_profit"]) == sum(t.close_profit_abs for t in winners)
+    assert pytest.approx(res["losing_profit"]) == sum(
+        t.close_profit_abs for t in closed if t not in winners
+    )
+
+    res = Trade.get_closed_profit_summary(datetime.now(timezone.utc))
+    assert res["trade_count"] == 0
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_canceled_exit_order_count(fee, is_short):
@@ -2125,6 +2186,7 @@ def test_Trade_object_idem():
         "query",
         "open_date",
         "get_best_pair",
+        "get_closed_profit_summary",
         "get_overall_performance",
         "get_total_closed_profit",
         "total_open_trades_stakes",
@@ -2146,6 +2208,7 @@ def test_Trade_object_idem():
         "bt_open_open_trade_count",
         "bt_open_open_trade_count_candle",
         "bt_total_profit",
+        "bt_closed_stats",
         "from_json",
     )
 
@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from freqtrade.data.metrics import calculate_max_drawdown
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.persistence.trade_stats import ClosedTradeStats
+from freqtrade.util import dt_utc
+from tests.conftest import create_mock_trades
+
+
+def _closed_trade(pair: str, minutes: int, profit: float) -> LocalTrade:
+    start = dt_utc(2024, 1, 1)
+    return LocalTrade(
+        pair=pair,
+        open_rate=1.0,
+        amount=1.0,
+        fee_open=0.0,
+        fee_close=0.0,
+        is_open=False,
+        open_date=start,
+        close_date=start + timedelta(minutes=minutes),
+        close_profit=profit,
+    )
+
+
+def test_closed_trade_stats():
+    start = dt_utc(2024, 1, 1)
+    profits = [0.02, -0.03, 0.01, -0.02, -0.01, 0.04, -0.05, 0.01]
+    trades = [_closed_trade("ETH/USDT", (i + 1) * 10, p) for i, p in enumerate(profits)]
+
+    stats = ClosedTradeStats()
+    assert len(stats) == 0
+    assert stats.trades_since(start) == []
+    assert stats.profit_since(start) == 0
+    assert stats.max_drawdown_since(start) == 0.0
+
+    # Add out of order - trades are kept sorted by close date
+    for trade in trades[4:] + trades[:4]:
+        stats.add(trade)
+    assert len(stats) == 8
+    assert stats.trades == trades
+    assert ClosedTradeStats(reversed(trades)).trades == trades
+
+    for minutes in (0, 10, 15, 40, 75, 80):
+        since = start + timedelta(minutes=minutes)
+        expected = [t for t in trades if t.close_date > since]
+        assert stats.trades_since(since) == expected
+        assert stats.profit_since(since) == sum(t.close_profit for t in expected)
+
+        if len(expected) > 1:
+            df = pd.DataFrame([t.to_json() for t in expected])
+            try:
+                expected_dd = calculate_max_drawdown(df, value_col="close_profit").drawdown_abs
+            except ValueError:
+                expected_dd = 0.0
+            assert stats.max_drawdown_since(since) == expected_dd
+
+    assert stats.max_drawdown_since(start + timedelta(minutes=75)) == 0.0
+    assert stats.max_drawdown_since(start + timedelta(minutes=45)) == pytest.approx(0.05)
+
+
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize("use_db", [True, False])
+def test_get_closed_trade_stats(fee, use_db):
+    Trade.use_db = use_db
+    Trade.reset_trades()
+    create_mock_trades(fee, use_db=use_db)
+    since = dt_utc(2017, 1, 1)
+
+    stats = Trade.get_closed_trade_stats(None, since)
+    closed = Trade.get_trades_proxy(is_open=False)
+    assert len(stats.trades_since(since)) == len(closed) == 2
+    close_dates = [t.close_date_utc for t in stats.trades_since(since)]
+    assert close_dates == sorted(close_dates)
+
+    pair_stats = Trade.get_closed_trade_stats("ETC/BTC", since)
+    assert {t.pair for t in pair_stats.trades_since(since)} == {"ETC/BTC"}
+    assert len(Trade.get_closed_trade_stats("XRP/USDT", since)) == 0
+
+    # get_trades_proxy returns the same trades
+    assert {(t.pair, t.close_date_utc) for t in stats.trades_since(since)} == {
+        (t.pair, t.close_date_utc) for t in Trade.get_trades_proxy(is_open=False, close_date=since)
+    }
+    assert Trade.get_trades_proxy(is_open=False, close_date=dt_utc(2050, 1, 1)) == []
+
+    Trade.reset_trades()
+    assert len(Trade.get_closed_trade_stats(None, since)) == (2 if use_db else 0)
+    Trade.use_db = True
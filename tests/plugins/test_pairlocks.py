@@ -155,3 +155,55 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_backtest_index():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2020, 5, 1, 10, 0, 0, tzinfo=timezone.utc)
+    pair = "XRP/USDT"
+
+    # Locks added out of end-time order
+    PairLocks.lock_pair(pair, start + timedelta(minutes=60), "Lock60", now=start)
+    PairLocks.lock_pair(pair, start + timedelta(minutes=20), "Lock20", now=start, side="long")
+    PairLocks.lock_pair(pair, start + timedelta(minutes=40), "Lock40", now=start, side="short")
+    PairLocks.lock_pair("ETH/USDT", start + timedelta(minutes=80), "LockETH", now=start)
+
+    assert [lock.reason for lock in PairLocks.locks_by_pair[pair]] == [
+        "Lock20",
+        "Lock40",
+        "Lock60",
+    ]
+    assert [lock.reason for lock in PairLocks.get_all_locks()] == [
+        "Lock60",
+        "Lock20",
+        "Lock40",
+        "LockETH",
+    ]
+
+    def reasons(now, side="*"):
+        return sorted(lock.reason for lock in PairLocks.get_pair_locks(pair, now, side))
+
+    assert reasons(start + timedelta(minutes=10)) == ["Lock60"]
+    assert reasons(start + timedelta(minutes=10), "long") == ["Lock20", "Lock60"]
+    assert reasons(start + timedelta(minutes=30), "long") == ["Lock60"]
+    assert reasons(start + timedelta(minutes=30), "short") == ["Lock40", "Lock60"]
+    assert reasons(start + timedelta(minutes=70)) == []
+    # Querying an earlier time again still returns the locks active at that time
+    assert reasons(start + timedelta(minutes=20), "long") == ["Lock20", "Lock60"]
+    assert reasons(start + timedelta(minutes=20), "long") == ["Lock20", "Lock60"]
+
+    assert not PairLocks.is_pair_locked("BTC/USDT", start)
+    PairLocks.lock_pair("*", start + timedelta(minutes=10), "Global", now=start)
+    assert PairLocks.is_pair_locked("BTC/USDT", start)
+    assert not PairLocks.is_pair_locked("BTC/USDT", start + timedelta(minutes=20))
+
+    PairLocks.unlock_pair(pair, start + timedelta(minutes=30), side="short")
+    assert not PairLocks.is_pair_locked(pair, start + timedelta(minutes=30), "short")
+    assert len(PairLocks.get_pair_locks(None, start + timedelta(minutes=30))) == 1
+
+    PairLocks.reset_locks()
+    assert PairLocks.locks_by_pair == {}
+    PairLocks.use_db = True
@@ -7,16 +7,18 @@ from numpy import isnan
 from sqlalchemy import select
 
 from freqtrade.edge import PairInfo
-from freqtrade.enums import SignalDirection, State, TradingMode
+from freqtrade.enums import CandleType, SignalDirection, State, TradingMode
 from freqtrade.exceptions import ExchangeError, InvalidOrderException, TemporaryError
 from freqtrade.persistence import Order, Trade
 from freqtrade.persistence.key_value_store import set_startup_time
 from freqtrade.rpc import RPC, RPCException
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
+from freqtrade.util import dt_ts
 from tests.conftest import (
     EXMS,
     create_mock_trades,
     create_mock_trades_usdt,
+    generate_test_data,
     get_patched_freqtradebot,
     patch_get_signal,
 )
@@ -1228,6 +1230,78 @@ def test_rpc_whitelist(mocker, default_conf) -> None:
     assert ret["whitelist"] == default_conf["exchange"]["pair_whitelist"]
 
 
+def test_rpc_ws_request_analyzed_df_since(mocker, default_conf) -> None:
+    mocker.patch("freqtrade.rpc.telegram.Telegram", MagicMock())
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf)
+    df = generate_test_data("5m", 500, "2024-01-01")
+    freqtradebot.dataprovider._set_cached_df("ETH/BTC", "5m", df, CandleType.SPOT)
+    freqtradebot.dataprovider._set_cached_df("LTC/BTC", "5m", df, CandleType.SPOT)
+    rpc = RPC(freqtradebot)
+
+    res = list(rpc._ws_request_analyzed_df(200, "ETH/BTC"))
+    assert len(res) == 1
+    assert res[0]["key"] == ("ETH/BTC", "5m", CandleType.SPOT)
+    assert len(res[0]["df"]) == 200
+
+    # Resume from the consumer's last candle (inclusive)
+    since = {"ETH/BTC": dt_ts(df.iloc[-10]["date"]), "LTC/BTC": dt_ts(df.iloc[-150]["date"])}
+    res = {r["key"][0]: r["df"] for r in rpc._ws_request_analyzed_df(300, None, since)}
+    assert len(res["ETH/BTC"]) == 10
+    assert res["ETH/BTC"].iloc[0]["date"] == df.iloc[-10]["date"]
+    # Too many missing candles - full dataframe
+    assert len(res["LTC/BTC"]) == 300
+    # No candles since this date
+    since = {"ETH/BTC": dt_ts(df.iloc[-1]["date"] + timedelta(minutes=5))}
+    assert len(next(rpc._ws_request_analyzed_df(300, "ETH/BTC", since))["df"]) == 300
+
+
+def test_rpc_analysed_dataframe(mocker, default_conf) -> None:
+    mocker.patch("freqtrade.rpc.telegram.Telegram", MagicMock())
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf)
+    df = generate_test_data("5m", 100, "2024-01-01")
+    df["sma"] = df["close"].rolling(10).mean()
+    df.loc[50, "sma"] = float("inf")
+    df["enter_long"] = 0
+    df.loc[95, "enter_long"] = 1
+    freqtradebot.dataprovider._set_cached_df("ETH/BTC", "5m", df, CandleType.SPOT)
+    rpc = RPC(freqtradebot)
+    convert_mock = mocker.spy(RPC, "_convert_dataframe_to_dict")
+
+    res = rpc._rpc_analysed_dataframe("ETH/BTC", "5m", 60, None)
+    assert res["length"] == 60
+    assert res["enter_long_signals"] == 1
+    assert convert_mock.call_count == 1
+    # Only the requested candles are copied
+    assert len(convert_mock.call_args[0][3]) == 60
+
+    res_col = rpc._rpc_analysed_dataframe("ETH/BTC", "5m", 60, None, columnar=True)
+    assert convert_mock.call_count == 2
+    assert list(res_col["data"].keys()) == res["columns"]
+    assert res_col["columns"] == res["columns"]
+    for idx, col in enumerate(res["columns"]):
+        assert res_col["data"][col] == [row[idx] for row in res["data"]]
+    # Non-finite values are returned as None
+    assert res_col["data"]["sma"][10] is None
+    assert res_col["data"]["_enter_long_signal_close"].count(None) == 59
+
+    # Cached until the pair is analyzed again
+    assert rpc._rpc_analysed_dataframe("ETH/BTC", "5m", 60, None) == res
+    assert rpc._rpc_analysed_dataframe("ETH/BTC", "5m", 60, None, columnar=True) == res_col
+    assert convert_mock.call_count == 2
+    # Callers get their own copy of the response
+    res["pair"] = "modified"
+    assert rpc._rpc_analysed_dataframe("ETH/BTC", "5m", 60, None)["pair"] == "ETH/BTC"
+    assert convert_mock.call_count == 2
+    rpc._rpc_analysed_dataframe("ETH/BTC", "5m", 60, ["sma"])
+    rpc._rpc_analysed_dataframe("ETH/BTC", "5m", 50, None)
+    assert convert_mock.call_count == 4
+
+    freqtradebot.dataprovider._set_cached_df("ETH/BTC", "5m", df.iloc[:-1], CandleType.SPOT)
+    res2 = rpc._rpc_analysed_dataframe("ETH/BTC", "5m", 60, None)
+    assert convert_mock.call_count == 5
+    assert res2["data_stop_ts"] == res_col["data_stop_ts"] - 300_000
+
+
 def test_rpc_whitelist_dynamic(mocker, default_conf) -> None:
     default_conf["pairlists"] = [
         {
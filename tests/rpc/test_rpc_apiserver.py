@@ -16,6 +16,7 @@ import uvicorn
 from fastapi import FastAPI, WebSocketDisconnect
 from fastapi.exceptions import HTTPException
 from fastapi.testclient import TestClient
+from pandas.testing import assert_frame_equal
 from requests.auth import _basic_auth_str
 from sqlalchemy import select
 
@@ -28,8 +29,10 @@ from freqtrade.persistence import Trade
 from freqtrade.rpc import RPC
 from freqtrade.rpc.api_server import ApiServer
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
+from freqtrade.rpc.api_server.api_ws import _get_analyzed_df_since
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
+from freqtrade.rpc.api_server.ws.serializer import ARROW_MESSAGE_MAGIC, ArrowWebSocketSerializer
 from freqtrade.util.datetime_helpers import format_date
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -2826,6 +2829,87 @@ def test_api_ws_requests(botclient, caplog):
     assert log_has_re(r"Request of type analyzed_df from.+", caplog)
     assert response["type"] == "analyzed_df"
 
+    caplog.clear()
+    # Invalid since is ignored
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json({"type": "analyzed_df", "data": {"limit": 100, "since": {"XRP/BTC": "a"}}})
+        response = ws.receive_json()
+
+    assert log_has_re(r"Invalid `since` in request from.+", caplog)
+    assert response["type"] == "analyzed_df"
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (None, None),
+        ({}, None),
+        ({"since": None}, None),
+        ({"since": {"XRP/BTC": 1700000000000}}, {"XRP/BTC": 1700000000000}),
+        ({"since": {"XRP/BTC": "1700000000000"}}, {"XRP/BTC": 1700000000000}),
+        ({"since": 1700000000000}, None),
+        ({"since": ["XRP/BTC"]}, None),
+        ({"since": {"XRP/BTC": "abc"}}, None),
+        ({"since": {"XRP/BTC": 1.5}}, None),
+        ({"since": {"XRP/BTC": -1}}, None),
+        ({"since": {"XRP/BTC": 10**19}}, None),
+    ],
+)
+def test_api_ws_analyzed_df_since(caplog, data, expected):
+    assert _get_analyzed_df_since(data, MagicMock()) == expected
+    assert log_has_re(r"Invalid `since` in request from.+", caplog) == (
+        data is not None and data.get("since") is not None and expected is None
+    )
+
+
+def test_api_ws_requests_arrow(botclient, ohlcv_history):
+    ftbot, client = botclient
+    ftbot.dataprovider._set_cached_df("XRP/BTC", "5m", ohlcv_history, CandleType.SPOT)
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}&encoding=arrow"
+    serializer = ArrowWebSocketSerializer(None)
+
+    with client.websocket_connect(ws_url) as ws:
+        # Messages without dataframes remain JSON
+        ws.send_json({"type": "whitelist", "data": None})
+        response = ws.receive_json()
+        assert response["type"] == "whitelist"
+
+        ws.send_json({"type": "analyzed_df", "data": {"limit": 100, "pair": "XRP/BTC"}})
+        response = serializer._deserialize(ws.receive_bytes())
+
+    assert response["type"] == "analyzed_df"
+    assert response["data"]["key"] == ["XRP/BTC", "5m", "spot"]
+    assert_frame_equal(response["data"]["df"], ohlcv_history.tail(100))
+
+
+def test_ws_serializer_arrow(ohlcv_history):
+    serializer = ArrowWebSocketSerializer(None)
+    df = ohlcv_history.copy()
+    df["enter_tag"] = None
+    df.loc[df.index[-1], "enter_tag"] = "tag"
+    mixed = df.copy()
+    mixed["mixed"] = [1, "a", 2]
+    message = {"type": "analyzed_df", "data": {"key": ["XRP/BTC", "5m"], "df": df, "df2": mixed}}
+
+    data = serializer._serialize(message)
+    assert isinstance(data, bytes)
+    assert data.startswith(ARROW_MESSAGE_MAGIC)
+    result = serializer._deserialize(data)
+    assert result["data"]["key"] == ["XRP/BTC", "5m"]
+    assert_frame_equal(result["data"]["df"], df)
+    # Columns with mixed types fall back to JSON
+    assert result["data"]["df2"]["mixed"].tolist() == [1, "a", 2]
+
+    assert serializer._serialize({"type": "whitelist", "data": ["XRP/BTC"]}) == (
+        '{"type":"whitelist","data":["XRP/BTC"]}'
+    )
+    assert serializer._deserialize('{"type":"whitelist","data":["XRP/BTC"]}') == {
+        "type": "whitelist",
+        "data": ["XRP/BTC"],
+    }
+    with pytest.raises(ValueError, match="Unknown binary message format"):
+        serializer._deserialize(b"unknown")
+
 
 def test_api_ws_send_msg(default_conf, mocker, caplog):
     try:
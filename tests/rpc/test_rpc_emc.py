@@ -11,8 +11,14 @@ import pytest
 import websockets
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.enums import CandleType
+from freqtrade.rpc.api_server.ws.serializer import (
+    ArrowWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+)
 from freqtrade.rpc.external_message_consumer import ExternalMessageConsumer
-from tests.conftest import log_has, log_has_re, log_has_when
+from freqtrade.util import dt_ts
+from tests.conftest import generate_test_data, log_has, log_has_re, log_has_when
 
 
 _TEST_WS_TOKEN = "secret_Ws_t0ken"
@@ -74,6 +80,37 @@ def test_emc_init(patched_emc):
     assert patched_emc.initial_candle_limit <= 1500
     assert patched_emc.wait_timeout > 0
     assert patched_emc.sleep_time > 0
+    assert patched_emc.serializer_cls is ArrowWebSocketSerializer
+
+
+def test_emc_init_json_encoding(default_conf):
+    default_conf["external_message_consumer"] = {
+        "enabled": True,
+        "producers": [],
+        "message_encoding": "json",
+    }
+    emc = ExternalMessageConsumer(default_conf, DataProvider(default_conf, None, None, None))
+    try:
+        assert emc.serializer_cls is HybridJSONWebSocketSerializer
+    finally:
+        emc.shutdown()
+
+
+def test_emc_analyzed_df_request(patched_emc):
+    request = patched_emc._analyzed_df_request("default")
+    assert request.data == {"limit": 1500, "pair": None}
+
+    df = generate_test_data("5m", 10, "2024-01-01")
+    patched_emc._dp._replace_external_df(
+        "ETH/USDT", df, datetime.now(timezone.utc), "5m", CandleType.SPOT, "default"
+    )
+    request = patched_emc._analyzed_df_request("default")
+    assert request.data == {
+        "limit": 1500,
+        "pair": None,
+        "since": {"ETH/USDT": dt_ts(df.iloc[-1]["date"])},
+    }
+    assert patched_emc._analyzed_df_request("other").data == {"limit": 1500, "pair": None}
 
 
 # Parametrize this?
@@ -191,7 +228,10 @@ async def test_emc_create_connection_success(default_conf, caplog, mocker):
 
     emc._running = True
 
+    request_paths = []
+
     async def eat(websocket):
+        request_paths.append(websocket.request.path)
         emc._running = False
 
     try:
@@ -199,6 +239,7 @@ async def test_emc_create_connection_success(default_conf, caplog, mocker):
             await emc._create_connection(test_producer, lock)
 
         assert log_has_re(r"Connected to channel.+", caplog)
+        assert request_paths == [f"/api/v1/message/ws?token={_TEST_WS_TOKEN}&encoding=arrow"]
     finally:
         emc.shutdown()
 
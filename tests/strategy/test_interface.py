@@ -1,12 +1,15 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
@@ -28,7 +31,13 @@ from freqtrade.strategy.parameters import (
     RealParameter,
 )
 from freqtrade.util import dt_now
-from tests.conftest import CURRENT_TEST_STRATEGY, TRADE_SIDES, log_has, log_has_re
+from tests.conftest import (
+    CURRENT_TEST_STRATEGY,
+    TRADE_SIDES,
+    generate_test_data,
+    log_has,
+    log_has_re,
+)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -825,6 +834,139 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+@pytest.mark.parametrize("workers", [1, 4])
+def test_analyze_concurrent(mocker, default_conf, ohlcv_history, workers):
+    default_conf["analyze_workers"] = workers
+    pairs = [f"PAIR{idx}/BTC" for idx in range(8)]
+    strategy = StrategyTestV3(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    mocker.patch.object(strategy.dp, "ohlcv", side_effect=lambda *a, **k: ohlcv_history.copy())
+
+    def analyze_ticker(dataframe, metadata):
+        idx = pairs.index(metadata["pair"])
+        # Later pairs finish first
+        time.sleep((len(pairs) - idx) / 500)
+        dataframe["pair_idx"] = idx
+        return dataframe
+
+    mocker.patch.object(strategy, "analyze_ticker", side_effect=analyze_ticker)
+    set_cached_mock = mocker.spy(strategy.dp, "_set_cached_df")
+    emit_mock = mocker.spy(strategy.dp, "_emit_df")
+
+    strategy.analyze(pairs)
+    # Published in pairlist order
+    assert [c[0][0] for c in set_cached_mock.call_args_list] == pairs
+    assert [c[0][0][0] for c in emit_mock.call_args_list] == pairs
+    for idx, pair in enumerate(pairs):
+        df, _ = strategy.dp.get_analyzed_dataframe(pair, strategy.timeframe)
+        assert (df["pair_idx"] == idx).all()
+
+    assert set(strategy._analysis_durations) == set(pairs)
+    slowest = strategy.get_slowest_analyzed_pairs(2)
+    assert len(slowest) == 2
+    assert slowest[0][1] >= slowest[1][1]
+
+    # Nothing is published again if candles didn't change
+    set_cached_mock.reset_mock()
+    strategy.analyze(pairs[:3])
+    assert set_cached_mock.call_count == 0
+    assert set(strategy._analysis_durations) == set(pairs[:3])
+
+
+def test_analyze_concurrent_publish_after_all_pairs(mocker, default_conf, ohlcv_history):
+    default_conf["analyze_workers"] = 2
+    pairs = ["ETH/BTC", "XRP/BTC"]
+    strategy = StrategyTestV3(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    mocker.patch.object(strategy.dp, "ohlcv", side_effect=lambda *a, **k: ohlcv_history.copy())
+    set_cached_mock = mocker.spy(strategy.dp, "_set_cached_df")
+    first_done = threading.Event()
+    published_while_analyzing = []
+
+    def analyze_ticker(dataframe, metadata):
+        if metadata["pair"] == pairs[0]:
+            first_done.set()
+        else:
+            # The last pair finishes well after the first one
+            first_done.wait(5)
+            time.sleep(0.1)
+            published_while_analyzing.append(set_cached_mock.call_count)
+        return dataframe
+
+    mocker.patch.object(strategy, "analyze_ticker", side_effect=analyze_ticker)
+
+    strategy.analyze(pairs)
+    assert published_while_analyzing == [0]
+    assert [c[0][0] for c in set_cached_mock.call_args_list] == pairs
+
+
+class IncrementalStrategy(StrategyTestV3):
+    startup_candle_count = 20
+
+    def populate_indicators(self, dataframe, metadata):
+        dataframe["sma"] = dataframe["close"].rolling(10).mean()
+        dataframe["max"] = dataframe["high"].rolling(20).max()
+        return dataframe
+
+    def populate_entry_trend(self, dataframe, metadata):
+        dataframe.loc[
+            (dataframe["close"] > dataframe["sma"])
+            & (dataframe["close"].shift(1) <= dataframe["sma"].shift(1)),
+            ["enter_long", "enter_tag"],
+        ] = (1, "cross")
+        return dataframe
+
+    def populate_exit_trend(self, dataframe, metadata):
+        dataframe.loc[dataframe["high"] >= dataframe["max"], "exit_long"] = 1
+        return dataframe
+
+
+def test_analyze_ticker_incremental(mocker, default_conf):
+    data = generate_test_data("5m", 400)
+    metadata = {"pair": "ETH/BTC"}
+    strategy = IncrementalStrategy(default_conf)
+    strategy.incremental_analysis = True
+    full_strategy = IncrementalStrategy(default_conf)
+    ind_spy = mocker.spy(strategy, "populate_indicators")
+
+    def analyze(end: int, candles: int = 200) -> DataFrame:
+        # Exchange data is a sliding window of the latest candles
+        dataframe = data.iloc[end - candles : end].reset_index(drop=True)
+        result = strategy.analyze_ticker(dataframe.copy(), metadata)
+        full = full_strategy.analyze_ticker(dataframe.copy(), metadata)
+        # The startup period of the full analysis is less accurate.
+        assert_frame_equal(result.iloc[20:], full.iloc[20:], check_exact=False)
+        assert len(result) == len(dataframe)
+        return result
+
+    analyze(250)
+    assert len(ind_spy.call_args[0][0]) == 200
+    # One or more new candles - only new candles (and the startup candles) are analyzed
+    for end, new_candles in ((251, 1), (252, 1), (255, 3), (256, 1)):
+        result = analyze(end)
+        assert len(ind_spy.call_args[0][0]) == 20 + new_candles
+    assert result["enter_long"].sum() > 0
+    assert result["exit_long"].sum() > 0
+    assert ind_spy.call_count == 5
+
+    # Changed candle - full analysis
+    data.loc[250, "close"] += 1
+    analyze(257)
+    assert len(ind_spy.call_args[0][0]) == 200
+    analyze(258)
+    assert len(ind_spy.call_args[0][0]) == 21
+
+    # Larger dataframe (e.g. after a restart) - full analysis
+    analyze(300, 300)
+    assert len(ind_spy.call_args[0][0]) == 300
+
+    # Same candles again, or a gap larger than the dataframe - full analysis
+    ind_spy.reset_mock()
+    analyze(300, 300)
+    analyze(400, 100)
+    assert [len(c[0][0]) for c in ind_spy.call_args_list] == [300, 100]
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf["timeframe"]